@@ -1,11 +1,19 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
+
+# Pack the static art before bundling it, so the build never ships a stale asset pack
+sys.path.insert(0, SPECPATH)
+from src.assets.asset_pack_builder import build_asset_pack
+asset_pack_path = os.path.join(SPECPATH, 'external_assets', 'asset_pack.bin')
+build_asset_pack(asset_pack_path)
 
 
 a = Analysis(
     ['src\\main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[(asset_pack_path, 'external_assets')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
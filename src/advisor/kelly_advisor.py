@@ -0,0 +1,148 @@
+import functools
+import math
+from typing import Optional
+
+from src.advisor.outcome_distributions import OutcomeDistribution
+from src.advisor.outcome_distributions import get_blackjack_distribution
+from src.advisor.outcome_distributions import get_roulette_distribution
+from src.advisor.outcome_distributions import get_slots_distribution
+from src.programs.minigames.blackjack_rules import BlackjackRules
+from src.programs.minigames.roulette import COLOR_PAYOUT_MULTIPLIERS
+from src.programs.minigames.roulette import WHEEL
+from src.programs.minigames.slot_machine import DEFAULT_SLOT_MACHINE
+from src.programs.minigames.slot_machine import SlotMachine
+
+GAMES = ('blackjack', 'slots', 'roulette')
+# Bisection stops once the fraction is known to within this much
+_FRACTION_TOLERANCE = 1e-9
+
+
+def _get_expected_net(distribution: OutcomeDistribution) -> float:
+    return sum(net * probability for net, probability in distribution)
+
+
+def _get_growth_rate(distribution: OutcomeDistribution, fraction: float) -> float:
+    """Returns the expected logarithmic growth of the bankroll per round when betting fraction of it."""
+    if any(1 + fraction * net <= 0 for net, probability in distribution):
+        return -math.inf
+    return sum(probability * math.log(1 + fraction * net) for net, probability in distribution)
+
+
+def get_kelly_fraction(distribution: OutcomeDistribution) -> float:
+    """
+    Returns the fraction of the bankroll that maximizes the expected logarithm of the bankroll after a bet with the
+    given outcome distribution. This is 0 for bets that lose coins on average, and at most 1 since no more than the
+    whole bankroll can be bet.
+    """
+    if _get_expected_net(distribution) <= 0:
+        return 0.0
+    worst_net = min(net for net, probability in distribution)
+    if worst_net >= 0:
+        return 1.0
+
+    # The derivative of the growth rate falls from the expected net at 0 towards -inf as the bankroll can be lost, so
+    # the growth rate is maximized where the derivative crosses 0
+    low = 0.0
+    high = min(1.0, -1 / worst_net)
+    while high - low > _FRACTION_TOLERANCE:
+        middle = (low + high) / 2
+        if sum(probability * net / (1 + middle * net) for net, probability in distribution) > 0:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+@functools.cache
+def _get_best_option(game: str, slot_machine: SlotMachine = DEFAULT_SLOT_MACHINE,
+                     rules: BlackjackRules = BlackjackRules()) -> tuple[str, float]:
+    """
+    Returns the bet option of game with the highest growth rate and the Kelly fraction to bet on it. slot_machine is
+    the machine slots is played on, and rules are the house rules blackjack is played by.
+    """
+    match game:
+        case 'slots':
+            options = {'spin': get_slots_distribution(slot_machine)}
+        case 'blackjack':
+            options = {'hand': get_blackjack_distribution(rules)}
+        case 'roulette':
+            options = {option: get_roulette_distribution(option) for option in COLOR_PAYOUT_MULTIPLIERS}
+            options.update({str(count): get_roulette_distribution(str(count)) for count in range(1, len(WHEEL) + 1)})
+            # The minigame pays more than the odds on green and on bets over several numbers, so those bets win on
+            # average, and a bet on every number cannot lose at all. Advice never points players at those payouts
+            options = {option: distribution for option, distribution in options.items()
+                       if round(_get_expected_net(distribution), 9) <= 0}
+        case _:
+            raise ValueError(f"Unknown minigame '{game}'.")
+
+    best_option, best_fraction, best_growth_rate = None, 0.0, 0.0
+    for option, distribution in options.items():
+        fraction = get_kelly_fraction(distribution)
+        growth_rate = _get_growth_rate(distribution, fraction)
+        if best_option is None or growth_rate > best_growth_rate:
+            best_option, best_fraction, best_growth_rate = option, fraction, growth_rate
+    return best_option, best_fraction
+
+
+class KellyAdvisor:
+    """
+    Suggests growth-optimal bets for the minigames using the Kelly criterion.
+
+    The Kelly criterion bets the fraction of the bankroll that maximizes the expected logarithm of the bankroll, which
+    grows the bankroll fastest in the long run and never risks ruin. The outcome distribution of every minigame is
+    computed exactly from the minigame's own payout rules, and the best option and fraction for each minigame are found
+    once per process, so every suggestion afterwards is a single multiplication. Roulette bets that win on average are
+    never advised, as they only do so because of the minigame's generous payouts.
+    """
+
+    def __init__(self, slot_machine: SlotMachine = DEFAULT_SLOT_MACHINE, rules: Optional[BlackjackRules] = None):
+        """
+        Constructs a KellyAdvisor.
+        :param slot_machine: The machine slots is played on.
+        :param rules: The house rules blackjack is played by, BlackjackRules() if None.
+        """
+        rules = rules if rules is not None else BlackjackRules()
+        # Find every game's best option up front so the first suggestion is as fast as the rest. Each game is cached
+        # by the settings it is played with alone, so advisors that differ only in another game share its entry
+        self.__best_options: dict[str, tuple[str, float]] = {
+            game: _get_best_option(game, slot_machine if game == 'slots' else DEFAULT_SLOT_MACHINE,
+                                   rules if game == 'blackjack' else BlackjackRules())
+            for game in GAMES}
+
+    def get_fraction(self, game: str) -> float:
+        """
+        Returns the Kelly fraction of the bankroll to bet on game, 0 if every bet on game loses coins on average.
+        :exception KeyError: If game is not a minigame.
+        """
+        return self.__best_options[game][1]
+
+    def get_option(self, game: str) -> str:
+        """
+        Returns the bet the Kelly fraction applies to. For roulette this is a color or the number of numbers to bet on
+        as a string; blackjack and slots have a single option, 'hand' and 'spin'.
+        :exception KeyError: If game is not a minigame.
+        """
+        return self.__best_options[game][0]
+
+    def suggest_bet(self, game: str, bankroll: int) -> int:
+        """
+        Returns the number of coins the Kelly criterion suggests betting on game with the given bankroll.
+        :exception KeyError: If game is not a minigame.
+        """
+        return math.floor(bankroll * self.get_fraction(game))
+
+    def get_advice(self, game: str, bankroll: int) -> str:
+        """
+        Returns a sentence advising the player how much to bet on game, suitable for printing at a bet prompt.
+        :exception KeyError: If game is not a minigame.
+        """
+        bet = self.suggest_bet(game, bankroll)
+        if bet <= 0:
+            return "Kelly advice: the odds are against you here; the growth-optimal bet is nothing."
+
+        option = self.get_option(game)
+        if game == 'roulette' and option in COLOR_PAYOUT_MULTIPLIERS:
+            return f"Kelly advice: bet {bet:,} coins on {option}."
+        elif game == 'roulette':
+            return f"Kelly advice: bet {bet:,} coins spread over {option} numbers."
+        return f"Kelly advice: bet {bet:,} coins."
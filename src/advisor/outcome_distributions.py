@@ -0,0 +1,169 @@
+import functools
+from collections import defaultdict
+
+from src.programs.minigames.blackjack import card_value_map
+from src.programs.minigames.blackjack_rules import BlackjackRules
+from src.programs.minigames.blackjack_rules import DEALER_STAND_SCORE
+from src.programs.minigames.blackjack_rules import WIN_PAYOUT_MULTIPLIER
+from src.programs.minigames.roulette import COLOR_PAYOUT_MULTIPLIERS
+from src.programs.minigames.roulette import NUMBER_PAYOUT_NUMERATOR
+from src.programs.minigames.roulette import RouletteMinigame
+from src.programs.minigames.roulette import WHEEL
+from src.programs.minigames.slot_machine import DEFAULT_SLOT_MACHINE
+from src.programs.minigames.slot_machine import SlotMachine
+
+# An outcome distribution is a tuple of (net, probability) pairs, where net is the number of coins won per coin bet,
+# negative if coins were lost. Nets are computed before the minigames round payouts to whole coins.
+OutcomeDistribution = tuple[tuple[float, float], ...]
+
+
+def _to_distribution(probabilities: dict[float, float]) -> OutcomeDistribution:
+    """Converts a mapping of net to probability into an OutcomeDistribution, dropping impossible outcomes."""
+    return tuple(sorted((net, probability) for net, probability in probabilities.items() if probability > 0))
+
+
+def get_slots_distribution(machine: SlotMachine = DEFAULT_SLOT_MACHINE) -> OutcomeDistribution:
+    """
+    Returns the outcome distribution of a spin of machine, found by enumerating every combination of symbols when the
+    machine was compiled. The progressive jackpot is not included, since its size changes from spin to spin.
+    """
+    return machine.get_outcome_distribution()
+
+
+@functools.cache
+def get_roulette_distribution(option: str) -> OutcomeDistribution:
+    """
+    Returns the outcome distribution of a roulette bet.
+    :param option: 'red', 'black', 'green', or the number of numbers bet on as a string (i.e. '1' or '18').
+    :exception ValueError: If option is not a valid roulette bet.
+    """
+    if option in COLOR_PAYOUT_MULTIPLIERS:
+        win_probability = sum(1 for pocket in WHEEL if RouletteMinigame.get_result_color(pocket) == option) / len(WHEEL)
+        win_net = COLOR_PAYOUT_MULTIPLIERS[option]
+    elif option.isdigit() and 1 <= int(option) <= len(WHEEL):
+        win_probability = int(option) / len(WHEEL)
+        win_net = NUMBER_PAYOUT_NUMERATOR / int(option)
+    else:
+        raise ValueError(f"Unknown roulette bet '{option}'.")
+    return _to_distribution({win_net: win_probability, -1: 1 - win_probability})
+
+
+def _get_score(hard_total: int, has_ace: bool) -> int:
+    """Returns the blackjack score of a hand, counting one ace as 11 if that does not go over 21."""
+    if has_ace and hard_total + 10 <= 21:
+        return hard_total + 10
+    return hard_total
+
+
+def _get_card_probabilities() -> dict[int, float]:
+    """Returns the probability of drawing each card value. Cards are drawn uniformly from card_value_map."""
+    probabilities: dict[int, float] = defaultdict(float)
+    for value in card_value_map.values():
+        probabilities[value] += 1 / len(card_value_map)
+    return probabilities
+
+
+@functools.cache
+def _get_dealer_final_scores(hard_total: int, has_ace: bool, hits_soft_17: bool) -> dict[int, float]:
+    """Returns the probability of each score the dealer stands on from the given hand. Scores over 21 are busts."""
+    score = _get_score(hard_total, has_ace)
+    soft_17 = score == DEALER_STAND_SCORE and score != hard_total
+    if score >= DEALER_STAND_SCORE and not (soft_17 and hits_soft_17):
+        return {score: 1.0}
+    final_scores: dict[int, float] = defaultdict(float)
+    for value, probability in _get_card_probabilities().items():
+        for final_score, final_probability in _get_dealer_final_scores(hard_total + value, has_ace or value == 1,
+                                                                       hits_soft_17).items():
+            final_scores[final_score] += probability * final_probability
+    return final_scores
+
+
+@functools.cache
+def _get_dealer_final_scores_without_blackjack(upcard: int, hits_soft_17: bool) -> dict[int, float]:
+    """
+    Returns the probability of each score the dealer stands on given their upcard, conditioned on the dealer not having
+    a blackjack. Blackjacks are settled before the player decides, so a player who is deciding knows there is none.
+    """
+    final_scores: dict[int, float] = defaultdict(float)
+    total_probability = 0.0
+    for hole_card, probability in _get_card_probabilities().items():
+        has_ace = upcard == 1 or hole_card == 1
+        if _get_score(upcard + hole_card, has_ace) == 21:
+            continue
+        total_probability += probability
+        for final_score, final_probability in _get_dealer_final_scores(upcard + hole_card, has_ace,
+                                                                       hits_soft_17).items():
+            final_scores[final_score] += probability * final_probability
+    return {final_score: probability / total_probability for final_score, probability in final_scores.items()}
+
+
+@functools.cache
+def _play_hand(hard_total: int, has_ace: bool, upcard: int,
+               rules: BlackjackRules) -> tuple[float, dict[float, float]]:
+    """
+    Plays a hand against the dealer's upcard, hitting whenever hitting has the higher expected value.
+
+    Returns:
+        tuple[float, dict[float, float]]: The expected net per coin bet and the probability of each net.
+    """
+    score = _get_score(hard_total, has_ace)
+    if score > 21:
+        return -1.0, {-1: 1.0}
+
+    # The outcome of standing on score
+    stand_outcomes: dict[float, float] = defaultdict(float)
+    for dealer_score, probability in _get_dealer_final_scores_without_blackjack(upcard,
+                                                                                rules.dealer_hits_soft_17).items():
+        if dealer_score > 21 or score > dealer_score:
+            stand_outcomes[WIN_PAYOUT_MULTIPLIER - 1] += probability
+        elif score < dealer_score:
+            stand_outcomes[-1] += probability
+        else:
+            stand_outcomes[0 if rules.push_returns_bet else -1] += probability
+    stand_expected_net = sum(net * probability for net, probability in stand_outcomes.items())
+    # The minigame stands automatically on 21
+    if score == 21:
+        return stand_expected_net, stand_outcomes
+
+    # The outcome of hitting once and playing on
+    hit_outcomes: dict[float, float] = defaultdict(float)
+    hit_expected_net = 0.0
+    for value, probability in _get_card_probabilities().items():
+        expected_net, outcomes = _play_hand(hard_total + value, has_ace or value == 1, upcard, rules)
+        hit_expected_net += probability * expected_net
+        for net, outcome_probability in outcomes.items():
+            hit_outcomes[net] += probability * outcome_probability
+
+    if hit_expected_net > stand_expected_net:
+        return hit_expected_net, hit_outcomes
+    return stand_expected_net, stand_outcomes
+
+
+@functools.cache
+def get_blackjack_distribution(rules: BlackjackRules = BlackjackRules()) -> OutcomeDistribution:
+    """
+    Returns the outcome distribution of a hand of blackjack played by rules, computed exactly over every deal. Cards
+    are drawn with replacement whatever the number of decks in rules, and the player is assumed to hit or stand to
+    maximize their expected coins.
+    """
+    card_probabilities = _get_card_probabilities()
+    probabilities: dict[float, float] = defaultdict(float)
+    for upcard, upcard_probability in card_probabilities.items():
+        for hole_card, hole_card_probability in card_probabilities.items():
+            dealer_probability = upcard_probability * hole_card_probability
+            dealer_blackjack = _get_score(upcard + hole_card, upcard == 1 or hole_card == 1) == 21
+            for card1, card1_probability in card_probabilities.items():
+                for card2, card2_probability in card_probabilities.items():
+                    probability = dealer_probability * card1_probability * card2_probability
+                    player_blackjack = _get_score(card1 + card2, card1 == 1 or card2 == 1) == 21
+                    if player_blackjack and dealer_blackjack:
+                        probabilities[0 if rules.blackjack_push_returns_bet else -1] += probability
+                    elif player_blackjack:
+                        probabilities[rules.blackjack_payout - 1] += probability
+                    elif dealer_blackjack:
+                        probabilities[-1] += probability
+                    else:
+                        for net, outcome_probability in _play_hand(card1 + card2, card1 == 1 or card2 == 1, upcard,
+                                                                   rules)[1].items():
+                            probabilities[net] += probability * outcome_probability
+    return _to_distribution(probabilities)
@@ -0,0 +1,223 @@
+import argparse
+import json
+import random
+from typing import Any
+from typing import Optional
+
+from src.programs.minigames.slot_machine import DEFAULT_MACHINE_DEFINITION
+from src.programs.minigames.slot_machine import SlotMachine
+from src.programs.minigames.slot_machine import get_line_probabilities
+from src.programs.minigames.slot_machine import get_line_table
+
+
+class SlotMachineTuning:
+    """
+    The machine found by a SlotMachineOptimizer.
+
+    Attributes:
+        machine (SlotMachine): The tuned machine.
+        return_to_player (float): The exact expected coins paid back per coin bet by machine.
+        hit_frequency (float): The exact probability that a spin of machine pays back more than the bet.
+        candidates (int): The number of candidate machines evaluated to find machine.
+    """
+
+    def __init__(self, machine: SlotMachine, return_to_player: float, hit_frequency: float, candidates: int):
+        self.machine: SlotMachine = machine
+        self.return_to_player: float = return_to_player
+        self.hit_frequency: float = hit_frequency
+        self.candidates: int = candidates
+
+
+class SlotMachineOptimizer:
+    """
+    Tunes the symbol weights and paytable multipliers of a slot machine definition towards a target return to player
+    and hit frequency.
+
+    The optimizer is a hill climb. Each candidate moves one stop of one reel from one symbol to another, or moves one
+    multiplier up or down a step, and is kept if it is no further from the targets than the best machine so far. Every
+    candidate is scored exactly by enumerating every combination of symbols, never by simulating spins, so a machine
+    is tuned in seconds and tuning it again with the same seed gives the same machine.
+
+    Reels keep their number of stops, every symbol keeps at least one stop on every reel, and a category whose triple
+    pays more than its pair (or less) keeps doing so.
+    """
+
+    def __init__(self, definition: dict[str, Any], target_return_to_player: float, target_hit_frequency: float,
+                 seed: int = 0, iterations: int = 20_000, tune_weights: bool = True, tune_multipliers: bool = True,
+                 multiplier_step: float = 0.25, max_multiplier: float = 100.0, tolerance: float = 1e-4):
+        """
+        Constructs a SlotMachineOptimizer.
+
+        Args:
+            definition (dict[str, Any]): The definition of the machine to start from, as taken by SlotMachine.
+            target_return_to_player (float): The expected coins paid back per coin bet to aim for, i.e. 0.95.
+            target_hit_frequency (float): The probability of a spin paying back more than the bet to aim for.
+            seed (int): The seed of the random generator proposing candidates.
+            iterations (int): The most candidates to evaluate.
+            tune_weights (bool): True to move stops between symbols.
+            tune_multipliers (bool): True to change paytable multipliers.
+            multiplier_step (float): The amount a multiplier is moved by, and the grid tuned multipliers lie on.
+            max_multiplier (float): The largest multiplier the optimizer may set.
+            tolerance (float): The search stops once the return to player and hit frequency are both within this of
+                their targets.
+
+        Raises:
+            ValueError: If definition is not a valid slot machine definition, a target is not positive, or nothing is
+                to be tuned.
+        """
+        SlotMachine(definition)
+        if target_return_to_player <= 0 or target_hit_frequency <= 0:
+            raise ValueError("The targets must be positive.")
+        if not tune_weights and not tune_multipliers:
+            raise ValueError("At least one of the weights and the multipliers must be tuned.")
+        self.__definition = json.loads(json.dumps(definition))
+        self.__target_return_to_player = target_return_to_player
+        self.__target_hit_frequency = target_hit_frequency
+        self.__random = random.Random(seed)
+        self.__iterations = iterations
+        self.__tune_weights = tune_weights
+        self.__tune_multipliers = tune_multipliers
+        self.__multiplier_step = multiplier_step
+        self.__max_multiplier = max_multiplier
+        self.__tolerance = tolerance
+
+        # The paytable lines are numbered as SlotMachine numbers them
+        symbols = self.__definition['symbols']
+        self.__categories = list(dict.fromkeys(symbol['category'] for symbol in symbols))
+        self.__lines = get_line_table([self.__categories.index(symbol['category']) for symbol in symbols])
+
+    def optimize(self) -> SlotMachineTuning:
+        """Searches for the machine closest to the targets and returns it."""
+        weights = [list(symbol['weights']) for symbol in self.__definition['symbols']]
+        multipliers = self.__get_multipliers()
+        # The sign of triple - pair of every category, which tuning must neither flip nor turn into a tie
+        orders = [(multipliers[2 + 2 * category] > multipliers[1 + 2 * category])
+                  - (multipliers[2 + 2 * category] < multipliers[1 + 2 * category])
+                  for category in range(len(self.__categories))]
+
+        probabilities = get_line_probabilities(self.__lines, weights, len(multipliers))
+        error = self.__get_error(probabilities, multipliers)
+        candidates = 1
+        for _ in range(self.__iterations):
+            if error <= 0:
+                break
+            if self.__tune_weights and (not self.__tune_multipliers or self.__random.random() < 0.5):
+                candidate_weights = self.__move_stop(weights)
+                if candidate_weights is None:
+                    continue
+                candidate_probabilities = get_line_probabilities(self.__lines, candidate_weights, len(multipliers))
+                candidate_multipliers = multipliers
+            else:
+                candidate_multipliers = self.__move_multiplier(multipliers, orders)
+                if candidate_multipliers is None:
+                    continue
+                candidate_weights, candidate_probabilities = weights, probabilities
+            candidates += 1
+            candidate_error = self.__get_error(candidate_probabilities, candidate_multipliers)
+            if candidate_error <= error:
+                weights, multipliers, probabilities, error = (candidate_weights, candidate_multipliers,
+                                                              candidate_probabilities, candidate_error)
+
+        machine = SlotMachine(self.__to_definition(weights, multipliers))
+        return SlotMachineTuning(machine, machine.get_return_to_player(), machine.get_hit_frequency(), candidates)
+
+    def __get_multipliers(self) -> list[float]:
+        """Returns the multiplier of every paytable line of the definition."""
+        paytable = self.__definition['paytable']
+        multipliers = [float(self.__definition['no_match'][0])]
+        for category in self.__categories:
+            multipliers += [float(paytable[category]['pair'][0]), float(paytable[category]['triple'][0])]
+        return multipliers
+
+    def __get_error(self, probabilities: tuple[float, ...], multipliers: list[float]) -> float:
+        """
+        Returns how far a machine is from the targets, as the sum of the squared relative errors of its return to
+        player and hit frequency, or 0 if both are within tolerance.
+        """
+        return_to_player = sum(multiplier * probability for multiplier, probability in zip(multipliers, probabilities))
+        hit_frequency = sum(probability for multiplier, probability in zip(multipliers, probabilities)
+                            if multiplier > 1)
+        if (abs(return_to_player - self.__target_return_to_player) <= self.__tolerance
+                and abs(hit_frequency - self.__target_hit_frequency) <= self.__tolerance):
+            return 0.0
+        return (((return_to_player - self.__target_return_to_player) / self.__target_return_to_player) ** 2
+                + ((hit_frequency - self.__target_hit_frequency) / self.__target_hit_frequency) ** 2)
+
+    def __move_stop(self, weights: list[list[int]]) -> Optional[list[list[int]]]:
+        """Returns weights with one stop of a random reel given to another symbol, or None if no stop can move."""
+        reel = self.__random.randrange(len(weights[0]))
+        donor, receiver = self.__random.sample(range(len(weights)), 2) if len(weights) > 1 else (0, 0)
+        if donor == receiver or weights[donor][reel] <= 1:
+            return None
+        candidate = [list(symbol_weights) for symbol_weights in weights]
+        candidate[donor][reel] -= 1
+        candidate[receiver][reel] += 1
+        return candidate
+
+    def __move_multiplier(self, multipliers: list[float], orders: list[int]) -> Optional[list[float]]:
+        """Returns multipliers with a random multiplier moved a step, or None if the move breaks a constraint."""
+        line = self.__random.randrange(len(multipliers))
+        step = self.__multiplier_step if self.__random.random() < 0.5 else -self.__multiplier_step
+        multiplier = round((multipliers[line] + step) / self.__multiplier_step) * self.__multiplier_step
+        if not 0 <= multiplier <= self.__max_multiplier:
+            return None
+        candidate = list(multipliers)
+        candidate[line] = multiplier
+        if line > 0:
+            category = (line - 1) // 2
+            pair, triple = candidate[1 + 2 * category], candidate[2 + 2 * category]
+            # A strict order must stay strict; a pair and triple that started out equal may move either way
+            if orders[category] != 0 and (triple > pair) - (triple < pair) != orders[category]:
+                return None
+        return candidate
+
+    def __to_definition(self, weights: list[list[int]], multipliers: list[float]) -> dict[str, Any]:
+        """Returns the definition of the machine with the given weights and multipliers."""
+        definition = json.loads(json.dumps(self.__definition))
+        for symbol, symbol_weights in zip(definition['symbols'], weights):
+            symbol['weights'] = symbol_weights
+        definition['no_match'][0] = multipliers[0]
+        for category_index, category in enumerate(self.__categories):
+            definition['paytable'][category]['pair'][0] = multipliers[1 + 2 * category_index]
+            definition['paytable'][category]['triple'][0] = multipliers[2 + 2 * category_index]
+        return definition
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Tune a slot machine towards a target return to player and hit "
+                                                 "frequency, scoring every candidate exactly.")
+    parser.add_argument('--machine', metavar='PATH', help="JSON definition to start from, the default machine if "
+                                                          "omitted")
+    parser.add_argument('--rtp', type=float, required=True, help="target return to player, i.e. 0.95")
+    parser.add_argument('--hit-frequency', type=float, required=True,
+                        help="target probability of a spin paying back more than the bet, i.e. 0.3")
+    parser.add_argument('--output', metavar='PATH', required=True, help="where to write the tuned JSON definition")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--iterations', type=int, default=20_000)
+    parser.add_argument('--fixed-weights', action='store_true', help="only tune multipliers")
+    parser.add_argument('--fixed-multipliers', action='store_true', help="only tune symbol weights")
+    parser.add_argument('--multiplier-step', type=float, default=0.25)
+    parser.add_argument('--max-multiplier', type=float, default=100.0)
+    parser.add_argument('--tolerance', type=float, default=1e-4)
+    arguments = parser.parse_args()
+
+    starting_machine = SlotMachine.load(arguments.machine) if arguments.machine is not None else \
+        SlotMachine(DEFAULT_MACHINE_DEFINITION)
+    tuning = SlotMachineOptimizer(starting_machine.get_definition(), arguments.rtp, arguments.hit_frequency,
+                                  arguments.seed, arguments.iterations, not arguments.fixed_weights,
+                                  not arguments.fixed_multipliers, arguments.multiplier_step,
+                                  arguments.max_multiplier, arguments.tolerance).optimize()
+    tuning.machine.save(arguments.output)
+
+    print(f'Evaluated {tuning.candidates:,} candidates.')
+    print(f'RTP:           {starting_machine.get_return_to_player():.4%} -> {tuning.return_to_player:.4%}')
+    print(f'Hit frequency: {starting_machine.get_hit_frequency():.4%} -> {tuning.hit_frequency:.4%}')
+    # Messages that do not format their multiplier still announce the old one
+    starting_definition, tuned_definition = starting_machine.get_definition(), tuning.machine.get_definition()
+    tuned_lines = [('no_match', starting_definition['no_match'], tuned_definition['no_match'])]
+    tuned_lines += [(f'{category} {count}', counts[count], tuned_definition['paytable'][category][count])
+                    for category, counts in starting_definition['paytable'].items() for count in ('pair', 'triple')]
+    for name, (old_multiplier, message), (new_multiplier, _) in tuned_lines:
+        if old_multiplier != new_multiplier and '{multiplier' not in message:
+            print(f'Warning: the message of {name} does not show its multiplier, which is now {new_multiplier:g}: '
+                  f'"{message}"')
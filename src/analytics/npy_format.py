@@ -0,0 +1,50 @@
+import ast
+import mmap
+import struct
+import sys
+from array import array
+
+# Version 1.0 of the .npy format: the magic string, a little-endian uint16 header length, and a header holding a dict
+# literal, padded with spaces and a newline so the data starts on a 64 byte boundary
+NPY_MAGIC = b'\x93NUMPY\x01\x00'
+_NPY_ALIGNMENT = 64
+# The .npy descr of every array typecode the analytics columns use
+NPY_DESCRS = {'b': '|i1', 'B': '|u1', 'h': '<i2', 'q': '<i8', 'Q': '<u8', 'd': '<f8'}
+
+
+def write_npy(path: str, column: array) -> None:
+    """
+    Writes column to path as an uncompressed one-dimensional .npy file, which numpy.load can memory-map. The data is
+    written little-endian whatever the byte order of this machine.
+    :exception KeyError: If the typecode of column is not in NPY_DESCRS.
+    """
+    header = f"{{'descr': '{NPY_DESCRS[column.typecode]}', 'fortran_order': False, 'shape': ({len(column)},), }}"
+    padding = -(len(NPY_MAGIC) + 2 + len(header) + 1) % _NPY_ALIGNMENT
+    if sys.byteorder == 'big':
+        column = array(column.typecode, column)
+        column.byteswap()
+    with open(path, 'wb') as npy_file:
+        npy_file.write(NPY_MAGIC)
+        npy_file.write(struct.pack('<H', len(header) + padding + 1))
+        npy_file.write(header.encode('latin1') + b' ' * padding + b'\n')
+        column.tofile(npy_file)
+
+
+def read_npy_header(data: bytes | mmap.mmap) -> tuple[str, int, int]:
+    """
+    Reads the header of a one-dimensional version 1.0 .npy file from the start of data.
+    :return: The descr and length of the array, and the offset its data starts at.
+    :exception ValueError: If data does not start with such a header.
+    """
+    if bytes(data[:len(NPY_MAGIC)]) != NPY_MAGIC:
+        raise ValueError("Not a version 1.0 .npy file.")
+    header_length = struct.unpack_from('<H', data, len(NPY_MAGIC))[0]
+    data_offset = len(NPY_MAGIC) + 2 + header_length
+    try:
+        header = ast.literal_eval(bytes(data[len(NPY_MAGIC) + 2:data_offset]).decode('latin1'))
+        descr, fortran_order, (length,) = header['descr'], header['fortran_order'], header['shape']
+    except (SyntaxError, ValueError, KeyError, TypeError) as error:
+        raise ValueError("Malformed .npy header.") from error
+    if fortran_order:
+        raise ValueError("Fortran ordered .npy files are not supported.")
+    return descr, length, data_offset
@@ -0,0 +1,91 @@
+import json
+import mmap
+import os
+import sys
+from typing import Iterator
+
+from src.analytics.npy_format import NPY_DESCRS
+from src.analytics.npy_format import read_npy_header
+from src.analytics.outcome_recorder import DATASET_FORMAT_VERSION
+from src.analytics.outcome_recorder import MANIFEST_NAME
+from src.analytics.outcome_recorder import SCHEMA
+
+
+class OutcomeDataset:
+    """
+    Reads a dataset written by an OutcomeRecorder through memory-mapped columns.
+
+    Every column of every chunk is mapped read-only and exposed as a memoryview of its values, so reading a column
+    costs no parsing and only touches the pages actually used. The chunks are ordinary .npy files, so with numpy the
+    same dataset can also be loaded with numpy.load(path, mmap_mode='r') on each file listed in the manifest.
+
+    The dataset is read as of the manifest at construction; chunks written afterwards are not seen.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Opens the dataset in directory.
+        :exception OSError: If the manifest cannot be read.
+        :exception ValueError: If the manifest is not of this DATASET_FORMAT_VERSION.
+        """
+        with open(os.path.join(directory, MANIFEST_NAME), encoding='utf-8') as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest.get('format_version') != DATASET_FORMAT_VERSION:
+            raise ValueError(f"{directory} holds a dataset of another format version.")
+        self.__directory = directory
+        self.__chunks: list[dict] = manifest['chunks']
+        self.__games: tuple[str, ...] = tuple(manifest['games'])
+        self.__wheel: tuple[str, ...] = tuple(manifest['wheel'])
+        self.__typecodes: dict[str, str] = dict(SCHEMA)
+        self.__maps: list[mmap.mmap] = []
+
+    def get_row_count(self) -> int:
+        """Returns the number of rounds in the dataset."""
+        return sum(chunk['rows'] for chunk in self.__chunks)
+
+    def get_chunk_count(self) -> int:
+        """Returns the number of chunks in the dataset."""
+        return len(self.__chunks)
+
+    def get_games(self) -> tuple[str, ...]:
+        """Returns the name of every game, indexed by the values of the game column."""
+        return self.__games
+
+    def get_wheel(self) -> tuple[str, ...]:
+        """Returns the label of every roulette pocket, indexed by the values of the wheel_result column."""
+        return self.__wheel
+
+    def get_column(self, name: str, chunk: int) -> memoryview:
+        """
+        Returns the values of column name in chunk, memory-mapped from disk.
+        :exception KeyError: If name is not a column of SCHEMA.
+        :exception IndexError: If chunk is not a chunk of the dataset.
+        :exception ValueError: If the column's file does not hold the type SCHEMA gives it.
+        """
+        typecode = self.__typecodes[name]
+        path = os.path.join(self.__directory, self.__chunks[chunk]['directory'], f'{name}.npy')
+        with open(path, 'rb') as column_file:
+            column_map = mmap.mmap(column_file.fileno(), 0, access=mmap.ACCESS_READ)
+        descr, length, data_offset = read_npy_header(column_map)
+        if descr != NPY_DESCRS[typecode] or length != self.__chunks[chunk]['rows']:
+            column_map.close()
+            raise ValueError(f"{path} does not hold {self.__chunks[chunk]['rows']} values of type {typecode}.")
+        if sys.byteorder == 'big' and typecode not in ('b', 'B'):
+            # Multi-byte values are stored little-endian, which memoryview cannot read on this machine
+            column_map.close()
+            raise ValueError("Outcome datasets can only be memory-mapped on little-endian machines.")
+        self.__maps.append(column_map)
+        return memoryview(column_map)[data_offset:].cast(typecode)
+
+    def iter_column(self, name: str) -> Iterator[memoryview]:
+        """Yields the values of column name in every chunk, in order. See get_column."""
+        for chunk in range(len(self.__chunks)):
+            yield self.get_column(name, chunk)
+
+    def close(self) -> None:
+        """
+        Unmaps every column returned so far. Every memoryview returned must be released first.
+        :exception BufferError: If a memoryview of a column has not been released.
+        """
+        while self.__maps:
+            self.__maps.pop().close()
@@ -0,0 +1,181 @@
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from array import array
+from typing import Optional
+
+from src.analytics.npy_format import NPY_DESCRS
+from src.analytics.npy_format import write_npy
+from src.programs.minigames.roulette import WHEEL
+
+# The version of the layout of an outcome dataset directory. Version 2 widened the reel columns to 16 bits, as slot
+# machines can have more than 127 stops on a reel
+DATASET_FORMAT_VERSION = 2
+MANIFEST_NAME = 'manifest.json'
+# The game column holds the index of the game in GAMES
+GAMES = ('blackjack', 'roulette', 'slots')
+# The name and array typecode of every column, in order. Outcome fields that do not apply to a game are -1:
+# player_score and dealer_score are the final blackjack scores, wheel_result is the index in WHEEL of the pocket the
+# roulette wheel landed on, and reel1 to reel3 are the stops the slots reels landed on. bet is the coins bet, payout is
+# every coin paid back for the round including the returned bet and any jackpot, and timestamp is in seconds since the
+# epoch.
+SCHEMA = (('session_id', 'Q'), ('game', 'B'), ('bet', 'q'), ('payout', 'q'), ('player_score', 'b'),
+          ('dealer_score', 'b'), ('wheel_result', 'b'), ('reel1', 'h'), ('reel2', 'h'), ('reel3', 'h'),
+          ('timestamp', 'd'))
+
+
+def _new_columns() -> tuple[array, ...]:
+    return tuple(array(typecode) for _, typecode in SCHEMA)
+
+
+class OutcomeRecorder:
+    """
+    Records the outcome of every round of the minigames into a columnar dataset for offline analysis.
+
+    Rounds are appended to in-memory column buffers. Every chunk_rows rounds the buffers are handed to a background
+    writer thread and replaced with empty ones, so recording a round never waits on the disk. The writer stores each
+    chunk as one uncompressed .npy file per column in a directory of its own, and lists every finished chunk in a
+    manifest. The manifest is replaced atomically after each chunk is written, so readers only ever see whole chunks,
+    and a dataset can be read with memory-mapped arrays while it is still being written.
+
+    One OutcomeRecorder may be shared by every session of a process, but each dataset directory must have only one
+    OutcomeRecorder writing to it at a time.
+    """
+
+    def __init__(self, directory: str, chunk_rows: int = 1 << 20):
+        """
+        Constructs an OutcomeRecorder writing to directory, creating it if it does not exist. Chunks are added after
+        any already in the directory's manifest.
+        :param directory: The directory of the dataset.
+        :param chunk_rows: The number of rounds per chunk.
+        :exception ValueError: If chunk_rows is not positive or the directory holds a dataset of another version.
+        """
+        if chunk_rows <= 0:
+            raise ValueError("Chunks must hold at least one round.")
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.__chunk_rows = chunk_rows
+        self.__manifest = self.__read_manifest()
+        self.__columns = _new_columns()
+        self.__lock = threading.Lock()
+        self.__chunks: queue.SimpleQueue[Optional[tuple[array, ...]]] = queue.SimpleQueue()
+        self.__write_error: Optional[BaseException] = None
+        self.__writer = threading.Thread(target=self.__write_chunks, name='OutcomeRecorder writer', daemon=True)
+        self.__writer.start()
+
+    @staticmethod
+    def new_session_id() -> int:
+        """
+        Returns a random 63-bit session id. It is drawn from the operating system, never from a session's random
+        generator, so recording outcomes does not change what a session draws.
+        """
+        return int.from_bytes(os.urandom(8), 'little') >> 1
+
+    def record(self, session_id: int, game: str, bet: int, payout: int, player_score: int = -1,
+               dealer_score: int = -1, wheel_result: int = -1, reels: tuple[int, int, int] = (-1, -1, -1)) -> None:
+        """
+        Appends the outcome of a round to the column buffers. See SCHEMA for the meaning of each field.
+        :exception ValueError: If game is not one of GAMES.
+        :exception OverflowError: If a field does not fit its column, in which case nothing is appended.
+        """
+        values = (session_id, GAMES.index(game), bet, payout, player_score, dealer_score, wheel_result, *reels,
+                  time.time())
+        # Convert the whole row before appending any of it, so a value out of range leaves the buffers untouched
+        row = [array(typecode, (value,)) for (_, typecode), value in zip(SCHEMA, values)]
+        with self.__lock:
+            for column, field in zip(self.__columns, row):
+                column.extend(field)
+            if len(self.__columns[0]) >= self.__chunk_rows:
+                self.__chunks.put(self.__columns)
+                self.__columns = _new_columns()
+
+    def record_rounds(self, session_id: int, game: str, bet: int, payouts: list[int],
+                      player_scores: Optional[list[int]] = None, dealer_scores: Optional[list[int]] = None,
+                      wheel_results: Optional[list[int]] = None,
+                      reels: Optional[tuple[list[int], list[int], list[int]]] = None) -> None:
+        """
+        Appends the outcomes of several rounds of game, each betting bet coins, to the column buffers at once, i.e.
+        the rounds of an autoplay batch. payouts holds the payout of every round, and each outcome field given holds
+        one value per round; fields that are not given are -1. Every round is stamped with the current time.
+        :exception ValueError: If game is not one of GAMES.
+        :exception OverflowError: If a field does not fit its column, in which case nothing is appended.
+        """
+        rounds = len(payouts)
+        missing = [-1] * rounds
+        reels = reels if reels is not None else (missing, missing, missing)
+        values = (itertools.repeat(session_id, rounds), itertools.repeat(GAMES.index(game), rounds),
+                  itertools.repeat(bet, rounds), payouts,
+                  player_scores if player_scores is not None else missing,
+                  dealer_scores if dealer_scores is not None else missing,
+                  wheel_results if wheel_results is not None else missing, *reels,
+                  itertools.repeat(time.time(), rounds))
+        # Convert every column before appending any, so a value out of range leaves the buffers untouched
+        new_columns = [array(typecode, column_values) for (_, typecode), column_values in zip(SCHEMA, values)]
+        with self.__lock:
+            for column, new_column in zip(self.__columns, new_columns):
+                column.extend(new_column)
+            while len(self.__columns[0]) >= self.__chunk_rows:
+                self.__chunks.put(tuple(column[:self.__chunk_rows] for column in self.__columns))
+                self.__columns = tuple(column[self.__chunk_rows:] for column in self.__columns)
+
+    def flush(self) -> None:
+        """Hands any buffered rounds to the writer as a chunk, without waiting for it to be written."""
+        with self.__lock:
+            if len(self.__columns[0]) > 0:
+                self.__chunks.put(self.__columns)
+                self.__columns = _new_columns()
+
+    def close(self) -> None:
+        """
+        Flushes any buffered rounds and waits for every chunk to be written.
+        :exception Exception: The error the writer failed to write a chunk with, usually an OSError.
+        """
+        self.flush()
+        self.__chunks.put(None)
+        self.__writer.join()
+        if self.__write_error is not None:
+            raise self.__write_error
+
+    def __read_manifest(self) -> dict:
+        """Returns the manifest of the dataset, or the manifest of an empty dataset if there is none."""
+        try:
+            with open(os.path.join(self.__directory, MANIFEST_NAME), encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+        except FileNotFoundError:
+            return {'format_version': DATASET_FORMAT_VERSION,
+                    'schema': [{'name': name, 'descr': NPY_DESCRS[typecode]} for name, typecode in SCHEMA],
+                    'games': list(GAMES), 'wheel': list(WHEEL), 'chunks': []}
+        if manifest.get('format_version') != DATASET_FORMAT_VERSION:
+            raise ValueError(f"{self.__directory} holds a dataset of another format version.")
+        return manifest
+
+    def __write_chunks(self) -> None:
+        """Writes every chunk handed over by record and flush, until close hands over None."""
+        while (columns := self.__chunks.get()) is not None:
+            if self.__write_error is not None:
+                continue
+            try:
+                self.__write_chunk(columns)
+            except Exception as error:
+                # Gameplay carries on without the dataset; close reports the failure, whatever it was, rather than
+                # letting it end this thread unnoticed
+                self.__write_error = error
+
+    def __write_chunk(self, columns: tuple[array, ...]) -> None:
+        """Writes columns as the next chunk of the dataset and adds it to the manifest."""
+        chunk_name = f'chunk-{len(self.__manifest["chunks"]):06d}'
+        chunk_path = os.path.join(self.__directory, chunk_name)
+        os.makedirs(chunk_path, exist_ok=True)
+        for (name, _), column in zip(SCHEMA, columns):
+            write_npy(os.path.join(chunk_path, f'{name}.npy'), column)
+
+        timestamps = columns[-1]
+        self.__manifest['chunks'].append({'directory': chunk_name, 'rows': len(timestamps),
+                                          'first_timestamp': timestamps[0], 'last_timestamp': timestamps[-1]})
+        manifest_path = os.path.join(self.__directory, MANIFEST_NAME)
+        with open(manifest_path + '.tmp', 'w', encoding='utf-8') as manifest_file:
+            json.dump(self.__manifest, manifest_file, indent=1)
+        os.replace(manifest_path + '.tmp', manifest_path)
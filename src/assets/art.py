@@ -0,0 +1,70 @@
+# The source text of every piece of static art. Nothing reads these at runtime: asset_pack_builder.py splits and pads
+# them into the asset pack, which the game maps instead. The pack records the digest of this file, so the game rebuilds
+# it after anything here changes.
+
+# Logo generated with https://patorjk.com
+GAMBLING_SIMULATOR_LOGO = r'''
+    $$$$$$\                          $$\       $$\ $$\                           
+   $$  __$$\                         $$ |      $$ |\__|                          
+   $$ /  \__| $$$$$$\  $$$$$$\$$$$\  $$$$$$$\  $$ |$$\ $$$$$$$\   $$$$$$\        
+   $$ |$$$$\  \____$$\ $$  _$$  _$$\ $$  __$$\ $$ |$$ |$$  __$$\ $$  __$$\       
+   $$ |\_$$ | $$$$$$$ |$$ / $$ / $$ |$$ |  $$ |$$ |$$ |$$ |  $$ |$$ /  $$ |      
+   $$ |  $$ |$$  __$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$ |$$ |  $$ |$$ |  $$ |      
+   \$$$$$$  |\$$$$$$$ |$$ | $$ | $$ |$$$$$$$  |$$ |$$ |$$ |  $$ |\$$$$$$$ |      
+    \______/  \_______|\__| \__| \__|\_______/ \__|\__|\__|  \__| \____$$ |      
+                                                                 $$\   $$ |      
+                                                                 \$$$$$$  |      
+ $$$$$$\  $$\                         $$\            $$\          \______/       
+$$  __$$\ \__|                        $$ |           $$ |                        
+$$ /  \__|$$\ $$$$$$\$$$$\  $$\   $$\ $$ | $$$$$$\ $$$$$$\    $$$$$$\   $$$$$$\  
+\$$$$$$\  $$ |$$  _$$  _$$\ $$ |  $$ |$$ | \____$$\\_$$  _|  $$  __$$\ $$  __$$\ 
+ \____$$\ $$ |$$ / $$ / $$ |$$ |  $$ |$$ | $$$$$$$ | $$ |    $$ /  $$ |$$ |  \__|
+$$\   $$ |$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$  __$$ | $$ |$$\ $$ |  $$ |$$ |      
+\$$$$$$  |$$ |$$ | $$ | $$ |\$$$$$$  |$$ |\$$$$$$$ | \$$$$  |\$$$$$$  |$$ |      
+ \______/ \__|\__| \__| \__| \______/ \__| \_______|  \____/  \______/ \__|      '''
+CREDITS = "By Daniel Myers, Aiden Kline, Parker Cornelius, and Caleb Arnold"
+VERSION = "ENGR 102 Fall 2024 v1.0"
+
+LOAN_PICTURE = r"""
+------\ 
+| 38% | 
+\ APY \ 
+ \------
+        """
+RENT_PICTURE = r"""
+  _______
+ |WORLDS |✨
+(| BEST  |)
+ |RENTER |
+  \     /
+  `---'
+  _|_|_
+"""
+# Credit to Colin Douthwaite for art
+HONDA_CIVIC_PICTURE = r"""
+          _______      
+         //  ||\ \     
+ \ _____//___||_\ \___ 
+   )  _          _    \
+ / |_/ \________/ \___|
+     \_/        \_/    
+        """
+# Credit to Hayley Jane Wakenshaw for art
+GROCERIES_PICTURE = r"""
+  ,--./,-.  
+ / #      \ 
+|          |
+ \        / 
+  `._,._,   
+        """
+
+# The width every asset is rendered at, by name. Every line of an asset is centered in its width when it is packed.
+ASSET_SOURCES: dict[str, tuple[str, int]] = {
+    'logo': (GAMBLING_SIMULATOR_LOGO, 80),
+    'credits': (CREDITS, 80),
+    'version': (VERSION, 80),
+    'loan': (LOAN_PICTURE, 10),
+    'rent': (RENT_PICTURE, 10),
+    'honda_civic': (HONDA_CIVIC_PICTURE, 10),
+    'groceries': (GROCERIES_PICTURE, 10),
+}
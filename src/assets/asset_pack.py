@@ -0,0 +1,152 @@
+import functools
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import Optional
+
+# The asset pack is a header, a directory with an entry per asset, a table with an entry per line, and the UTF-8 text
+# of every line. A directory entry holds an asset's name and the range of the line table its lines occupy, and a line
+# table entry holds the offset and length of a line's text. The header ends with the SHA-256 digest of the art sources
+# the pack was built from.
+MAGIC = b'GSAP'
+FORMAT_VERSION = 2
+HEADER_FORMAT = '<4sII32s'
+MAX_NAME_LENGTH = 32
+DIRECTORY_ENTRY_FORMAT = f'<{MAX_NAME_LENGTH}sII'
+LINE_ENTRY_FORMAT = '<II'
+# Where the asset pack is built to by GamblingSimulator.spec or asset_pack_builder.py, and read from. A PyInstaller
+# build unpacks bundled data under sys._MEIPASS.
+ASSET_PACK_PATH = os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))), 'external_assets', 'asset_pack.bin')
+# Where packs are built at runtime when the pack at ASSET_PACK_PATH is missing or stale, as after a fresh checkout
+CACHE_DIRECTORY = os.path.join(tempfile.gettempdir(), 'gambling-simulator')
+ART_SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'art.py')
+
+
+def get_source_digest(path: str = ART_SOURCE_PATH) -> Optional[bytes]:
+    """
+    Returns the SHA-256 digest of the art sources at path, or None if they do not exist, as in a PyInstaller build,
+    which bundles only the asset pack built from them.
+    """
+    try:
+        with open(path, 'rb') as source_file:
+            return hashlib.sha256(source_file.read()).digest()
+    except FileNotFoundError:
+        return None
+
+
+class AssetPack:
+    """
+    The static art of Gambling Simulator, read from a memory-mapped asset pack.
+
+    The pack holds every asset already split into lines and padded to the width it is rendered at, so an asset is
+    displayed without any string processing. The file is mapped read-only, so every process reading the same pack
+    shares one copy of it in the operating system's page cache. Each asset is decoded at most once per AssetPack.
+    """
+
+    def __init__(self, path: str):
+        """
+        Maps the asset pack at path.
+        :exception OSError: If the file cannot be read.
+        :exception ValueError: If the file is not an asset pack of this FORMAT_VERSION.
+        """
+        with open(path, 'rb') as pack_file:
+            self.__pack = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version = struct.unpack_from('<4sI', self.__pack)
+            if magic != MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"{path} is not a version {FORMAT_VERSION} asset pack.")
+            _, _, asset_count, self.__source_digest = struct.unpack_from(HEADER_FORMAT, self.__pack)
+            self.__line_table_offset = (struct.calcsize(HEADER_FORMAT)
+                                        + asset_count * struct.calcsize(DIRECTORY_ENTRY_FORMAT))
+            if len(self.__pack) < self.__line_table_offset:
+                raise ValueError(f"{path} is not a valid asset pack.")
+            self.__directory: dict[str, tuple[int, int]] = {}
+            for name, first_line, line_count in struct.iter_unpack(
+                    DIRECTORY_ENTRY_FORMAT, self.__pack[struct.calcsize(HEADER_FORMAT):self.__line_table_offset]):
+                self.__directory[name.rstrip(b'\0').decode()] = (first_line, line_count)
+        except (struct.error, UnicodeDecodeError) as error:
+            self.__pack.close()
+            raise ValueError(f"{path} is not a valid asset pack.") from error
+        except ValueError:
+            self.__pack.close()
+            raise
+        self.__decoded: dict[str, tuple[str, ...]] = {}
+
+    def get_lines(self, name: str) -> tuple[str, ...]:
+        """
+        Returns the lines of the asset called name, padded to its render width.
+        :exception KeyError: If the pack holds no asset called name.
+        """
+        lines = self.__decoded.get(name)
+        if lines is None:
+            first_line, line_count = self.__directory[name]
+            entry_size = struct.calcsize(LINE_ENTRY_FORMAT)
+            start = self.__line_table_offset + first_line * entry_size
+            lines = tuple(str(self.__pack[offset:offset + length], 'utf-8') for offset, length in
+                          struct.iter_unpack(LINE_ENTRY_FORMAT, self.__pack[start:start + line_count * entry_size]))
+            self.__decoded[name] = lines
+        return lines
+
+    def get_names(self) -> tuple[str, ...]:
+        """Returns the name of every asset in the pack."""
+        return tuple(self.__directory)
+
+    def get_source_digest(self) -> bytes:
+        """Returns the SHA-256 digest of the art sources the pack was built from. See get_source_digest."""
+        return self.__source_digest
+
+    def close(self) -> None:
+        """Unmaps the pack. Lines already returned remain valid."""
+        self.__pack.close()
+
+
+def get_cached_pack_path(source_digest: bytes) -> str:
+    """Returns the path in CACHE_DIRECTORY of the asset pack built from the art sources with source_digest."""
+    return os.path.join(CACHE_DIRECTORY, f'asset_pack-{source_digest.hex()[:16]}.bin')
+
+
+def _load_current_pack(path: str, source_digest: Optional[bytes]) -> Optional[AssetPack]:
+    """
+    Returns the AssetPack at path, or None if there is none or it was built from art sources other than those with
+    source_digest or by another version of the builder. Any pack is current if source_digest is None.
+    """
+    try:
+        asset_pack = AssetPack(path)
+    except (FileNotFoundError, ValueError):
+        return None
+    if source_digest is None or asset_pack.get_source_digest() == source_digest:
+        return asset_pack
+    asset_pack.close()
+    return None
+
+
+@functools.cache
+def get_asset_pack() -> AssetPack:
+    """
+    Returns the AssetPack of this process, mapping it on the first call. Processes forked after the first call inherit
+    the mapping.
+
+    The pack at ASSET_PACK_PATH is used unless it is missing, as after a fresh checkout, or was built from art sources
+    other than the current ones or by another version of the builder. Nothing is ever written to ASSET_PACK_PATH, which
+    may be read-only; a pack of the current sources is built into CACHE_DIRECTORY instead, where later processes find
+    it.
+    """
+    source_digest = get_source_digest()
+    asset_pack = _load_current_pack(ASSET_PACK_PATH, source_digest)
+    if asset_pack is not None:
+        return asset_pack
+    if source_digest is None:
+        # A PyInstaller build has no art sources to build a pack from, only the pack bundled with it
+        return AssetPack(ASSET_PACK_PATH)
+    cached_pack_path = get_cached_pack_path(source_digest)
+    asset_pack = _load_current_pack(cached_pack_path, source_digest)
+    if asset_pack is not None:
+        return asset_pack
+    # Imported here since the art sources are only needed when the pack is missing or stale
+    from src.assets.asset_pack_builder import build_asset_pack
+    build_asset_pack(cached_pack_path)
+    return AssetPack(cached_pack_path)
@@ -0,0 +1,73 @@
+import argparse
+import os
+import struct
+import tempfile
+from typing import Optional
+
+from src.assets.art import ASSET_SOURCES
+from src.assets.asset_pack import ASSET_PACK_PATH
+from src.assets.asset_pack import DIRECTORY_ENTRY_FORMAT
+from src.assets.asset_pack import FORMAT_VERSION
+from src.assets.asset_pack import HEADER_FORMAT
+from src.assets.asset_pack import LINE_ENTRY_FORMAT
+from src.assets.asset_pack import MAGIC
+from src.assets.asset_pack import MAX_NAME_LENGTH
+from src.assets.asset_pack import get_source_digest
+
+
+def build_asset_pack(path: str, sources: dict[str, tuple[str, int]] = ASSET_SOURCES,
+                     source_digest: Optional[bytes] = None) -> None:
+    """
+    Splits every asset of sources into lines, centers each line in the asset's render width, and writes them all to an
+    asset pack at path. The pack is written in full before it is moved into place, so a process reading path never
+    sees a partial pack.
+    :param path: Where to write the pack.
+    :param sources: The text and render width of every asset, by name.
+    :param source_digest: The digest of the art sources to store in the pack, by default that of src/assets/art.py.
+    :exception ValueError: If an asset name is longer than MAX_NAME_LENGTH bytes.
+    """
+    if source_digest is None:
+        source_digest = get_source_digest() or bytes(32)
+    directory = []
+    line_table = []
+    text = bytearray()
+    for name, (source, width) in sources.items():
+        encoded_name = name.encode()
+        if len(encoded_name) > MAX_NAME_LENGTH:
+            raise ValueError(f"The asset name '{name}' is too long.")
+        lines = source.split('\n')
+        directory.append(struct.pack(DIRECTORY_ENTRY_FORMAT, encoded_name, len(line_table), len(lines)))
+        for line in lines:
+            encoded_line = f'{line:^{width}}'.encode()
+            line_table.append((len(text), len(encoded_line)))
+            text += encoded_line
+
+    # Line offsets count from the start of the file, so the text's own offset is needed first
+    text_offset = (struct.calcsize(HEADER_FORMAT) + len(directory) * struct.calcsize(DIRECTORY_ENTRY_FORMAT)
+                   + len(line_table) * struct.calcsize(LINE_ENTRY_FORMAT))
+    directory_path = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory_path, exist_ok=True)
+    # Every builder writes a file of its own, so processes building the same pack at once never mix their writes
+    file_descriptor, temporary_path = tempfile.mkstemp(suffix='.tmp', prefix=os.path.basename(path),
+                                                       dir=directory_path)
+    try:
+        with os.fdopen(file_descriptor, 'wb') as pack_file:
+            pack_file.write(struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, len(directory), source_digest))
+            pack_file.writelines(directory)
+            pack_file.writelines(struct.pack(LINE_ENTRY_FORMAT, text_offset + offset, length)
+                                 for offset, length in line_table)
+            pack_file.write(text)
+        # mkstemp creates files only their owner may read, but every user of the game reads the pack
+        os.chmod(temporary_path, 0o644)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Pack the static art of Gambling Simulator into its asset pack.")
+    parser.add_argument('--output', metavar='PATH', default=ASSET_PACK_PATH)
+    arguments = parser.parse_args()
+    build_asset_pack(arguments.output)
+    print(f'Packed {len(ASSET_SOURCES)} assets into {arguments.output}.')
@@ -0,0 +1,235 @@
+from array import array
+
+SPARKLINE_CHARACTERS = '▁▂▃▄▅▆▇█'
+
+
+class _BucketLevel:
+    """
+    A ring buffer of min/max buckets, each summarizing bucket_size consecutive entries of the level below it.
+    """
+
+    def __init__(self, capacity: int, bucket_size: int):
+        self.mins: array = array('q', bytes(8 * capacity))
+        self.maxs: array = array('q', bytes(8 * capacity))
+        self.start = 0
+        self.count = 0
+        self.bucket_size = bucket_size
+        # The bucket currently being filled, which is not yet part of the ring
+        self.pending_min = 0
+        self.pending_max = 0
+        self.pending_count = 0
+
+
+def _get_ring(values: array, start: int, count: int) -> list[int]:
+    """Returns the count entries of the ring buffer values that start at index start, oldest first."""
+    end = start + count
+    if end <= len(values):
+        return values[start:end].tolist()
+    return values[start:].tolist() + values[:end - len(values)].tolist()
+
+
+class BankrollHistory:
+    """
+    A bounded history of a player's coin balance after every round.
+
+    The most recent rounds are kept exactly in an array-backed ring buffer. Rounds that fall out of it are summarized
+    into coarser levels of min/max buckets, each level's buckets covering bucket_size times as many rounds as the
+    level below. Rounds that fall out of the coarsest level are forgotten, so the memory used by a BankrollHistory is
+    fixed no matter how long the player plays. Bucket levels are only allocated once they are needed.
+    """
+
+    def __init__(self, exact_capacity: int = 100, bucket_capacity: int = 50, bucket_size: int = 10,
+                 levels: int = 3):
+        """
+        Constructs an empty BankrollHistory.
+
+        Args:
+            exact_capacity (int): The number of most recent rounds kept exactly.
+            bucket_capacity (int): The number of min/max buckets kept at each level.
+            bucket_size (int): The number of entries of the level below summarized by each bucket.
+            levels (int): The number of levels of buckets.
+        """
+        self.__exact: array = array('q', bytes(8 * exact_capacity))
+        self.__exact_start = 0
+        self.__exact_count = 0
+        self.__bucket_capacity = bucket_capacity
+        self.__bucket_size = bucket_size
+        self.__max_levels = levels
+        self.__levels: list[_BucketLevel] = []
+        self.__total_rounds = 0
+
+    def record(self, coins: int) -> None:
+        """Records the coin balance after a round."""
+        capacity = len(self.__exact)
+        if self.__exact_count == capacity:
+            evicted = self.__exact[self.__exact_start]
+            self.__summarize(0, evicted, evicted)
+            self.__exact[self.__exact_start] = coins
+            self.__exact_start = (self.__exact_start + 1) % capacity
+        else:
+            self.__exact[(self.__exact_start + self.__exact_count) % capacity] = coins
+            self.__exact_count += 1
+        self.__total_rounds += 1
+
+    def record_many(self, coins: list[int]) -> None:
+        """
+        Records the coin balance after each of several rounds, oldest first, leaving the history exactly as calling
+        record for each balance in turn would. Balances are moved through the ring buffer and bucket levels with slices
+        rather than one at a time, so recording thousands of rounds at once costs little more than copying them.
+        """
+        if not coins:
+            return
+        self.__total_rounds += len(coins)
+        capacity = len(self.__exact)
+        if len(coins) >= capacity:
+            evicted = self.__get_exact() + coins[:-capacity]
+            kept = coins[-capacity:]
+        else:
+            entries = self.__get_exact() + coins
+            evicted = entries[:-capacity]
+            kept = entries[-capacity:]
+        self.__exact[:len(kept)] = array('q', kept)
+        self.__exact_start = 0
+        self.__exact_count = len(kept)
+        if evicted:
+            self.__summarize_many(0, evicted, evicted)
+
+    def get_total_rounds(self) -> int:
+        """Returns the number of rounds ever recorded, including those that have been forgotten."""
+        return self.__total_rounds
+
+    def get_entries(self) -> list[tuple[int, int]]:
+        """
+        Returns the remembered history from oldest to newest as (min, max) pairs. Pairs from the bucket levels summarize
+        many rounds; pairs for the most recent rounds have min equal to max.
+        """
+        entries: list[tuple[int, int]] = []
+        for level in reversed(self.__levels):
+            capacity = len(level.mins)
+            for i in range(level.count):
+                index = (level.start + i) % capacity
+                entries.append((level.mins[index], level.maxs[index]))
+            if level.pending_count > 0:
+                entries.append((level.pending_min, level.pending_max))
+        entries.extend((coins, coins) for coins in self.__get_exact())
+        return entries
+
+    def get_sparkline(self, width: int) -> str:
+        """Returns the remembered history as a sparkline at most width characters wide, oldest on the left."""
+        entries = self.get_entries()
+        if not entries:
+            return ''
+
+        # Group neighbouring entries together until the history fits in width columns
+        column_count = min(width, len(entries))
+        columns: list[tuple[int, int]] = []
+        for column in range(column_count):
+            group = entries[column * len(entries) // column_count:(column + 1) * len(entries) // column_count]
+            columns.append((min(entry[0] for entry in group), max(entry[1] for entry in group)))
+
+        lowest = min(column[0] for column in columns)
+        highest = max(column[1] for column in columns)
+        if highest == lowest:
+            return SPARKLINE_CHARACTERS[0] * len(columns)
+        levels = len(SPARKLINE_CHARACTERS) - 1
+        return str.join('', (SPARKLINE_CHARACTERS[round(((column[0] + column[1]) / 2 - lowest) / (highest - lowest)
+                                                         * levels)] for column in columns))
+
+    def __summarize(self, level_index: int, low: int, high: int) -> None:
+        """Adds an entry spanning low to high to the pending bucket of the given level."""
+        if level_index == self.__max_levels:
+            return
+        if level_index == len(self.__levels):
+            self.__levels.append(_BucketLevel(self.__bucket_capacity, self.__bucket_size))
+        level = self.__levels[level_index]
+
+        if level.pending_count == 0:
+            level.pending_min, level.pending_max = low, high
+        else:
+            level.pending_min = min(level.pending_min, low)
+            level.pending_max = max(level.pending_max, high)
+        level.pending_count += 1
+        if level.pending_count < level.bucket_size:
+            return
+
+        # The pending bucket is full; move it into the ring, evicting the oldest bucket to the next level if needed
+        capacity = len(level.mins)
+        if level.count == capacity:
+            self.__summarize(level_index + 1, level.mins[level.start], level.maxs[level.start])
+            index = level.start
+            level.start = (level.start + 1) % capacity
+        else:
+            index = (level.start + level.count) % capacity
+            level.count += 1
+        level.mins[index] = level.pending_min
+        level.maxs[index] = level.pending_max
+        level.pending_count = 0
+
+    def __summarize_many(self, level_index: int, lows: list[int], highs: list[int], span: int = 1) -> None:
+        """
+        Adds entries to the given level, oldest first, as __summarize would. Each entry spans the lowest of span
+        consecutive values of lows to the highest of the same values of highs. Buckets that would be evicted to the
+        next level as soon as they are built are never built: their values are handed on with a wider span instead,
+        since the next level only needs the min and max of the values its own buckets span.
+        """
+        if level_index == self.__max_levels or not lows:
+            return
+        if level_index == len(self.__levels):
+            self.__levels.append(_BucketLevel(self.__bucket_capacity, self.__bucket_size))
+        level = self.__levels[level_index]
+        bucket_span = level.bucket_size * span
+
+        # Top up the pending bucket first
+        completed_mins: list[int] = []
+        completed_maxs: list[int] = []
+        start = 0
+        if level.pending_count > 0:
+            start = min(level.bucket_size - level.pending_count, len(lows) // span) * span
+            level.pending_min = min(level.pending_min, min(lows[:start]))
+            level.pending_max = max(level.pending_max, max(highs[:start]))
+            level.pending_count += start // span
+            if level.pending_count < level.bucket_size:
+                return
+            completed_mins.append(level.pending_min)
+            completed_maxs.append(level.pending_max)
+            level.pending_count = 0
+
+        # Work out which buckets fall out of the ring: the oldest in it, then the oldest of those completed here
+        end = start + (len(lows) - start) // bucket_span * bucket_span
+        capacity = len(level.mins)
+        evicted = max(level.count + len(completed_mins) + (end - start) // bucket_span - capacity, 0)
+        ring_mins = _get_ring(level.mins, level.start, level.count) + completed_mins
+        ring_maxs = _get_ring(level.maxs, level.start, level.count) + completed_maxs
+        if evicted > 0:
+            self.__summarize_many(level_index + 1, ring_mins[:evicted], ring_maxs[:evicted])
+            evicted_end = start + max(evicted - len(ring_mins), 0) * bucket_span
+            if evicted_end > start:
+                raw_lows = lows[start:evicted_end]
+                raw_highs = raw_lows if lows is highs else highs[start:evicted_end]
+                self.__summarize_many(level_index + 1, raw_lows, raw_highs, bucket_span)
+            ring_mins, ring_maxs = ring_mins[evicted:], ring_maxs[evicted:]
+            start = evicted_end
+
+        # Summarize every full bucket that stays in the ring, leaving the remainder pending. When lows and highs are
+        # the same balances, sorting each bucket finds both its min and max with integer comparisons that are much
+        # cheaper than the rich comparisons of min and max.
+        if lows is highs:
+            buckets = [lows[offset:offset + bucket_span] for offset in range(start, end, bucket_span)]
+            for bucket in buckets:
+                bucket.sort()
+            ring_mins.extend(bucket[0] for bucket in buckets)
+            ring_maxs.extend(bucket[-1] for bucket in buckets)
+        else:
+            ring_mins.extend(min(lows[offset:offset + bucket_span]) for offset in range(start, end, bucket_span))
+            ring_maxs.extend(max(highs[offset:offset + bucket_span]) for offset in range(start, end, bucket_span))
+        if end < len(lows):
+            level.pending_min, level.pending_max = min(lows[end:]), max(highs[end:])
+            level.pending_count = (len(lows) - end) // span
+        level.mins[:len(ring_mins)] = array('q', ring_mins)
+        level.maxs[:len(ring_maxs)] = array('q', ring_maxs)
+        level.start = 0
+        level.count = len(ring_mins)
+
+    def __get_exact(self) -> list[int]:
+        """Returns the exactly kept balances, oldest first."""
+        return _get_ring(self.__exact, self.__exact_start, self.__exact_count)
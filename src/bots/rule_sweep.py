@@ -0,0 +1,216 @@
+import argparse
+import itertools
+import json
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.bots.statistics import get_mean_and_standard_error
+from src.bots.strategy import Strategy
+from src.bots.strategies.flat_strategy import FlatStrategy
+from src.bots.visible_state import VisibleState
+from src.managers.gambling_manager import GamblingManager
+from src.player_data import PlayerData
+from src.programs.minigames.blackjack_rules import BlackjackRules
+from src.programs.minigames.blackjack_table import BlackjackTable
+
+# Every hand is bet with this many coins, so that fractional blackjack payouts round to the exact amount
+_BET = 100
+# Bump this whenever a change to the minigame or to the sweep would change the results of a cached variant
+_CACHE_VERSION = 1
+
+
+def _play_hands(rules: BlackjackRules, hands: int, seed: int) -> tuple[int, int, int]:
+    """
+    Plays hands hands of blackjack by rules in a worker process. Every decision is made by the default Strategy, which
+    plays each hand like the dealer plays theirs.
+
+    Returns:
+        tuple[int, int, int]: The number of hands, and the sum and sum of squares of the net coins won per coin bet,
+            scaled by _BET.
+    """
+    player_data = PlayerData()
+    player_data.set_player_coins(hands * _BET * 10)
+    gambling_manager = GamblingManager(player_data)
+    table = BlackjackTable(random.Random(seed), rules)
+    seat = table.add_seat(gambling_manager)
+    strategy: Strategy = FlatStrategy(_BET)
+
+    net_sum = net_square_sum = 0
+    for _ in range(hands):
+        coins_before_hand = gambling_manager.get_player_coins()
+        table.place_bet(seat, _BET)
+        table.deal()
+        while table.is_round_in_progress():
+            state = VisibleState('blackjack', gambling_manager.get_player_coins(), table.get_seat_cards(seat),
+                                 table.get_dealer_shown_card(), table.get_seat_score(seat))
+            table.process_decision(seat, strategy.choose_action(state))
+        net = gambling_manager.get_player_coins() - coins_before_hand
+        net_sum += net
+        net_square_sum += net * net
+    return hands, net_sum, net_square_sum
+
+
+class RuleVariantResult:
+    """
+    The house edge of one set of BlackjackRules, as measured by a RuleSweep.
+
+    Attributes:
+        rules (BlackjackRules): The rules the hands were played by.
+        hands (int): The number of hands played.
+        house_edge (float): The mean fraction of each bet kept by the house, negative if the player has the edge.
+        standard_error (float): The standard error of house_edge.
+        cached (bool): True if the result was read from the cache rather than simulated by this sweep.
+    """
+
+    def __init__(self, rules: BlackjackRules, hands: int, house_edge: float, standard_error: float, cached: bool):
+        self.rules: BlackjackRules = rules
+        self.hands: int = hands
+        self.house_edge: float = house_edge
+        self.standard_error: float = standard_error
+        self.cached: bool = cached
+
+
+def get_rule_grid(dealer_hits_soft_17: list[bool], blackjack_payout: list[float], decks: list[Optional[int]],
+                  push_returns_bet: list[bool], blackjack_push_returns_bet: list[bool]) -> list[BlackjackRules]:
+    """Returns BlackjackRules for every combination of the given options."""
+    return [BlackjackRules(*options) for options in itertools.product(dealer_hits_soft_17, blackjack_payout, decks,
+                                                                      push_returns_bet, blackjack_push_returns_bet)]
+
+
+class RuleSweep:
+    """
+    Measures the house edge of blackjack under many variants of the rules in parallel.
+
+    Each variant is played in chunks of hands spread across worker processes. Every variant plays chunk i with the
+    same seed, so differences between variants are not drowned out by luck. Finished variants are cached on disk in
+    a file named by the hash of their rules and the sweep parameters, so rerunning a sweep only simulates variants that
+    have not been measured before.
+    """
+
+    def __init__(self, variants: list[BlackjackRules], hands: int = 1_000_000, seed: int = 0,
+                 workers: Optional[int] = None, hands_per_task: int = 50_000,
+                 cache_directory: str = '.rule_sweep_cache'):
+        """
+        Constructs a RuleSweep.
+
+        Args:
+            variants (list[BlackjackRules]): The variants of the rules to measure.
+            hands (int): The number of hands to play under each variant.
+            seed (int): The seed from which the random generator of every chunk of hands is derived.
+            workers (Optional[int]): The number of worker processes, or None for one per CPU.
+            hands_per_task (int): The number of hands played by each task submitted to the process pool.
+            cache_directory (str): The directory results are cached in. It is created if it does not exist.
+        """
+        self.__variants = variants
+        self.__hands = hands
+        self.__seed = seed
+        self.__workers = workers
+        self.__hands_per_task = hands_per_task
+        self.__cache_directory = cache_directory
+
+    def run(self) -> list[RuleVariantResult]:
+        """Measures every variant that is not already cached and returns the results of all of them, in order."""
+        results: dict[BlackjackRules, RuleVariantResult] = {}
+        uncached_variants = []
+        for rules in dict.fromkeys(self.__variants):
+            cached_result = self.__read_cache(rules)
+            if cached_result is not None:
+                results[rules] = cached_result
+            else:
+                uncached_variants.append(rules)
+
+        if uncached_variants:
+            with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+                futures = {rules: [executor.submit(_play_hands, rules,
+                                                   min(self.__hands_per_task, self.__hands - first_hand),
+                                                   self.__seed * 1_000_003 + first_hand // self.__hands_per_task)
+                                   for first_hand in range(0, self.__hands, self.__hands_per_task)]
+                           for rules in uncached_variants}
+                for rules, variant_futures in futures.items():
+                    totals = [0, 0, 0]
+                    for future in variant_futures:
+                        for i, value in enumerate(future.result()):
+                            totals[i] += value
+                    results[rules] = self.__to_result(rules, *totals)
+                    self.__write_cache(results[rules], totals)
+        return [results[rules] for rules in self.__variants]
+
+    @staticmethod
+    def __to_result(rules: BlackjackRules, hands: int, net_sum: int, net_square_sum: int,
+                    cached: bool = False) -> RuleVariantResult:
+        mean, standard_error = get_mean_and_standard_error(hands, net_sum, net_square_sum)
+        return RuleVariantResult(rules, hands, -mean / _BET, standard_error / _BET, cached)
+
+    def __get_cache_path(self, rules: BlackjackRules) -> str:
+        return os.path.join(self.__cache_directory,
+                            f'{rules.get_config_hash()}-{self.__hands}-{self.__hands_per_task}-{self.__seed}'
+                            f'-v{_CACHE_VERSION}.json')
+
+    def __read_cache(self, rules: BlackjackRules) -> Optional[RuleVariantResult]:
+        """Returns the cached result of rules, or None if there is none."""
+        try:
+            with open(self.__get_cache_path(rules)) as cache_file:
+                cached = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        return RuleSweep.__to_result(rules, cached['hands'], cached['net_sum'], cached['net_square_sum'], True)
+
+    def __write_cache(self, result: RuleVariantResult, totals: list[int]) -> None:
+        """Caches the totals of result. The file is written in full before it is moved into place."""
+        os.makedirs(self.__cache_directory, exist_ok=True)
+        cache_path = self.__get_cache_path(result.rules)
+        # Every sweep writes a file of its own, so sweeps caching the same variant at once never mix their writes
+        file_descriptor, temporary_path = tempfile.mkstemp(suffix='.tmp', prefix=os.path.basename(cache_path),
+                                                           dir=self.__cache_directory)
+        try:
+            with os.fdopen(file_descriptor, 'w') as cache_file:
+                json.dump({'rules': result.rules.to_dict(), 'hands': totals[0], 'net_sum': totals[1],
+                           'net_square_sum': totals[2]}, cache_file)
+            os.replace(temporary_path, cache_path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+
+def _parse_yes_no(value: str) -> bool:
+    if value not in ('yes', 'no'):
+        raise argparse.ArgumentTypeError("expected 'yes' or 'no'")
+    return value == 'yes'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the house edge of blackjack over a grid of rule variants. "
+                                                 "Every option takes one or more values.")
+    parser.add_argument('--hits-soft-17', type=_parse_yes_no, nargs='+', default=[False], metavar='yes|no')
+    parser.add_argument('--blackjack-payout', type=float, nargs='+', default=[3.0],
+                        help="total paid per coin bet on a blackjack, including the bet")
+    parser.add_argument('--decks', type=int, nargs='+', default=[0], help="0 for an infinite shoe")
+    parser.add_argument('--push-returns-bet', type=_parse_yes_no, nargs='+', default=[True], metavar='yes|no')
+    parser.add_argument('--blackjack-push-returns-bet', type=_parse_yes_no, nargs='+', default=[False],
+                        metavar='yes|no')
+    parser.add_argument('--hands', type=int, default=1_000_000, help="hands per variant")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--hands-per-task', type=int, default=50_000)
+    parser.add_argument('--cache-directory', default='.rule_sweep_cache')
+    arguments = parser.parse_args()
+
+    rule_grid = get_rule_grid(arguments.hits_soft_17, arguments.blackjack_payout,
+                              [deck_count if deck_count > 0 else None for deck_count in arguments.decks],
+                              arguments.push_returns_bet, arguments.blackjack_push_returns_bet)
+    sweep_results = RuleSweep(rule_grid, arguments.hands, arguments.seed, arguments.workers, arguments.hands_per_task,
+                              arguments.cache_directory).run()
+
+    print(f'|{"H17":<4}|{"BJ pays":>8}|{"Decks":>6}|{"Push":>6}|{"BJ push":>8}|{"House edge":>11}|{"± SE":>8}|'
+          f'{"Source":>8}|')
+    for sweep_result in sorted(sweep_results, key=lambda result: result.house_edge):
+        sweep_rules = sweep_result.rules
+        print(f'|{"yes" if sweep_rules.dealer_hits_soft_17 else "no":<4}|{sweep_rules.blackjack_payout:>8g}'
+              f'|{sweep_rules.decks if sweep_rules.decks is not None else "inf":>6}'
+              f'|{"return" if sweep_rules.push_returns_bet else "lose":>6}'
+              f'|{"return" if sweep_rules.blackjack_push_returns_bet else "lose":>8}'
+              f'|{sweep_result.house_edge:>11.3%}|{sweep_result.standard_error:>8.3%}'
+              f'|{"cache" if sweep_result.cached else "run":>8}|')
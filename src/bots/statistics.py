@@ -0,0 +1,11 @@
+import math
+
+
+def get_mean_and_standard_error(count: int, value_sum: float, value_square_sum: float) -> tuple[float, float]:
+    """
+    Returns the mean of count values and the standard error of that mean from their sum and sum of squares, so workers
+    only need to send back running totals. The standard error is 0 for a single value.
+    """
+    mean = value_sum / count
+    variance = (value_square_sum - count * mean ** 2) / (count - 1) if count > 1 else 0.0
+    return mean, math.sqrt(max(variance, 0.0) / count)
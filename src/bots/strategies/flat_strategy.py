@@ -0,0 +1,14 @@
+from src.bots.strategy import Strategy
+from src.bots.visible_state import VisibleState
+
+
+class FlatStrategy(Strategy):
+    """
+    Bets the same number of coins every round.
+    """
+
+    def __init__(self, bet: int):
+        self.__bet = bet
+
+    def place_bet(self, state: VisibleState) -> int:
+        return self.__bet
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from src.advisor.kelly_advisor import KellyAdvisor
+from src.bots.strategy import Strategy
+from src.bots.visible_state import VisibleState
+from src.programs.minigames.roulette import COLOR_PAYOUT_MULTIPLIERS
+from src.programs.minigames.roulette import WHEEL
+
+
+class KellyStrategy(Strategy):
+    """
+    Bets a fixed fraction of the current bankroll every round, as the Kelly criterion prescribes for a fixed edge.
+
+    If no fraction is given, the fraction and the roulette bet are those suggested by a KellyAdvisor for the minigame
+    being played. Minigames where the advisor suggests betting nothing are still played with the minimum bet.
+    """
+
+    def __init__(self, fraction: Optional[float] = None):
+        """
+        Constructs a KellyStrategy.
+        :param fraction: The fraction of the bankroll to bet each round, between 0 and 1, or None to bet the fraction
+            suggested by a KellyAdvisor.
+        :exception ValueError: If fraction is not between 0 and 1.
+        """
+        if fraction is not None and not 0 < fraction <= 1:
+            raise ValueError("The fraction of the bankroll to bet must be between 0 and 1.")
+        self.__fraction = fraction
+        self.__advisor: Optional[KellyAdvisor] = KellyAdvisor() if fraction is None else None
+
+    def place_bet(self, state: VisibleState) -> int:
+        if self.__advisor is not None:
+            return max(1, self.__advisor.suggest_bet(state.game, state.bankroll))
+        return max(1, int(state.bankroll * self.__fraction))
+
+    def choose_action(self, state: VisibleState) -> str:
+        if self.__advisor is None or state.game != 'roulette':
+            return super().choose_action(state)
+        option = self.__advisor.get_option('roulette')
+        if option in COLOR_PAYOUT_MULTIPLIERS:
+            return option
+        return str.join(',', WHEEL[:int(option)])
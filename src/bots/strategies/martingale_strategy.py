@@ -0,0 +1,24 @@
+from src.bots.strategy import Strategy
+from src.bots.visible_state import VisibleState
+
+
+class MartingaleStrategy(Strategy):
+    """
+    Doubles the bet after every loss and returns to the base bet after every win.
+    """
+
+    def __init__(self, base_bet: int):
+        self.__base_bet = base_bet
+        self.__next_bet = base_bet
+
+    def place_bet(self, state: VisibleState) -> int:
+        return self.__next_bet
+
+    def observe_result(self, state: VisibleState, bet: int, net: int) -> None:
+        if net < 0:
+            self.__next_bet = bet * 2
+        elif net > 0:
+            self.__next_bet = self.__base_bet
+
+    def reset(self) -> None:
+        self.__next_bet = self.__base_bet
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+
+from src.bots.visible_state import VisibleState
+from src.programs.minigames.blackjack_rules import DEALER_STAND_SCORE
+
+
+class Strategy(ABC):
+    """
+    An abstract representation of a player who bets and makes decisions without user input.
+
+    A Strategy is asked for a bet size at the start of every round and for an action whenever a minigame requires a
+    decision. After every round, the Strategy is told how many coins it won or lost so that betting systems can adjust
+    their next bet.
+
+    The actions a Strategy may return are:
+    - blackjack: 'hit' or 'stand'
+    - roulette: 'red', 'black', 'green', or comma separated numbers on the wheel (i.e. '7' or '0,00')
+    - slots: slots requires no decisions, so choose_action(self, state) is never called.
+    """
+
+    @abstractmethod
+    def place_bet(self, state: VisibleState) -> int:
+        """
+        Subclasses must implement this method to choose the number of coins to bet this round.
+
+        Returns:
+            int: The number of coins to bet. Bets larger than the bankroll are reduced to the bankroll.
+        """
+        pass
+
+    def choose_action(self, state: VisibleState) -> str:
+        """
+        Chooses an action for the decision currently required by the minigame. By default, blackjack hands are played
+        like the dealer plays them and roulette bets are placed on red.
+
+        Returns:
+            str: The action, as it would be typed by a player.
+        """
+        if state.game == 'blackjack':
+            return 'hit' if state.score < DEALER_STAND_SCORE else 'stand'
+        return 'red'
+
+    def observe_result(self, state: VisibleState, bet: int, net: int) -> None:
+        """
+        Informs this Strategy of the outcome of a round.
+
+        Args:
+            state (VisibleState): The visible state after the round was settled.
+            bet (int): The number of coins bet this round.
+            net (int): The number of coins won this round, negative if coins were lost.
+        """
+        pass
+
+    def reset(self) -> None:
+        """Resets any state this Strategy keeps between rounds. Called at the start of every session."""
+        pass
@@ -0,0 +1,101 @@
+import random
+from typing import Optional
+
+from src.bots.strategy import Strategy
+from src.bots.visible_state import VisibleState
+from src.managers.gambling_manager import GamblingManager
+from src.player_data import PlayerData
+from src.programs.minigames.blackjack import BlackjackMinigame
+from src.programs.minigames.roulette import RouletteMinigame
+from src.programs.minigames.slots import SlotsMinigame
+
+GAMES = ('blackjack', 'slots', 'roulette')
+
+
+class StrategyBot:
+    """
+    Plays a minigame on behalf of a Strategy by feeding the Strategy's decisions to the minigame as user input.
+
+    StrategyBot drives the real minigame AbstractPrograms, so bots play by exactly the same rules as players. The
+    minigames still print as they are played; callers that do not want the output should redirect stdout.
+    """
+
+    def __init__(self, strategy: Strategy, game: str, random_generator: random.Random,
+                 round_seed: Optional[int] = None):
+        """
+        Constructs a StrategyBot.
+        :param strategy: The Strategy making bets and decisions.
+        :param game: The minigame to play, one of 'blackjack', 'slots' or 'roulette'.
+        :param random_generator: The source of randomness for the minigame.
+        :param round_seed: If given, random_generator is reseeded from round_seed and the round number before every
+        round, so each round is dealt the same cards and spins whatever the draws of earlier rounds were.
+        :exception ValueError: If game is not a minigame.
+        """
+        if game not in GAMES:
+            raise ValueError(f"Unknown minigame '{game}'.")
+        self.__strategy = strategy
+        self.__game = game
+        self.__random = random_generator
+        self.__round_seed = round_seed
+
+    def play_session(self, starting_coins: int, max_rounds: int) -> tuple[int, int]:
+        """
+        Plays rounds starting from starting_coins until max_rounds have been played or the player runs out of coins.
+
+        Returns:
+            tuple[int, int]: The number of rounds played and the net number of coins won (negative if lost).
+        """
+        player_data = PlayerData()
+        player_data.set_player_coins(starting_coins)
+        gambling_manager = GamblingManager(player_data)
+        self.__strategy.reset()
+
+        slots_minigame = None
+        if self.__game == 'slots':
+            slots_minigame = SlotsMinigame(gambling_manager, self.__random)
+            slots_minigame.execute_program()
+
+        rounds_played = 0
+        while rounds_played < max_rounds and gambling_manager.get_player_coins() > 0:
+            coins_before_round = gambling_manager.get_player_coins()
+            bet = self.__strategy.place_bet(VisibleState(self.__game, coins_before_round))
+            bet = min(max(bet, 1), coins_before_round)
+            if self.__round_seed is not None:
+                self.__random.seed(f'{self.__round_seed}:{rounds_played}')
+            match self.__game:
+                case 'blackjack':
+                    self.__play_blackjack_round(gambling_manager, bet)
+                case 'slots':
+                    slots_minigame.process_user_input(str(bet))
+                case 'roulette':
+                    self.__play_roulette_round(gambling_manager, bet)
+            rounds_played += 1
+            self.__strategy.observe_result(VisibleState(self.__game, gambling_manager.get_player_coins()), bet,
+                                           gambling_manager.get_player_coins() - coins_before_round)
+
+        if slots_minigame is not None:
+            slots_minigame.process_user_input('stop')
+        return rounds_played, gambling_manager.get_player_coins() - starting_coins
+
+    def __play_blackjack_round(self, gambling_manager: GamblingManager, bet: int) -> None:
+        """Plays a single hand of blackjack, asking the Strategy to hit or stand until the hand is over."""
+        minigame = BlackjackMinigame(gambling_manager, self.__random)
+        minigame.execute_program()
+        complete = minigame.process_user_input(str(bet))
+        while not complete:
+            state = VisibleState('blackjack', gambling_manager.get_player_coins(), minigame.get_user_cards(),
+                                 minigame.get_dealer_shown_card(), minigame.get_user_score())
+            action = self.__strategy.choose_action(state)
+            if action != 'hit' and action != 'stand':
+                raise ValueError(f"Invalid blackjack action '{action}'.")
+            complete = minigame.process_user_input(action)
+
+    def __play_roulette_round(self, gambling_manager: GamblingManager, bet: int) -> None:
+        """Plays a single spin of roulette on the selection chosen by the Strategy."""
+        minigame = RouletteMinigame(gambling_manager, self.__random)
+        minigame.execute_program()
+        minigame.process_user_input(str(bet))
+        selection = self.__strategy.choose_action(VisibleState('roulette', gambling_manager.get_player_coins()))
+        minigame.process_user_input('color' if selection in ('red', 'black', 'green') else 'number')
+        if not minigame.process_user_input(selection):
+            raise ValueError(f"Invalid roulette selection '{selection}'.")
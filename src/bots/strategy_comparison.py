@@ -0,0 +1,148 @@
+import argparse
+import contextlib
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.bots.statistics import get_mean_and_standard_error
+from src.bots.strategies.flat_strategy import FlatStrategy
+from src.bots.strategies.kelly_strategy import KellyStrategy
+from src.bots.strategies.martingale_strategy import MartingaleStrategy
+from src.bots.strategy import Strategy
+from src.bots.strategy_bot import GAMES
+from src.bots.strategy_bot import StrategyBot
+
+
+def _play_paired_sessions(strategy_a: Strategy, strategy_b: Strategy, game: str, first_session: int, sessions: int,
+                          rounds_per_session: int, starting_coins: int, seed: int) -> tuple[int, ...]:
+    """
+    Plays paired sessions of game in a worker process. Both strategies play every round of session i with a random
+    generator seeded from the session and round, so they are dealt the same cards and spin the same reels each round
+    even after their hit or stand decisions have drawn different numbers of cards.
+
+    Returns:
+        tuple[int, ...]: The number of pairs, then the sum and sum of squares of the net coins won per pair by
+            strategy_a, by strategy_b, and of their difference.
+    """
+    totals = [0] * 7
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for session in range(first_session, first_session + sessions):
+            session_seed = seed * 1_000_003 + session
+            net_a = StrategyBot(strategy_a, game, random.Random(), session_seed).play_session(
+                starting_coins, rounds_per_session)[1]
+            net_b = StrategyBot(strategy_b, game, random.Random(), session_seed).play_session(
+                starting_coins, rounds_per_session)[1]
+            for i, value in enumerate((net_a, net_b, net_a - net_b)):
+                totals[2 * i + 1] += value
+                totals[2 * i + 2] += value * value
+            totals[0] += 1
+    return tuple(totals)
+
+
+class ComparisonResult:
+    """
+    The result of a StrategyComparison.
+
+    Attributes:
+        pairs (int): The number of paired sessions played.
+        mean_a (float): The mean net coins won per session by the first Strategy.
+        mean_b (float): The mean net coins won per session by the second Strategy.
+        mean_difference (float): The mean of the paired difference mean_a - mean_b.
+        standard_error (float): The standard error of mean_difference.
+        independent_standard_error (float): The standard error mean_difference would have had if the two Strategies
+            had been run independently, for judging how much variance the pairing removed.
+    """
+
+    def __init__(self, totals: list[float]):
+        self.pairs: int = int(totals[0])
+        self.mean_a, standard_error_a = get_mean_and_standard_error(self.pairs, totals[1], totals[2])
+        self.mean_b, standard_error_b = get_mean_and_standard_error(self.pairs, totals[3], totals[4])
+        self.mean_difference, self.standard_error = get_mean_and_standard_error(self.pairs, totals[5], totals[6])
+        self.independent_standard_error: float = math.sqrt(standard_error_a ** 2 + standard_error_b ** 2)
+
+    def __str__(self) -> str:
+        string_list = [f'Pairs: {self.pairs:,}',
+                       f'Mean net (A): {self.mean_a:,.2f}',
+                       f'Mean net (B): {self.mean_b:,.2f}',
+                       f'Paired difference (A - B): {self.mean_difference:,.2f} ± {self.standard_error:,.2f} (SE)',
+                       f'Independent runs would give SE: {self.independent_standard_error:,.2f}']
+        if self.standard_error > 0:
+            variance_ratio = (self.independent_standard_error / self.standard_error) ** 2
+            string_list.append(f'Variance reduction: {variance_ratio:,.1f}x fewer sessions for the same confidence')
+        return str.join('\n', string_list)
+
+
+class StrategyComparison:
+    """
+    Compares two Strategies on one minigame using common random numbers.
+
+    Both Strategies play every round of a session with identically seeded random generators, so they are dealt the same
+    cards and spin the same reels even when their play decisions differ. Luck that affects both Strategies equally
+    cancels out of their paired difference, which therefore needs far fewer sessions to resolve than a comparison of
+    independent runs.
+    """
+
+    def __init__(self, strategy_a: Strategy, strategy_b: Strategy, game: str, sessions: int = 10_000,
+                 rounds_per_session: int = 100, starting_coins: int = 1_000, seed: int = 0,
+                 workers: Optional[int] = None, sessions_per_task: int = 500):
+        """
+        Constructs a StrategyComparison.
+
+        Args:
+            strategy_a (Strategy): The first Strategy. Must be picklable.
+            strategy_b (Strategy): The second Strategy. Must be picklable.
+            game (str): The minigame to compare the Strategies on.
+            sessions (int): The number of paired sessions to play.
+            rounds_per_session (int): The maximum number of rounds in a session.
+            starting_coins (int): The number of coins a session starts with.
+            seed (int): The seed from which the random generator of every session is derived.
+            workers (Optional[int]): The number of worker processes, or None for one per CPU.
+            sessions_per_task (int): The number of sessions played by each task submitted to the process pool.
+
+        Exceptions:
+            ValueError: If game is not a minigame.
+        """
+        if game not in GAMES:
+            raise ValueError(f"Unknown minigame '{game}'.")
+        self.__strategy_a = strategy_a
+        self.__strategy_b = strategy_b
+        self.__game = game
+        self.__sessions = sessions
+        self.__rounds_per_session = rounds_per_session
+        self.__starting_coins = starting_coins
+        self.__seed = seed
+        self.__workers = workers
+        self.__sessions_per_task = sessions_per_task
+
+    def run(self) -> ComparisonResult:
+        """Plays every paired session and returns the paired difference of the two Strategies."""
+        totals = [0.0] * 7
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            futures = [executor.submit(_play_paired_sessions, self.__strategy_a, self.__strategy_b, self.__game,
+                                       first_session, min(self.__sessions_per_task, self.__sessions - first_session),
+                                       self.__rounds_per_session, self.__starting_coins, self.__seed)
+                       for first_session in range(0, self.__sessions, self.__sessions_per_task)]
+            for future in futures:
+                for i, value in enumerate(future.result()):
+                    totals[i] += value
+        return ComparisonResult(totals)
+
+
+if __name__ == '__main__':
+    strategies = {'flat': FlatStrategy(10), 'martingale': MartingaleStrategy(10), 'kelly': KellyStrategy(0.01)}
+    parser = argparse.ArgumentParser(description="Compare two betting strategies with common random numbers.")
+    parser.add_argument('strategy_a', choices=strategies.keys())
+    parser.add_argument('strategy_b', choices=strategies.keys())
+    parser.add_argument('--game', choices=GAMES, default='blackjack')
+    parser.add_argument('--sessions', type=int, default=10_000)
+    parser.add_argument('--rounds', type=int, default=100, help="maximum rounds per session")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    arguments = parser.parse_args()
+
+    comparison = StrategyComparison(strategies[arguments.strategy_a], strategies[arguments.strategy_b],
+                                    arguments.game, sessions=arguments.sessions, rounds_per_session=arguments.rounds,
+                                    seed=arguments.seed, workers=arguments.workers)
+    print(comparison.run())
@@ -0,0 +1,168 @@
+import argparse
+import contextlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.bots.statistics import get_mean_and_standard_error
+from src.bots.strategies.flat_strategy import FlatStrategy
+from src.bots.strategies.kelly_strategy import KellyStrategy
+from src.bots.strategies.martingale_strategy import MartingaleStrategy
+from src.bots.strategy import Strategy
+from src.bots.strategy_bot import GAMES
+from src.bots.strategy_bot import StrategyBot
+
+# The z-score of a two-sided 95% confidence interval
+_Z_95 = 1.959963984540054
+
+
+def _play_sessions(strategy: Strategy, game: str, sessions: int, rounds_per_session: int, starting_coins: int,
+                   seed: int) -> tuple[int, int, int, int, int]:
+    """
+    Plays sessions of game with strategy in a worker process.
+
+    Returns:
+        tuple[int, int, int, int, int]: The number of sessions, rounds and busts, and the sum and sum of squares of
+            the net coins won per session.
+    """
+    bot = StrategyBot(strategy, game, random.Random(seed))
+    rounds = busts = net_sum = net_square_sum = 0
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(sessions):
+            rounds_played, net = bot.play_session(starting_coins, rounds_per_session)
+            rounds += rounds_played
+            busts += net == -starting_coins
+            net_sum += net
+            net_square_sum += net * net
+    return sessions, rounds, busts, net_sum, net_square_sum
+
+
+class LeaderboardEntry:
+    """
+    The aggregated results of one Strategy playing one minigame.
+
+    Attributes:
+        strategy_name (str): The name the Strategy was entered into the Tournament under.
+        game (str): The minigame played.
+        sessions (int): The number of sessions played.
+        rounds (int): The number of rounds played across all sessions.
+        busts (int): The number of sessions that ended with no coins left.
+        mean_net (float): The mean net coins won per session.
+        confidence_interval (tuple[float, float]): The 95% confidence interval of mean_net.
+    """
+
+    def __init__(self, strategy_name: str, game: str, sessions: int, rounds: int, busts: int, net_sum: int,
+                 net_square_sum: int):
+        self.strategy_name: str = strategy_name
+        self.game: str = game
+        self.sessions: int = sessions
+        self.rounds: int = rounds
+        self.busts: int = busts
+        self.mean_net, standard_error = get_mean_and_standard_error(sessions, net_sum, net_square_sum)
+        half_width = _Z_95 * standard_error
+        self.confidence_interval: tuple[float, float] = (self.mean_net - half_width, self.mean_net + half_width)
+
+
+class TournamentResult:
+    """
+    The leaderboards produced by a Tournament, one per minigame.
+
+    The __str__ method of a TournamentResult returns the leaderboards as tables.
+    """
+
+    def __init__(self, entries: list[LeaderboardEntry]):
+        self.__entries = entries
+
+    def get_leaderboard(self, game: str) -> list[LeaderboardEntry]:
+        """Returns the entries for game, ordered from the highest to the lowest mean net coins per session."""
+        return sorted((entry for entry in self.__entries if entry.game == game),
+                      key=lambda entry: entry.mean_net, reverse=True)
+
+    def __str__(self) -> str:
+        string_list = []
+        games = [game for game in GAMES if any(entry.game == game for entry in self.__entries)]
+        for game in games:
+            string_list.append(f'{game.upper():^90}')
+            string_list.append('-' * 90)
+            string_list.append(f'|{"#":<3}|{"Strategy":<20}|{"Mean net":>12}|{"95% CI":>25}|{"Rounds":>12}|'
+                               f'{"Busts":>10}|')
+            for rank, entry in enumerate(self.get_leaderboard(game), start=1):
+                interval = f'[{entry.confidence_interval[0]:,.1f}, {entry.confidence_interval[1]:,.1f}]'
+                string_list.append(f'|{rank:<3}|{entry.strategy_name:<20}|{entry.mean_net:>12,.1f}|{interval:>25}|'
+                                   f'{entry.rounds:>12,}|{entry.busts:>10,}|')
+            string_list.append('-' * 90)
+        return str.join('\n', string_list)
+
+
+class Tournament:
+    """
+    Runs many Strategies against each minigame on a process pool and ranks them.
+
+    Every Strategy plays the same number of sessions of every minigame. A session starts with starting_coins coins
+    and lasts rounds_per_session rounds, or until the Strategy runs out of coins. Strategies are ranked by their mean
+    net coins won per session.
+    """
+
+    def __init__(self, strategies: dict[str, Strategy], games: tuple[str, ...] = GAMES, sessions: int = 10_000,
+                 rounds_per_session: int = 100, starting_coins: int = 1_000, seed: int = 0,
+                 workers: Optional[int] = None, sessions_per_task: int = 500):
+        """
+        Constructs a Tournament.
+
+        Args:
+            strategies (dict[str, Strategy]): The Strategies to enter, keyed by the name shown on the leaderboard.
+                Strategies must be picklable, as they are copied to worker processes.
+            games (tuple[str, ...]): The minigames to play.
+            sessions (int): The number of sessions each Strategy plays of each minigame.
+            rounds_per_session (int): The maximum number of rounds in a session.
+            starting_coins (int): The number of coins a session starts with.
+            seed (int): The seed from which the random generator of every task is derived.
+            workers (Optional[int]): The number of worker processes, or None for one per CPU.
+            sessions_per_task (int): The number of sessions played by each task submitted to the process pool.
+        """
+        self.__strategies = strategies
+        self.__games = games
+        self.__sessions = sessions
+        self.__rounds_per_session = rounds_per_session
+        self.__starting_coins = starting_coins
+        self.__seed = seed
+        self.__workers = workers
+        self.__sessions_per_task = sessions_per_task
+
+    def run(self) -> TournamentResult:
+        """Plays every session of the Tournament and returns the resulting leaderboards."""
+        totals: dict[tuple[str, str], list[int]] = {}
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            futures = []
+            task_index = 0
+            for strategy_name, strategy in self.__strategies.items():
+                for game in self.__games:
+                    totals[(strategy_name, game)] = [0, 0, 0, 0, 0]
+                    for first_session in range(0, self.__sessions, self.__sessions_per_task):
+                        sessions = min(self.__sessions_per_task, self.__sessions - first_session)
+                        future = executor.submit(_play_sessions, strategy, game, sessions, self.__rounds_per_session,
+                                                 self.__starting_coins, self.__seed * 1_000_003 + task_index)
+                        futures.append(((strategy_name, game), future))
+                        task_index += 1
+            for key, future in futures:
+                for i, value in enumerate(future.result()):
+                    totals[key][i] += value
+
+        return TournamentResult([LeaderboardEntry(strategy_name, game, *total)
+                                 for (strategy_name, game), total in totals.items()])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare betting strategies across every minigame.")
+    parser.add_argument('--sessions', type=int, default=10_000, help="sessions per strategy and minigame")
+    parser.add_argument('--rounds', type=int, default=100, help="maximum rounds per session")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    arguments = parser.parse_args()
+
+    tournament = Tournament({'Flat 10': FlatStrategy(10), 'Martingale 10': MartingaleStrategy(10),
+                             'Kelly 2%': KellyStrategy(0.02), 'Kelly advised': KellyStrategy()},
+                            sessions=arguments.sessions, rounds_per_session=arguments.rounds, seed=arguments.seed,
+                            workers=arguments.workers)
+    print(tournament.run())
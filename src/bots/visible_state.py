@@ -0,0 +1,24 @@
+from typing import Any
+from typing import Optional
+
+
+class VisibleState:
+    """
+    The information a player can see when making a decision in a minigame.
+
+    Attributes:
+        game (str): The minigame being played, one of 'blackjack', 'slots' or 'roulette'.
+        bankroll (int): The number of coins the player has, not counting coins already bet this round.
+        hand (tuple): The cards in the player's blackjack hand, empty before cards are dealt or outside blackjack.
+        dealer_upcard (Optional[Any]): The dealer's face up blackjack card, None before cards are dealt or outside
+            blackjack.
+        score (int): The blackjack score of hand, 0 outside blackjack.
+    """
+
+    def __init__(self, game: str, bankroll: int, hand: tuple = (), dealer_upcard: Optional[Any] = None,
+                 score: int = 0):
+        self.game: str = game
+        self.bankroll: int = bankroll
+        self.hand: tuple = hand
+        self.dealer_upcard: Optional[Any] = dealer_upcard
+        self.score: int = score
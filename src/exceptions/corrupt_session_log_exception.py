@@ -0,0 +1,5 @@
+class CorruptSessionLogException(Exception):
+    """A SessionLog was attempted to be decoded from bytes that are not a valid session log."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
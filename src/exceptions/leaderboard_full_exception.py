@@ -0,0 +1,5 @@
+class LeaderboardFullException(Exception):
+    """A player was attempted to be added to a SharedLeaderboard whose every slot is held by a running process."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
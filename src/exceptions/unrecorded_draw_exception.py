@@ -0,0 +1,5 @@
+class UnrecordedDrawException(Exception):
+    """A RecordingRandom was asked for a draw it does not record, and so could not be replayed."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
@@ -1,15 +1,29 @@
+import random
+import time
 from typing import Optional
 from typing import cast
 
-from game_state.game_state import GameState
-from managers.gambling_manager import GamblingManager
-from player_data import PlayerData
-from programs.abstract_program import AbstractProgram
-from programs.main_menu import MainMenu
-from programs.minigames.blackjack import BlackjackMinigame
-from programs.minigames.roulette import RouletteMinigame
-from programs.minigames.slots import SlotsMinigame
-from programs.store import Store
+from src.advisor.kelly_advisor import KellyAdvisor
+from src.analytics.outcome_recorder import OutcomeRecorder
+from src.game_state.game_state import GameState
+from src.leaderboard.abstract_leaderboard import AbstractLeaderboard
+from src.managers.gambling_manager import GamblingManager
+from src.managers.game_clock import GameClock
+from src.managers.progressive_jackpot import ProgressiveJackpot
+from src.metrics.game_metrics import GameMetrics
+from src.player_data import PlayerData
+from src.profiling.session_profiler import SessionProfiler
+from src.programs.abstract_program import AbstractProgram
+from src.programs.main_menu import MainMenu
+from src.programs.minigames.blackjack import BlackjackMinigame
+from src.programs.minigames.blackjack import card_value_map
+from src.programs.minigames.blackjack_rules import BlackjackRules
+from src.programs.minigames.blackjack_shoe import BlackjackShoe
+from src.programs.minigames.roulette import RouletteMinigame
+from src.programs.minigames.slot_machine import DEFAULT_SLOT_MACHINE
+from src.programs.minigames.slot_machine import SlotMachine
+from src.programs.minigames.slots import SlotsMinigame
+from src.programs.store import Store
 
 
 class GamblingSimulator:
@@ -22,15 +36,68 @@ class GamblingSimulator:
         game_state (GameState): The current game state of GamblingSimulator.
         current_abstract_program (Optional[AbstractProgram]): The instance of the AbstractProgram currently being used
             by GamblingSimulator, None if game_state is GameState.MENU
+        random_generator (random.Random): The source of randomness shared by every minigame of this session.
+        jackpot (Optional[ProgressiveJackpot]): The progressive jackpot of the slots minigame, None if slots has no
+            progressive jackpot.
+        slot_machine (SlotMachine): The reel strips and paytable the slots minigame is played on.
+        blackjack_rules (BlackjackRules): The house rules the blackjack minigame is played by.
+        blackjack_shoe (BlackjackShoe): The shoe every hand of blackjack in this session is dealt from.
+        game_clock (GameClock): The clock counting the rounds played in this session.
+        advisor (KellyAdvisor): The advisor suggesting bets at every bet prompt of this session.
+        metrics (Optional[GameMetrics]): The metrics this session reports to, None if metrics are not collected.
+        profiler (Optional[SessionProfiler]): The profiler of this session's input handling, None if this session is
+            not being profiled.
+        outcome_recorder (Optional[OutcomeRecorder]): The recorder of the outcome of every round of this session, None
+            if outcomes are not recorded.
+        session_id (int): The random id of this session in recorded outcomes.
     """
 
-    def __init__(self):
-        """Initializes the GamblingSimulator class with 1,000 initial coins"""
-        self.player_data: PlayerData = PlayerData()
+    def __init__(self, random_generator: Optional[random.Random] = None,
+                 jackpot: Optional[ProgressiveJackpot] = None, metrics: Optional[GameMetrics] = None,
+                 leaderboard: Optional[AbstractLeaderboard] = None, slot_machine: SlotMachine = DEFAULT_SLOT_MACHINE,
+                 outcome_recorder: Optional[OutcomeRecorder] = None, blackjack_rules: Optional[BlackjackRules] = None):
+        """
+        Initializes the GamblingSimulator class with 1,000 initial coins.
+
+        Args:
+            random_generator (Optional[random.Random]): The source of randomness for all card draws, wheel spins and
+                reel spins of this session. A fresh random.Random is used if None.
+            jackpot (Optional[ProgressiveJackpot]): The progressive jackpot shared with other sessions, or None.
+            metrics (Optional[GameMetrics]): The metrics shared with other sessions, or None.
+            leaderboard (Optional[AbstractLeaderboard]): The leaderboard shared with other sessions, or None. The player
+                leaves the leaderboard when they quit.
+            slot_machine (SlotMachine): The reel strips and paytable of the slots minigame.
+            outcome_recorder (Optional[OutcomeRecorder]): The recorder shared with other sessions, or None.
+            blackjack_rules (Optional[BlackjackRules]): The house rules of the blackjack minigame, BlackjackRules() if
+                None.
+        """
+        self.player_data: PlayerData = PlayerData(leaderboard)
         self.game_state: GameState = GameState.MENU
         self.current_abstract_program: Optional[AbstractProgram] = MainMenu(self.player_data)
+        self.random_generator: random.Random = random_generator if random_generator is not None else random.Random()
+        self.jackpot: Optional[ProgressiveJackpot] = jackpot
+        self.slot_machine: SlotMachine = slot_machine
+        self.blackjack_rules: BlackjackRules = blackjack_rules if blackjack_rules is not None else BlackjackRules()
+        self.blackjack_shoe: BlackjackShoe = BlackjackShoe(list(card_value_map.keys()), self.random_generator,
+                                                           self.blackjack_rules.decks)
+        self.game_clock: GameClock = GameClock()
+        self.metrics: Optional[GameMetrics] = metrics
+        self.advisor: KellyAdvisor = KellyAdvisor(self.slot_machine, self.blackjack_rules)
+        self.profiler: Optional[SessionProfiler] = None
+        self.outcome_recorder: Optional[OutcomeRecorder] = outcome_recorder
+        self.session_id: int = OutcomeRecorder.new_session_id()
+        self.__closed = False
+
+        self.__gambling_manager = GamblingManager(self.player_data, self.game_clock, self.metrics, self.advisor,
+                                                  self.outcome_recorder, self.session_id)
 
-        self.__gambling_manager = GamblingManager(self.player_data)
+        if self.metrics is not None:
+            # Look up labelled metrics once so that processing input never has to
+            self.__active_sessions = {state: self.metrics.active_sessions.labels(state.name.lower())
+                                      for state in GameState}
+            self.__input_latency = {state: self.metrics.input_latency.labels(state.name.lower())
+                                    for state in GameState}
+            self.__active_sessions[self.game_state].inc()
 
     def execute_program(self) -> None:
         """Starts the primary gameplay loop of GamblingSimulator."""
@@ -46,7 +113,78 @@ class GamblingSimulator:
             user_input = input()
             playing = not self.process_user_input(user_input)
 
+    def start_profiling(self, profiler: Optional[SessionProfiler] = None) -> SessionProfiler:
+        """
+        Profiles the handling of every input of this session from now on, until stop_profiling is called. Profiling
+        can be switched on at any point of a session, and only affects this session.
+
+        Args:
+            profiler (Optional[SessionProfiler]): The profiler to record into. A new SessionProfiler is used if None.
+
+        Returns:
+            SessionProfiler: The profiler now recording this session.
+        """
+        if self.profiler is not None:
+            self.profiler.stop()
+        self.profiler = profiler if profiler is not None else SessionProfiler()
+        self.profiler.start()
+        return self.profiler
+
+    def stop_profiling(self) -> Optional[SessionProfiler]:
+        """
+        Stops profiling this session.
+
+        Returns:
+            Optional[SessionProfiler]: The profiler that was recording this session, ready to be written, or None if
+                the session was not being profiled.
+        """
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.stop()
+        return profiler
+
+    def close(self) -> None:
+        """
+        Ends this session: removes the player from the leaderboard and the session from the active sessions metric.
+        Quitting closes the session; callers must close a session that ends any other way, such as at the end of input
+        or on an error. Closing a closed session does nothing.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        self.player_data.leave_leaderboard()
+        if self.metrics is not None:
+            self.__active_sessions[self.game_state].dec()
+
     def process_user_input(self, user_input: str) -> bool:
+        """
+        Passes user_input to the current AbstractProgram, switching programs as they complete.
+
+        Returns:
+            bool: True if the player has quit, False otherwise.
+        """
+        if self.profiler is not None:
+            return self.profiler.run(type(self.current_abstract_program).__name__, self.__observe_user_input,
+                                     user_input)
+        return self.__observe_user_input(user_input)
+
+    def __observe_user_input(self, user_input: str) -> bool:
+        """Processes user_input, reporting its latency and any change of game state to metrics."""
+        if self.metrics is None:
+            return self.__process_user_input(user_input)
+
+        previous_game_state = self.game_state
+        start_time = time.perf_counter()
+        try:
+            return self.__process_user_input(user_input)
+        finally:
+            # Runs even if the input raised, so the session is counted in the state it was left in
+            self.__input_latency[previous_game_state].observe(time.perf_counter() - start_time)
+            if not self.__closed and self.game_state is not previous_game_state:
+                self.__active_sessions[previous_game_state].dec()
+                self.__active_sessions[self.game_state].inc()
+
+    def __process_user_input(self, user_input: str) -> bool:
         match self.game_state:
             case GameState.MENU:
                 selection_made = self.current_abstract_program.process_user_input(user_input)
@@ -55,25 +193,33 @@ class GamblingSimulator:
                     match selection:
                         case 'blackjack':
                             self.game_state = GameState.MINIGAME
-                            self.current_abstract_program = BlackjackMinigame(self.__gambling_manager)
+                            self.current_abstract_program = BlackjackMinigame(self.__gambling_manager,
+                                                                              self.random_generator,
+                                                                              self.blackjack_rules,
+                                                                              self.blackjack_shoe)
                         case 'slots':
                             self.game_state = GameState.MINIGAME
-                            self.current_abstract_program = SlotsMinigame(self.__gambling_manager)
+                            self.current_abstract_program = SlotsMinigame(self.__gambling_manager,
+                                                                          self.random_generator, self.jackpot,
+                                                                          self.slot_machine)
                         case 'roulette':
                             self.game_state = GameState.MINIGAME
-                            self.current_abstract_program = RouletteMinigame(self.__gambling_manager)
+                            self.current_abstract_program = RouletteMinigame(self.__gambling_manager,
+                                                                             self.random_generator)
                         case 'store':
                             self.game_state = GameState.STORE
-                            self.current_abstract_program = Store(self.player_data)
+                            self.current_abstract_program = Store(self.player_data, self.game_clock, self.metrics)
                         case 'credits':
                             pass # todo implement credits
                         case 'quit':
+                            self.close()
                             print("Thanks for playing!")
                             return True
                     self.current_abstract_program.execute_program()
             case GameState.MINIGAME:
                 minigame_complete = self.current_abstract_program.process_user_input(user_input)
                 if minigame_complete:
+                    self.game_clock.catch_up()
                     self.game_state = GameState.MENU
                     self.current_abstract_program = MainMenu(self.player_data)
                     self.current_abstract_program.execute_program()
@@ -1,4 +1,9 @@
 from abc import ABC
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.managers.game_clock import GameClock
+    from src.player_data import PlayerData
 
 
 class AbstractItem(ABC):
@@ -29,5 +34,16 @@ class AbstractItem(ABC):
     def get_purchase_message(self) -> str:
         return self.__purchase_message
 
+    def get_debt(self) -> int:
+        """Returns the number of coins the owner of the item owes because of it. Most items are not debts."""
+        return 0
+
+    def on_purchase(self, player_data: 'PlayerData', game_clock: 'GameClock') -> None:
+        """
+        Called once the item has been added to the player's inventory. Items with effects that recur over time, such
+        as interest or expiry, schedule them on game_clock. By default, an item has no recurring effects.
+        """
+        pass
+
     def __str__(self):
         return str.join('\n', self.__picture)
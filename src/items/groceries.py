@@ -1,18 +1,24 @@
+from src.assets.asset_pack import get_asset_pack
 from src.items.abstract_item import AbstractItem
+from src.managers.game_clock import GameClock
+from src.player_data import PlayerData
+
+SHELF_LIFE = 14
 
 
 class Groceries(AbstractItem):
     """
-    Groceries. They cost 30.
+    Groceries. They cost 30, and go bad after 14 rounds.
     """
 
     def __init__(self):
         purchase_message = '"Hey, that looks pretty tasty!"'
-        picture: tuple[str, ...] = tuple(str(x) for x in r"""
-  ,--./,-.  
- / #      \ 
-|          |
- \        / 
-  `._,._,   
-        """.split('\n')) # credit to Hayley Jane Wakenshaw for art
-        super().__init__("Groceries", 30, purchase_message, picture)
\ No newline at end of file
+        picture: tuple[str, ...] = get_asset_pack().get_lines('groceries')
+        super().__init__("Groceries", 30, purchase_message, picture)
+
+    def on_purchase(self, player_data: PlayerData, game_clock: GameClock) -> None:
+        def expire(due_round: int) -> None:
+            player_data.remove_item(self)
+            print("\nYour groceries went bad.")
+
+        game_clock.schedule_in(SHELF_LIFE, expire)
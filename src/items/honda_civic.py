@@ -1,3 +1,4 @@
+from src.assets.asset_pack import get_asset_pack
 from src.items.abstract_item import AbstractItem
 
 
@@ -8,12 +9,5 @@ class HondaCivic(AbstractItem):
 
     def __init__(self):
         purchase_message = '"Woah dude! That\'s a sick ride. Congrats!"'
-        picture: tuple[str, ...] = tuple(str(x) for x in r"""
-          _______      
-         //  ||\ \     
- \ _____//___||_\ \___ 
-   )  _          _    \
- / |_/ \________/ \___|
-     \_/        \_/    
-        """.split('\n')) # credit to Colin Douthwaite for art
+        picture: tuple[str, ...] = get_asset_pack().get_lines('honda_civic')
         super().__init__("2008 Honda Civic", 7072, purchase_message, picture)
\ No newline at end of file
@@ -1,17 +1,49 @@
+from src.assets.asset_pack import get_asset_pack
 from src.items.abstract_item import AbstractItem
+from src.managers.game_clock import GameClock
+from src.player_data import PlayerData
+
+# A round of gambling is treated as one day
+ROUNDS_PER_YEAR = 365
+ANNUAL_PERCENTAGE_YIELD = 0.38
+STATEMENT_PERIOD = 30
 
 
 class Loan(AbstractItem):
     """
     A special AbstractItem with negative price - but steep interest rates.
+
+    Interest compounds at 38% APY on the outstanding balance. Every 30 rounds a statement charges the interest accrued
+    since the last statement to the player's coins; any interest the player cannot pay is added to the balance.
     """
 
     def __init__(self):
         purchase_message = '*Sigh "Just sign there..."'
-        picture: tuple[str, ...] = tuple(str(x) for x in r"""
-------\ 
-| 38% | 
-\ APY \ 
- \------
-        """.split('\n'))
-        super().__init__("Predatory Loan", -2500, purchase_message, picture)
\ No newline at end of file
+        picture: tuple[str, ...] = get_asset_pack().get_lines('loan')
+        super().__init__("Predatory Loan", -2500, purchase_message, picture)
+        self.__balance: float = 2500
+        self.__last_accrual_round: int = 0
+
+    def get_balance(self, current_round: int) -> float:
+        """
+        Returns the amount owed on the loan as of current_round, including interest accrued since the last statement.
+        """
+        elapsed_years = (current_round - self.__last_accrual_round) / ROUNDS_PER_YEAR
+        return self.__balance * (1 + ANNUAL_PERCENTAGE_YIELD) ** elapsed_years
+
+    def get_debt(self) -> int:
+        return round(self.__balance)
+
+    def on_purchase(self, player_data: PlayerData, game_clock: GameClock) -> None:
+        self.__last_accrual_round = game_clock.get_current_round()
+
+        def charge_interest(due_round: int) -> None:
+            interest = round(self.get_balance(due_round) - self.__balance)
+            interest_paid = min(interest, max(player_data.get_player_coins(), 0))
+            self.__balance += interest - interest_paid
+            self.__last_accrual_round = due_round
+            player_data.add_player_coins(-interest_paid)
+            print(f"\nLoan statement: {interest_paid:,} coins of interest charged. You owe {self.__balance:,.0f}.")
+            game_clock.schedule(due_round + STATEMENT_PERIOD, charge_interest)
+
+        game_clock.schedule_in(STATEMENT_PERIOD, charge_interest)
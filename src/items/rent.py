@@ -1,20 +1,31 @@
+from src.assets.asset_pack import get_asset_pack
 from src.items.abstract_item import AbstractItem
+from src.managers.game_clock import GameClock
+from src.player_data import PlayerData
+
+RENT_PERIOD = 30
 
 
 class Rent(AbstractItem):
     """
     Represents paying rent. Yay!
+
+    Rent comes due again every 30 rounds. If the player cannot pay, they are evicted and lose their trophy.
     """
 
     def __init__(self):
         purchase_message = "You paid rent! 🎉 Your spouse and kid are going to be so proud!"
-        picture: tuple[str, ...] = tuple(str(x) for x in r"""
-  _______
- |WORLDS |✨
-(| BEST  |)
- |RENTER |
-  \     /
-  `---'
-  _|_|_
-""".split('\n'))
-        super().__init__("Rent", 670, purchase_message, picture)
\ No newline at end of file
+        picture: tuple[str, ...] = get_asset_pack().get_lines('rent')
+        super().__init__("Rent", 670, purchase_message, picture)
+
+    def on_purchase(self, player_data: PlayerData, game_clock: GameClock) -> None:
+        def charge_rent(due_round: int) -> None:
+            if player_data.get_player_coins() >= self.get_price():
+                player_data.add_player_coins(-self.get_price())
+                print(f"\nRent is due! Paid {self.get_price():,} coins.")
+                game_clock.schedule(due_round + RENT_PERIOD, charge_rent)
+            else:
+                player_data.remove_item(self)
+                print("\nYou couldn't make rent and were evicted...")
+
+        game_clock.schedule_in(RENT_PERIOD, charge_rent)
@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractLeaderboard(ABC):
+    """
+    An abstract representation of a leaderboard ranking active players by net worth: their coins less any debt they
+    owe. Players report changes to their net worth as they happen, and are identified by the id add_player returns.
+    """
+
+    @abstractmethod
+    def add_player(self, net_worth: int) -> int:
+        """
+        Subclasses must implement this method to add a player with the given net worth.
+        :return: The id the player is identified by in later calls.
+        """
+        pass
+
+    @abstractmethod
+    def update(self, player_id: int, net_worth: int) -> None:
+        """Subclasses must implement this method to record a new net worth for the player with id player_id."""
+        pass
+
+    @abstractmethod
+    def remove_player(self, player_id: int) -> None:
+        """
+        Subclasses must implement this method to remove the player with id player_id, i.e. when their session ends.
+        """
+        pass
+
+    @abstractmethod
+    def get_rank(self, player_id: int) -> int:
+        """
+        Subclasses must implement this method to return the rank of the player with id player_id: one more than the
+        number of players with a strictly greater net worth, so rank 1 is the richest player and players with equal
+        net worths share a rank.
+        """
+        pass
+
+    @abstractmethod
+    def get_player_count(self) -> int:
+        """Subclasses must implement this method to return the number of players on the leaderboard."""
+        pass
+
+    @abstractmethod
+    def get_richest(self, k: int) -> list[tuple[int, int]]:
+        """
+        Subclasses must implement this method to return the ids and net worths of the k richest players, richest
+        first.
+        """
+        pass
+
+    @abstractmethod
+    def get_most_indebted(self, k: int) -> list[tuple[int, int]]:
+        """
+        Subclasses must implement this method to return the ids and net worths of the k players with the lowest net
+        worth, most indebted first.
+        """
+        pass
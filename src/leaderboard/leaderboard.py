@@ -0,0 +1,73 @@
+import itertools
+import threading
+
+from src.leaderboard.abstract_leaderboard import AbstractLeaderboard
+from src.leaderboard.order_statistic_tree import OrderStatisticTree
+
+
+class Leaderboard(AbstractLeaderboard):
+    """
+    Ranks every active player of this process by net worth: their coins less any debt they owe.
+
+    Players report changes to their net worth as they happen, so the Leaderboard is kept up to date incrementally.
+    Net worths are kept in an OrderStatisticTree, so updates, rank queries and top-K queries take O(log n) time (O(k log
+    n) for top-K) rather than a sort of every player. A Leaderboard may be shared by sessions on different threads of
+    one process, such as the sessions of the load generator; SharedLeaderboard ranks players across processes.
+    """
+
+    def __init__(self):
+        self.__tree = OrderStatisticTree()
+        self.__net_worths: dict[int, int] = {}
+        self.__player_ids = itertools.count()
+        self.__lock = threading.Lock()
+
+    def add_player(self, net_worth: int) -> int:
+        """
+        Adds a player with the given net worth to the Leaderboard.
+        :return: The id the player is identified by in later calls.
+        """
+        with self.__lock:
+            player_id = next(self.__player_ids)
+            self.__net_worths[player_id] = net_worth
+            self.__tree.insert((net_worth, player_id))
+        return player_id
+
+    def update(self, player_id: int, net_worth: int) -> None:
+        """Records a new net worth for the player with id player_id."""
+        with self.__lock:
+            old_net_worth = self.__net_worths[player_id]
+            if old_net_worth == net_worth:
+                return
+            self.__tree.remove((old_net_worth, player_id))
+            self.__tree.insert((net_worth, player_id))
+            self.__net_worths[player_id] = net_worth
+
+    def remove_player(self, player_id: int) -> None:
+        """Removes the player with id player_id, i.e. when their session ends."""
+        with self.__lock:
+            self.__tree.remove((self.__net_worths.pop(player_id), player_id))
+
+    def get_rank(self, player_id: int) -> int:
+        """
+        Returns the rank of the player with id player_id: one more than the number of players with a strictly greater
+        net worth, so rank 1 is the richest player and players with equal net worths share a rank.
+        """
+        with self.__lock:
+            # Net worths are whole coins, so (net_worth + 1,) sorts after every key of the player's net worth
+            return len(self.__tree) - self.__tree.index((self.__net_worths[player_id] + 1,)) + 1
+
+    def get_player_count(self) -> int:
+        """Returns the number of players on the Leaderboard."""
+        with self.__lock:
+            return len(self.__net_worths)
+
+    def get_richest(self, k: int) -> list[tuple[int, int]]:
+        """Returns the ids and net worths of the k richest players, richest first."""
+        with self.__lock:
+            size = len(self.__tree)
+            return [tuple(reversed(self.__tree.select(size - 1 - i))) for i in range(min(k, size))]
+
+    def get_most_indebted(self, k: int) -> list[tuple[int, int]]:
+        """Returns the ids and net worths of the k players with the lowest net worth, most indebted first."""
+        with self.__lock:
+            return [tuple(reversed(self.__tree.select(i))) for i in range(min(k, len(self.__tree)))]
@@ -0,0 +1,142 @@
+import random
+from typing import Any
+from typing import Optional
+
+
+class _Node:
+    """A node of an OrderStatisticTree, which also records the size of the subtree rooted at it."""
+    __slots__ = ('key', 'priority', 'size', 'left', 'right')
+
+    def __init__(self, key: Any, priority: float):
+        self.key = key
+        self.priority = priority
+        self.size = 1
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _update_size(node: _Node) -> None:
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+
+def _split(node: Optional[_Node], key: Any) -> tuple[Optional[_Node], Optional[_Node]]:
+    """Splits the subtree rooted at node into the keys less than key and the keys greater than or equal to key."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update_size(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update_size(node)
+    return left, node
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Merges two subtrees, where every key in left is less than every key in right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update_size(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update_size(right)
+    return right
+
+
+class OrderStatisticTree:
+    """
+    A sorted collection of distinct, comparable keys that supports finding the position of a key and the key at a
+    position, in addition to insertion and removal.
+
+    The tree is a treap whose nodes record the sizes of their subtrees. Every operation takes O(log n) expected time.
+    """
+
+    def __init__(self, random_generator: Optional[random.Random] = None):
+        self.__root: Optional[_Node] = None
+        self.__random = random_generator if random_generator is not None else random.Random()
+
+    def insert(self, key: Any) -> None:
+        """
+        Inserts key into the tree.
+        :exception KeyError: If the tree already contains key.
+        """
+        if key in self:
+            raise KeyError(key)
+        left, right = _split(self.__root, key)
+        self.__root = _merge(_merge(left, _Node(key, self.__random.random())), right)
+
+    def remove(self, key: Any) -> None:
+        """
+        Removes key from the tree.
+        :exception KeyError: If the tree does not contain key.
+        """
+        parent: Optional[_Node] = None
+        node = self.__root
+        path: list[_Node] = []
+        while node is not None and node.key != key:
+            path.append(node)
+            parent = node
+            node = node.left if key < node.key else node.right
+        if node is None:
+            raise KeyError(key)
+
+        replacement = _merge(node.left, node.right)
+        if parent is None:
+            self.__root = replacement
+        elif parent.left is node:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        for ancestor in path:
+            ancestor.size -= 1
+
+    def index(self, key: Any) -> int:
+        """
+        Returns the number of keys in the tree less than key, which is the position of key if the tree contains it.
+        """
+        position = 0
+        node = self.__root
+        while node is not None:
+            if key <= node.key:
+                node = node.left
+            else:
+                position += _size(node.left) + 1
+                node = node.right
+        return position
+
+    def select(self, position: int) -> Any:
+        """
+        Returns the key at position, where position 0 is the smallest key.
+        :exception IndexError: If position is out of range.
+        """
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        node = self.__root
+        while True:
+            left_size = _size(node.left)
+            if position < left_size:
+                node = node.left
+            elif position == left_size:
+                return node.key
+            else:
+                position -= left_size + 1
+                node = node.right
+
+    def __contains__(self, key: Any) -> bool:
+        node = self.__root
+        while node is not None:
+            if key == node.key:
+                return True
+            node = node.left if key < node.key else node.right
+        return False
+
+    def __len__(self) -> int:
+        return _size(self.__root)
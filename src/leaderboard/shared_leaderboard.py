@@ -0,0 +1,126 @@
+import contextlib
+import heapq
+import mmap
+import os
+import struct
+import threading
+from typing import Iterator
+
+from src.exceptions.leaderboard_full_exception import LeaderboardFullException
+from src.leaderboard.abstract_leaderboard import AbstractLeaderboard
+from src.managers.file_lock import lock_file
+from src.managers.file_lock import unlock_file
+
+# The leaderboard file shared by every game of the user, wherever the game was started from
+DEFAULT_LEADERBOARD_PATH = os.path.join(os.path.expanduser('~'), '.gambling_simulator', 'leaderboard.bin')
+# Each slot holds the id of the process hosting a player, 0 if the slot is free, and the player's net worth
+_SLOT_FORMAT = '<qq'
+_SLOT_SIZE = struct.calcsize(_SLOT_FORMAT)
+# Where locks are byte ranges, the byte locked is past every slot of files of any capacity, so the slots stay readable
+_LOCK_OFFSET = 1 << 40
+
+
+def _is_running(process_id: int) -> bool:
+    """Returns True unless the process with id process_id is known to have ended."""
+    if os.name == 'nt':
+        # os.kill would send the process a signal on Windows rather than only check that it exists
+        return True
+    try:
+        os.kill(process_id, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class SharedLeaderboard(AbstractLeaderboard):
+    """
+    Ranks the players of every process sharing a leaderboard file by net worth, as Leaderboard ranks the players of a
+    single process.
+
+    main.py hosts a single session per process, so players on different games are only ranked against each other
+    through a file. Every player holds a slot of a small memory-mapped file, and every access holds a threading.Lock and
+    an exclusive lock of the file, as ProgressiveJackpot does. The file holds a slot per game running at once, not per
+    player ever seen, so ranks and top-K queries scan every slot rather than keep an order-statistic structure. Slots of
+    processes that ended without removing their players, such as after a crash, are freed as they are scanned.
+    """
+
+    def __init__(self, path: str = DEFAULT_LEADERBOARD_PATH, capacity: int = 1_024):
+        """
+        Constructs a SharedLeaderboard backed by the file at path, creating the file and its directory with capacity
+        free slots if it does not exist.
+        """
+        self.__lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.__file = open(path, 'a+b')
+        with self.__locked():
+            size = os.fstat(self.__file.fileno()).st_size
+            if size < capacity * _SLOT_SIZE:
+                self.__file.truncate(capacity * _SLOT_SIZE)
+                size = capacity * _SLOT_SIZE
+            self.__slots = mmap.mmap(self.__file.fileno(), size - size % _SLOT_SIZE)
+        self.__capacity = len(self.__slots) // _SLOT_SIZE
+
+    def add_player(self, net_worth: int) -> int:
+        """
+        Adds a player of this process with the given net worth to the leaderboard.
+        :return: The id the player is identified by in later calls.
+        :exception LeaderboardFullException: If every slot is held by a running process.
+        """
+        with self.__locked():
+            for player_id, (process_id, _) in enumerate(struct.iter_unpack(_SLOT_FORMAT, self.__slots)):
+                if process_id == 0 or not _is_running(process_id):
+                    struct.pack_into(_SLOT_FORMAT, self.__slots, player_id * _SLOT_SIZE, os.getpid(), net_worth)
+                    return player_id
+        raise LeaderboardFullException(f"All {self.__capacity:,} slots of the leaderboard are taken.")
+
+    def update(self, player_id: int, net_worth: int) -> None:
+        with self.__locked():
+            struct.pack_into(_SLOT_FORMAT, self.__slots, player_id * _SLOT_SIZE, os.getpid(), net_worth)
+
+    def remove_player(self, player_id: int) -> None:
+        with self.__locked():
+            struct.pack_into(_SLOT_FORMAT, self.__slots, player_id * _SLOT_SIZE, 0, 0)
+
+    def get_rank(self, player_id: int) -> int:
+        net_worths = self.__get_net_worths()
+        net_worth = net_worths[player_id]
+        return sum(other_net_worth > net_worth for other_net_worth in net_worths.values()) + 1
+
+    def get_player_count(self) -> int:
+        return len(self.__get_net_worths())
+
+    def get_richest(self, k: int) -> list[tuple[int, int]]:
+        return heapq.nlargest(k, self.__get_net_worths().items(), key=lambda item: item[1])
+
+    def get_most_indebted(self, k: int) -> list[tuple[int, int]]:
+        return heapq.nsmallest(k, self.__get_net_worths().items(), key=lambda item: item[1])
+
+    def close(self) -> None:
+        """Releases the leaderboard file. Players still on the leaderboard stay on it until their process ends."""
+        self.__slots.close()
+        self.__file.close()
+
+    def __get_net_worths(self) -> dict[int, int]:
+        """Returns the net worth of every player by id, freeing the slots of processes that have ended."""
+        net_worths = {}
+        with self.__locked():
+            for player_id, (process_id, net_worth) in enumerate(struct.iter_unpack(_SLOT_FORMAT, self.__slots)):
+                if process_id == 0:
+                    continue
+                if _is_running(process_id):
+                    net_worths[player_id] = net_worth
+                else:
+                    struct.pack_into(_SLOT_FORMAT, self.__slots, player_id * _SLOT_SIZE, 0, 0)
+        return net_worths
+
+    @contextlib.contextmanager
+    def __locked(self) -> Iterator[None]:
+        """Holds the leaderboard's threading.Lock and the lock of its file for the duration of the context."""
+        with self.__lock:
+            lock_file(self.__file, _LOCK_OFFSET)
+            try:
+                yield
+            finally:
+                unlock_file(self.__file, _LOCK_OFFSET)
@@ -0,0 +1,55 @@
+import math
+
+_MIN_LATENCY = 1e-7
+_MAX_LATENCY = 100.0
+# Each bucket is 1% wider than the last, so any percentile is reported within 1% of the true latency
+_BUCKET_RATIO = 1.01
+_LOG_BUCKET_RATIO = math.log(_BUCKET_RATIO)
+_BUCKET_COUNT = math.ceil(math.log(_MAX_LATENCY / _MIN_LATENCY) / _LOG_BUCKET_RATIO) + 1
+
+
+class LatencyHistogram:
+    """
+    Counts latencies into logarithmically spaced buckets between 100 nanoseconds and 100 seconds.
+
+    A LatencyHistogram uses the same small, fixed amount of memory no matter how many latencies it records, and
+    histograms recorded by different threads or processes can be merged by adding their counts.
+    """
+
+    def __init__(self):
+        self.__counts: list[int] = [0] * _BUCKET_COUNT
+        self.__total_count = 0
+
+    def record(self, latency: float) -> None:
+        """Records a single latency, in seconds."""
+        if latency <= _MIN_LATENCY:
+            index = 0
+        else:
+            index = min(int(math.log(latency / _MIN_LATENCY) / _LOG_BUCKET_RATIO) + 1, _BUCKET_COUNT - 1)
+        self.__counts[index] += 1
+        self.__total_count += 1
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Adds every latency recorded by other to this LatencyHistogram."""
+        for index, count in enumerate(other.__counts):
+            self.__counts[index] += count
+        self.__total_count += other.__total_count
+
+    def get_count(self) -> int:
+        """Returns the number of latencies recorded."""
+        return self.__total_count
+
+    def get_percentile(self, percentile: float) -> float:
+        """
+        Returns the latency, in seconds, that percentile percent of recorded latencies did not exceed.
+        :exception ValueError: If no latencies have been recorded.
+        """
+        if self.__total_count == 0:
+            raise ValueError("No latencies have been recorded.")
+        rank = max(1, math.ceil(self.__total_count * percentile / 100))
+        cumulative_count = 0
+        for index, count in enumerate(self.__counts):
+            cumulative_count += count
+            if cumulative_count >= rank:
+                return _MIN_LATENCY * _BUCKET_RATIO ** index
+        return _MAX_LATENCY
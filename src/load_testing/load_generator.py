@@ -0,0 +1,253 @@
+import argparse
+import contextlib
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.analytics.outcome_recorder import OutcomeRecorder
+from src.assets.asset_pack import get_asset_pack
+from src.gambling_simulator import GamblingSimulator
+from src.game_state.game_state import GameState
+from src.leaderboard.leaderboard import Leaderboard
+from src.load_testing.latency_histogram import LatencyHistogram
+from src.load_testing.random_input_grammar import RandomInputGrammar
+
+# Processes are given this long to start before the load test begins, so that every process starts together
+_START_DELAY = 1.0
+
+
+def _get_label(simulator: GamblingSimulator) -> str:
+    """Returns the label latencies of simulator's next input are recorded under, i.e. 'menu' or 'minigame:slots'."""
+    label = simulator.game_state.name.lower()
+    if simulator.game_state is GameState.MINIGAME:
+        label += ':' + type(simulator.current_abstract_program).__name__.removesuffix('Minigame').lower()
+    return label
+
+
+def _drive_sessions(session_indices: list[int], total_sessions: int, start_time: float, duration: float,
+                    ramp_up: float, seed: int, histograms: dict[str, LatencyHistogram],
+                    inputs_per_second: list[int], outcome_recorder: Optional[OutcomeRecorder],
+                    leaderboard: Leaderboard) -> None:
+    """
+    Drives the given sessions round-robin from a single thread until the load test ends. Each session joins the load
+    test at its point in the ramp up, and is ranked on leaderboard.
+    """
+    pending_sessions = sorted((start_time + ramp_up * index / total_sessions, index) for index in session_indices)
+    active_sessions: list[tuple[GamblingSimulator, RandomInputGrammar]] = []
+    end_time = start_time + duration
+    perf_counter = time.perf_counter
+
+    now = time.time()
+    while now < end_time:
+        while pending_sessions and pending_sessions[0][0] <= now:
+            session_index = pending_sessions.pop(0)[1]
+            session_random = random.Random(seed * 1_000_003 + session_index)
+            simulator = GamblingSimulator(random.Random(session_random.getrandbits(64)), leaderboard=leaderboard,
+                                          outcome_recorder=outcome_recorder)
+            simulator.current_abstract_program.execute_program()
+            active_sessions.append((simulator, RandomInputGrammar(session_random)))
+        if not active_sessions:
+            if not pending_sessions:
+                # This thread was given no sessions to drive
+                break
+            time.sleep(min(pending_sessions[0][0], end_time) - now)
+            now = time.time()
+            continue
+
+        for simulator, grammar in active_sessions:
+            user_input = grammar.next_input(simulator)
+            label = _get_label(simulator)
+            input_start = perf_counter()
+            simulator.process_user_input(user_input)
+            latency = perf_counter() - input_start
+            histogram = histograms.get(label)
+            if histogram is None:
+                histogram = histograms[label] = LatencyHistogram()
+            histogram.record(latency)
+        now = time.time()
+        second = int(now - start_time)
+        if second < len(inputs_per_second):
+            inputs_per_second[second] += len(active_sessions)
+
+    for simulator, _ in active_sessions:
+        simulator.close()
+
+
+def _run_worker(process_index: int, processes: int, threads: int, sessions_per_thread: int, start_time: float,
+                duration: float, ramp_up: float, seed: int,
+                outcomes_directory: Optional[str]) -> tuple[dict[str, LatencyHistogram], list[int]]:
+    """
+    Runs one process of the load test, with sessions_per_thread sessions on each of threads threads, all ranked on one
+    Leaderboard. If outcomes_directory is not None, every round is recorded into a dataset of this process in a
+    subdirectory of it.
+
+    Returns:
+        tuple[dict[str, LatencyHistogram], list[int]]: The latency histograms of the process by label and the number
+            of inputs it processed in each second of the load test.
+    """
+    outcome_recorder = None
+    if outcomes_directory is not None:
+        outcome_recorder = OutcomeRecorder(os.path.join(outcomes_directory, f'process-{process_index:03d}'))
+    leaderboard = Leaderboard()
+    total_sessions = processes * threads * sessions_per_thread
+    thread_histograms: list[dict[str, LatencyHistogram]] = [{} for _ in range(threads)]
+    thread_inputs_per_second = [[0] * math.ceil(duration) for _ in range(threads)]
+    worker_threads = []
+    for thread_index in range(threads):
+        # Interleave session indices so every process and thread ramps up at the same rate
+        session_indices = [session * processes * threads + process_index * threads + thread_index
+                           for session in range(sessions_per_thread)]
+        worker_threads.append(threading.Thread(target=_drive_sessions, args=(
+            session_indices, total_sessions, start_time, duration, ramp_up, seed, thread_histograms[thread_index],
+            thread_inputs_per_second[thread_index], outcome_recorder, leaderboard)))
+    # The game prints constantly; none of it is wanted during a load test
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for worker_thread in worker_threads:
+            worker_thread.start()
+        for worker_thread in worker_threads:
+            worker_thread.join()
+    if outcome_recorder is not None:
+        outcome_recorder.close()
+
+    histograms: dict[str, LatencyHistogram] = {}
+    for thread_histogram in thread_histograms:
+        for label, histogram in thread_histogram.items():
+            histograms.setdefault(label, LatencyHistogram()).merge(histogram)
+    inputs_per_second = [sum(counts) for counts in zip(*thread_inputs_per_second)]
+    return histograms, inputs_per_second
+
+
+class LoadTestResult:
+    """
+    The throughput and latency measured by a LoadGenerator.
+
+    The __str__ method of a LoadTestResult returns a report of sustained throughput, latency percentiles per GameState
+    and per minigame, and throughput against the number of active sessions for every second of the load test.
+    """
+
+    def __init__(self, histograms: dict[str, LatencyHistogram], inputs_per_second: list[int], total_sessions: int,
+                 ramp_up: float):
+        self.__histograms = histograms
+        self.__inputs_per_second = inputs_per_second
+        self.__total_sessions = total_sessions
+        self.__ramp_up = ramp_up
+
+    def get_sustained_throughput(self) -> float:
+        """Returns the mean number of inputs processed per second once every session had joined the load test."""
+        sustained_seconds = self.__inputs_per_second[math.ceil(self.__ramp_up):]
+        if not sustained_seconds:
+            return 0.0
+        return sum(sustained_seconds) / len(sustained_seconds)
+
+    def get_latency_histogram(self, label: str) -> LatencyHistogram:
+        """
+        Returns the latencies recorded under label. Labels are GameState names ('menu', 'minigame', 'store') and
+        minigame names ('minigame:blackjack', 'minigame:slots', 'minigame:roulette').
+        """
+        if label == 'minigame':
+            histogram = LatencyHistogram()
+            for minigame_label, minigame_histogram in self.__histograms.items():
+                if minigame_label.startswith('minigame:'):
+                    histogram.merge(minigame_histogram)
+            return histogram
+        return self.__histograms.get(label, LatencyHistogram())
+
+    def get_active_sessions(self, second: int) -> int:
+        """Returns the number of sessions that had joined the load test by the end of the given second."""
+        if self.__ramp_up <= 0:
+            return self.__total_sessions
+        return min(self.__total_sessions, math.ceil(self.__total_sessions * (second + 1) / self.__ramp_up))
+
+    def __str__(self) -> str:
+        string_list = [f'Sustained throughput: {self.get_sustained_throughput():,.0f} inputs/s', '',
+                       f'|{"Label":<20}|{"Inputs":>12}|{"p50 (µs)":>12}|{"p99 (µs)":>12}|{"p99.9 (µs)":>12}|']
+        minigame_labels = sorted(label for label in self.__histograms if label.startswith('minigame:'))
+        for label in ['menu', 'minigame', *minigame_labels, 'store']:
+            histogram = self.get_latency_histogram(label)
+            if histogram.get_count() == 0:
+                continue
+            string_list.append(f'|{label:<20}|{histogram.get_count():>12,}'
+                               f'|{histogram.get_percentile(50) * 1e6:>12,.1f}'
+                               f'|{histogram.get_percentile(99) * 1e6:>12,.1f}'
+                               f'|{histogram.get_percentile(99.9) * 1e6:>12,.1f}|')
+        string_list += ['', f'|{"Second":>8}|{"Sessions":>10}|{"Inputs/s":>12}|']
+        for second, inputs in enumerate(self.__inputs_per_second):
+            string_list.append(f'|{second:>8}|{self.get_active_sessions(second):>10,}|{inputs:>12,}|')
+        return str.join('\n', string_list)
+
+
+class LoadGenerator:
+    """
+    Generates synthetic load against GamblingSimulator sessions spread across processes and threads.
+
+    Every session is driven by a RandomInputGrammar as fast as its thread allows. Sessions join the load test evenly
+    over the ramp up period, so the per-second throughput report shows the session count at which a node saturates.
+    """
+
+    def __init__(self, processes: int = os.cpu_count() or 1, threads_per_process: int = 4,
+                 sessions_per_thread: int = 25, duration: float = 30.0, ramp_up: float = 20.0, seed: int = 0,
+                 outcomes_directory: Optional[str] = None):
+        """
+        Constructs a LoadGenerator.
+
+        Args:
+            processes (int): The number of worker processes.
+            threads_per_process (int): The number of threads driving sessions in each process.
+            sessions_per_thread (int): The number of sessions each thread drives.
+            duration (float): The length of the load test in seconds, including the ramp up.
+            ramp_up (float): The number of seconds over which sessions join the load test.
+            seed (int): The seed from which the random generator of every session is derived.
+            outcomes_directory (Optional[str]): The directory to record the outcome of every round into, with a
+                dataset per process, or None to not record outcomes.
+        """
+        self.__processes = processes
+        self.__threads_per_process = threads_per_process
+        self.__sessions_per_thread = sessions_per_thread
+        self.__duration = duration
+        self.__ramp_up = ramp_up
+        self.__seed = seed
+        self.__outcomes_directory = outcomes_directory
+
+    def run(self) -> LoadTestResult:
+        """Runs the load test and returns its results."""
+        start_time = time.time() + _START_DELAY
+        histograms: dict[str, LatencyHistogram] = {}
+        inputs_per_second = [0] * math.ceil(self.__duration)
+        # Map the asset pack before the workers start, building it once if needed, so forked workers share the mapping
+        get_asset_pack()
+        with ProcessPoolExecutor(max_workers=self.__processes) as executor:
+            futures = [executor.submit(_run_worker, process_index, self.__processes, self.__threads_per_process,
+                                       self.__sessions_per_thread, start_time, self.__duration, self.__ramp_up,
+                                       self.__seed, self.__outcomes_directory)
+                       for process_index in range(self.__processes)]
+            for future in futures:
+                worker_histograms, worker_inputs_per_second = future.result()
+                for label, histogram in worker_histograms.items():
+                    histograms.setdefault(label, LatencyHistogram()).merge(histogram)
+                for second, inputs in enumerate(worker_inputs_per_second):
+                    inputs_per_second[second] += inputs
+        total_sessions = self.__processes * self.__threads_per_process * self.__sessions_per_thread
+        return LoadTestResult(histograms, inputs_per_second, total_sessions, self.__ramp_up)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the throughput and latency of Gambling Simulator sessions.")
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--threads', type=int, default=4, help="threads per process")
+    parser.add_argument('--sessions', type=int, default=25, help="sessions per thread")
+    parser.add_argument('--duration', type=float, default=30.0, help="seconds, including ramp up")
+    parser.add_argument('--ramp-up', type=float, default=20.0, help="seconds over which sessions join")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--outcomes', metavar='DIRECTORY', help="record the outcome of every round into DIRECTORY")
+    arguments = parser.parse_args()
+    for name in ('processes', 'threads', 'sessions'):
+        if getattr(arguments, name) < 1:
+            parser.error(f"--{name} must be at least 1")
+
+    load_generator = LoadGenerator(arguments.processes, arguments.threads, arguments.sessions, arguments.duration,
+                                   arguments.ramp_up, arguments.seed, arguments.outcomes)
+    print(load_generator.run())
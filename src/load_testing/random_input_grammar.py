@@ -0,0 +1,64 @@
+import random
+from typing import cast
+
+from src.gambling_simulator import GamblingSimulator
+from src.game_state.game_state import GameState
+from src.programs.minigames.blackjack import BlackjackMinigame
+from src.programs.minigames.roulette import RouletteMinigame
+from src.programs.minigames.slots import SlotsMinigame
+
+MENU_SELECTIONS = ('blackjack', 'slots', 'roulette', 'store')
+STORE_REQUESTS = ('groceries', '2008 honda civic', 'rent', 'predatory loan', 'a pony')
+ROULETTE_SELECTIONS = ('red', 'black', 'green', '7', '0,00', '1,2,3,4')
+
+
+class RandomInputGrammar:
+    """
+    Generates random but valid user input for a GamblingSimulator session.
+
+    The grammar walks the main menu into a randomly chosen minigame or the store, plays a random number of rounds with
+    random bets and decisions, and returns to the main menu, forever. It never quits. A session that runs out of coins
+    is topped back up to 1,000 coins at the main menu so that it can keep generating load.
+    """
+
+    def __init__(self, random_generator: random.Random, max_bet: int = 50):
+        self.__random = random_generator
+        self.__max_bet = max_bet
+        self.__inputs_left_in_visit = 0
+
+    def next_input(self, simulator: GamblingSimulator) -> str:
+        """Returns the next user input for simulator, based on the program it is currently running."""
+        program = simulator.current_abstract_program
+        if simulator.game_state is GameState.MENU:
+            if simulator.player_data.get_player_coins() <= 0:
+                simulator.player_data.set_player_coins(1_000)
+            selection = self.__random.choice(MENU_SELECTIONS)
+            self.__inputs_left_in_visit = self.__random.randint(1, 5)
+            return selection
+
+        if isinstance(program, BlackjackMinigame):
+            blackjack_minigame = cast(BlackjackMinigame, program)
+            if not blackjack_minigame.get_user_cards():
+                return self.__random_bet(simulator)
+            return self.__random.choice(('hit', 'stand'))
+
+        if isinstance(program, RouletteMinigame):
+            roulette_minigame = cast(RouletteMinigame, program)
+            if roulette_minigame.get_bet() is None:
+                return self.__random_bet(simulator)
+            if roulette_minigame.get_bet_type() is None:
+                return self.__random.choice(('color', 'number'))
+            if roulette_minigame.get_bet_type() == 'color':
+                return self.__random.choice(ROULETTE_SELECTIONS[:3])
+            return self.__random.choice(ROULETTE_SELECTIONS[3:])
+
+        # Slots and the store are both left after a random number of inputs
+        self.__inputs_left_in_visit -= 1
+        if isinstance(program, SlotsMinigame):
+            return self.__random_bet(simulator) if self.__inputs_left_in_visit >= 0 else 'stop'
+        return self.__random.choice(STORE_REQUESTS) if self.__inputs_left_in_visit >= 0 else 'exit'
+
+    def __random_bet(self, simulator: GamblingSimulator) -> str:
+        """Returns a random bet the player of simulator can afford."""
+        player_coins = simulator.player_data.get_player_coins()
+        return str(self.__random.randint(1, max(1, min(self.__max_bet, player_coins))))
@@ -0,0 +1,159 @@
+import argparse
+import contextlib
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from typing import Callable
+
+from src.gambling_simulator import GamblingSimulator
+from src.game_state.game_state import GameState
+from src.programs.minigames.blackjack import BlackjackMinigame
+from src.programs.minigames.roulette import RouletteMinigame
+from src.programs.store import Store
+
+# The inputs that drive a fresh session into each measured state, and a check that the session ended up there. A
+# blackjack hand can end on the deal, so sessions that do not reach their state are discarded and replaced.
+SCENARIOS: dict[str, tuple[list[str], Callable[[GamblingSimulator], bool]]] = {
+    'menu': ([], lambda simulator: simulator.game_state is GameState.MENU),
+    'blackjack_hand': (['blackjack', '10'],
+                       lambda simulator: isinstance(simulator.current_abstract_program, BlackjackMinigame)),
+    'roulette_bet': (['roulette', '10', 'number'],
+                     lambda simulator: isinstance(simulator.current_abstract_program, RouletteMinigame)),
+    'store': (['store'], lambda simulator: isinstance(simulator.current_abstract_program, Store)),
+}
+
+# The most bytes a single session may cost in each state before check_budgets fails. Raise a budget deliberately, in
+# the same change that needs the memory, never to silence a failure. Sessions measure 2,991 bytes at the menu, 3,285
+# mid blackjack hand, 2,942 with a roulette bet placed and 3,758 in the store, so every budget has 20-40% headroom.
+DEFAULT_BUDGETS: dict[str, int] = {
+    'menu': 4_000,
+    'blackjack_hand': 4_000,
+    'roulette_bet': 4_000,
+    'store': 5_000,
+}
+
+_SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _get_module_name(filename: str) -> str:
+    """Returns the module that allocated from filename, i.e. 'src.player_data' or 'random' for the standard library."""
+    if filename.startswith(_SOURCE_ROOT + os.sep):
+        return os.path.splitext(os.path.relpath(filename, _SOURCE_ROOT))[0].replace(os.sep, '.')
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+def _create_session(inputs: list[str], seed: int) -> GamblingSimulator:
+    simulator = GamblingSimulator(random.Random(seed))
+    simulator.current_abstract_program.execute_program()
+    for user_input in inputs:
+        simulator.process_user_input(user_input)
+    return simulator
+
+
+class SessionMemoryReport:
+    """
+    The memory a single GamblingSimulator session costs in one state, as measured by measure_session_memory.
+    """
+
+    def __init__(self, state: str, sessions: int, bytes_by_module: dict[str, int]):
+        self.__state = state
+        self.__sessions = sessions
+        self.__bytes_by_module = bytes_by_module
+
+    def get_state(self) -> str:
+        """Returns the name of the measured state, one of the keys of SCENARIOS."""
+        return self.__state
+
+    def get_bytes_per_session(self) -> int:
+        """Returns the number of bytes still allocated per session once it has reached the state."""
+        return sum(self.__bytes_by_module.values()) // self.__sessions
+
+    def get_bytes_by_module(self) -> dict[str, int]:
+        """Returns the number of bytes per session allocated by each module, largest first."""
+        return {module: size // self.__sessions
+                for module, size in sorted(self.__bytes_by_module.items(), key=lambda item: -item[1])}
+
+    def __str__(self) -> str:
+        string_list = [f'{self.__state}: {self.get_bytes_per_session():,} bytes per session']
+        for module, size in self.get_bytes_by_module().items():
+            if size != 0:
+                string_list.append(f'    {module:<48}{size:>10,}')
+        return str.join('\n', string_list)
+
+
+def measure_session_memory(state: str, sessions: int = 200, seed: int = 0) -> SessionMemoryReport:
+    """
+    Measures the memory one session costs in state by holding sessions sessions in that state and comparing tracemalloc
+    snapshots taken before and after they were created. One session is created beforehand so that imports and
+    process-wide caches are not counted against every session.
+    :exception KeyError: If state is not one of the keys of SCENARIOS.
+    """
+    inputs, reached_state = SCENARIOS[state]
+    session_random = random.Random(seed)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        _create_session(inputs, session_random.getrandbits(64))
+
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            held_sessions = []
+            while len(held_sessions) < sessions:
+                simulator = _create_session(inputs, session_random.getrandbits(64))
+                if reached_state(simulator):
+                    held_sessions.append(simulator)
+            # Release the last session created in case it did not reach the state
+            simulator = None
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+    snapshot_filter = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+    bytes_by_module: dict[str, int] = {}
+    for statistic in after.filter_traces(snapshot_filter).compare_to(before.filter_traces(snapshot_filter),
+                                                                     'filename'):
+        module = _get_module_name(statistic.traceback[0].filename)
+        bytes_by_module[module] = bytes_by_module.get(module, 0) + statistic.size_diff
+    del held_sessions
+    return SessionMemoryReport(state, sessions, bytes_by_module)
+
+
+def check_budgets(budgets: dict[str, int], sessions: int = 200, seed: int = 0) -> list[SessionMemoryReport]:
+    """
+    Measures every state in budgets and returns the reports of those whose bytes per session exceed their budget.
+    """
+    return [report for report in (measure_session_memory(state, sessions, seed) for state in budgets)
+            if report.get_bytes_per_session() > budgets[report.get_state()]]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the memory one Gambling Simulator session costs in each "
+                                                 "state, exiting with status 1 if any state is over budget.")
+    parser.add_argument('--sessions', type=int, default=200, help="sessions held in each state while measuring")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--budget', action='append', default=[], metavar='STATE=BYTES',
+                        help="override the budget of a state; may be repeated")
+    arguments = parser.parse_args()
+
+    state_budgets = dict(DEFAULT_BUDGETS)
+    for budget in arguments.budget:
+        budget_state, _, budget_bytes = budget.partition('=')
+        if budget_state not in SCENARIOS or not budget_bytes.isdigit():
+            parser.error(f"Invalid budget '{budget}'. Use STATE=BYTES with STATE one of {', '.join(SCENARIOS)}.")
+        state_budgets[budget_state] = int(budget_bytes)
+
+    over_budget = False
+    for budget_state, state_budget in state_budgets.items():
+        state_report = measure_session_memory(budget_state, arguments.sessions, arguments.seed)
+        print(state_report)
+        if state_report.get_bytes_per_session() > state_budget:
+            print(f'    OVER BUDGET: {state_report.get_bytes_per_session():,} > {state_budget:,} bytes')
+            over_budget = True
+        print()
+    sys.exit(1 if over_budget else 0)
@@ -1,4 +1,125 @@
+import argparse
+import os
+import signal
+from typing import Callable
+
+from src.analytics.outcome_recorder import OutcomeRecorder
 from src.gambling_simulator import GamblingSimulator
+from src.leaderboard.shared_leaderboard import DEFAULT_LEADERBOARD_PATH
+from src.leaderboard.shared_leaderboard import SharedLeaderboard
+from src.managers.progressive_jackpot import DEFAULT_CHECKPOINT_PATH
+from src.managers.progressive_jackpot import ProgressiveJackpot
+from src.metrics.game_metrics import GameMetrics
+from src.profiling.session_profiler import SessionProfiler
+from src.recording.session_recorder import SessionRecorder
+
+parser = argparse.ArgumentParser(description="Gambling Simulator")
+parser.add_argument('--record', metavar='PATH',
+                    help="record the session to PATH so it can be replayed with src/recording/session_replayer.py")
+parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                    help="serve Prometheus metrics at http://127.0.0.1:PORT/metrics")
+parser.add_argument('--outcomes', metavar='DIRECTORY',
+                    help="record the outcome of every round into the columnar dataset in DIRECTORY")
+parser.add_argument('--profile', metavar='PREFIX',
+                    help="profile the session, writing PREFIX.prof and PREFIX.collapsed when it ends. Sending the "
+                         "process SIGUSR1 switches profiling on or off at the next input, writing the profile when "
+                         "switched off")
+parser.add_argument('--jackpot', metavar='PATH', default=DEFAULT_CHECKPOINT_PATH,
+                    help="share the progressive jackpot of slots through the checkpoint file at PATH. Every session "
+                         "given the same file shares one jackpot, wherever it was started from (default: %(default)s)")
+parser.add_argument('--leaderboard', metavar='PATH', default=DEFAULT_LEADERBOARD_PATH,
+                    help="rank the player against the players of every other session given the leaderboard file at "
+                         "PATH (default: %(default)s)")
+arguments = parser.parse_args()
+profile_prefix = arguments.profile if arguments.profile is not None else f'session-profile-{os.getpid()}'
+# Set by SIGUSR1 and cleared once profiling has been switched on or off
+profiling_switch_requested = False
+
+
+def write_profile(profiler: SessionProfiler) -> None:
+    paths = profiler.write(profile_prefix)
+    print(f"\nProfile written to {paths[0]} and {paths[1]}.")
+
+
+def request_profiling_switch(signal_number: int, frame: object) -> None:
+    """
+    Handles SIGUSR1 by asking for profiling to be switched on or off. The switch, and writing the profile, wait until
+    the next input is read, as a signal handler can run in the middle of anything, including a print or the profiler.
+    """
+    global profiling_switch_requested
+    profiling_switch_requested = True
+
+
+def start_profiling(simulator: GamblingSimulator) -> None:
+    """Profiles simulator if --profile was given, and lets SIGUSR1 switch profiling on and off while it runs."""
+    if arguments.profile is not None:
+        simulator.start_profiling()
+    # SIGUSR1 does not exist on Windows
+    if hasattr(signal, 'SIGUSR1'):
+        signal.signal(signal.SIGUSR1, request_profiling_switch)
+
+
+def switch_profiling(simulator: GamblingSimulator) -> None:
+    """Starts profiling simulator, or stops and writes the profile if it is already being profiled."""
+    if simulator.profiler is None:
+        simulator.start_profiling()
+        print("\nProfiling started.")
+    else:
+        write_profile(simulator.stop_profiling())
+
+
+def play(simulator: GamblingSimulator, process_user_input: Callable[[str], bool]) -> None:
+    """
+    Plays simulator with input from stdin as its execute_program does, passing every input to process_user_input.
+    Profiling is switched between reading an input and processing it whenever SIGUSR1 has asked for it.
+    """
+    global profiling_switch_requested
+    finished = simulator.current_abstract_program.execute_program()
+    while not finished:
+        user_input = input()
+        if profiling_switch_requested:
+            profiling_switch_requested = False
+            switch_profiling(simulator)
+        finished = process_user_input(user_input)
+
+
+def stop_profiling(simulator: GamblingSimulator) -> None:
+    """Writes the profile of simulator if it is still being profiled."""
+    profiler = simulator.stop_profiling()
+    if profiler is not None:
+        write_profile(profiler)
+
 
-game = GamblingSimulator()
-game.execute_program()
\ No newline at end of file
+outcome_recorder = OutcomeRecorder(arguments.outcomes) if arguments.outcomes is not None else None
+try:
+    if arguments.record is not None:
+        recorder = SessionRecorder(outcome_recorder=outcome_recorder)
+        start_profiling(recorder.get_simulator())
+        try:
+            play(recorder.get_simulator(), recorder.process_user_input)
+        finally:
+            stop_profiling(recorder.get_simulator())
+            recorder.get_simulator().close()
+            recorder.get_session_log().save(arguments.record)
+    else:
+        metrics = None
+        if arguments.metrics_port is not None:
+            metrics = GameMetrics()
+            metrics.registry.start_http_server(arguments.metrics_port)
+        jackpot = ProgressiveJackpot(arguments.jackpot)
+        leaderboard = SharedLeaderboard(arguments.leaderboard)
+        try:
+            game = GamblingSimulator(jackpot=jackpot, leaderboard=leaderboard, metrics=metrics,
+                                     outcome_recorder=outcome_recorder)
+            start_profiling(game)
+            try:
+                play(game, game.process_user_input)
+            finally:
+                stop_profiling(game)
+                game.close()
+        finally:
+            leaderboard.close()
+            jackpot.close()
+finally:
+    if outcome_recorder is not None:
+        outcome_recorder.close()
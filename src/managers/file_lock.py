@@ -0,0 +1,36 @@
+from typing import BinaryIO
+
+try:
+    import fcntl
+except ImportError:
+    # Windows, where files are locked with msvcrt instead
+    fcntl = None
+    import msvcrt
+
+
+def lock_file(file: BinaryIO, lock_offset: int) -> None:
+    """
+    Blocks until this process holds the exclusive lock of file, which excludes every other process. Where the lock is
+    a byte range, as on Windows, the byte at lock_offset is locked, which should be past the data of the file so that
+    the data itself stays readable.
+    """
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        return
+    file.seek(lock_offset)
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK gives up after ten seconds
+            continue
+
+
+def unlock_file(file: BinaryIO, lock_offset: int) -> None:
+    """Releases the lock of file taken by lock_file with the same lock_offset."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        return
+    file.seek(lock_offset)
+    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
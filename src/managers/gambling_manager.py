@@ -1,5 +1,15 @@
+import itertools
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from src.managers.game_clock import GameClock
+from src.metrics.game_metrics import GameMetrics
 from src.player_data import PlayerData
 
+if TYPE_CHECKING:
+    from src.advisor.kelly_advisor import KellyAdvisor
+    from src.analytics.outcome_recorder import OutcomeRecorder
+
 
 class GamblingManager:
     """
@@ -7,12 +17,28 @@ class GamblingManager:
     GamblingManager class to ensure uniformity.
     """
 
-    def __init__(self, player_data: PlayerData):
+    def __init__(self, player_data: PlayerData, game_clock: Optional[GameClock] = None,
+                 metrics: Optional[GameMetrics] = None, advisor: Optional['KellyAdvisor'] = None,
+                 outcome_recorder: Optional['OutcomeRecorder'] = None, session_id: int = 0):
         """
         Constructs a new GamblingManager with the PlayerData provided. There should only ever be one instance
         of GamblingManager.
+
+        If a GameClock is provided, every gamble placed advances it by one round, and events that have come due are
+        processed before the player's coins are checked. If GameMetrics are provided, every bet and payout is counted.
+        If a KellyAdvisor is provided, mini-games show its advice whenever they ask for a bet. If an OutcomeRecorder is
+        provided, the outcome of every round mini-games report is recorded under session_id.
         """
         self.__player_data = player_data
+        self.__game_clock = game_clock
+        self.__metrics = metrics
+        self.__advisor = advisor
+        self.__last_bets: dict[str, tuple] = {}
+        self.__outcome_recorder = outcome_recorder
+        self.__session_id = session_id
+        # The coins bet and paid out since the last round ended
+        self.__round_bet = 0
+        self.__round_payout = 0
 
     def is_valid_gambling_amount(self, number_of_coins: int) -> bool:
         """
@@ -20,6 +46,7 @@ class GamblingManager:
         :param number_of_coins: The number of coins to check
         :return: True if amount is positive and if the player has the amount necessary
         """
+        self.__catch_up()
         return 0 < number_of_coins <= self.__player_data.get_player_coins()
 
     def place_gamble(self, number_of_coins: int) -> bool:
@@ -32,6 +59,12 @@ class GamblingManager:
             return False
 
         self.__player_data.set_player_coins(self.__player_data.get_player_coins() - number_of_coins)
+        self.__round_bet += number_of_coins
+        if self.__game_clock is not None:
+            self.__game_clock.advance()
+        if self.__metrics is not None:
+            self.__metrics.bets_placed.inc()
+            self.__metrics.coins_wagered.inc(number_of_coins)
         return True
 
     def give_player_payout(self, number_of_coins: int) -> None:
@@ -44,7 +77,98 @@ class GamblingManager:
             raise ValueError("Attempted to reward a negative amount of coins.")
 
         self.__player_data.set_player_coins(self.__player_data.get_player_coins() + number_of_coins)
+        self.__round_payout += number_of_coins
+        if self.__metrics is not None:
+            self.__metrics.coins_paid_out.inc(number_of_coins)
+
+    def end_round(self) -> None:
+        """
+        Marks the end of a round of gambling, once every bet of the round has been settled. Mini-games must call this
+        exactly once per round so that the player's bankroll history is kept.
+        """
+        self.__player_data.record_bankroll()
+        self.__round_bet = self.__round_payout = 0
+
+    def record_outcome(self, game: str, player_score: int = -1, dealer_score: int = -1, wheel_result: int = -1,
+                       reels: tuple[int, int, int] = (-1, -1, -1)) -> None:
+        """
+        Records the outcome of the round being played on game ('blackjack', 'roulette' or 'slots'), together with the
+        coins bet and paid out since the last round ended, if this GamblingManager has an OutcomeRecorder. Mini-games
+        call this just before end_round. Outcome fields that do not apply to game are left as -1; see
+        src.analytics.outcome_recorder.SCHEMA.
+        """
+        if self.__outcome_recorder is not None:
+            self.__outcome_recorder.record(self.__session_id, game, self.__round_bet, self.__round_payout,
+                                           player_score, dealer_score, wheel_result, reels)
+
+    def settle_rounds(self, game: str, bet: int, balances: list[int], player_scores: Optional[list[int]] = None,
+                      dealer_scores: Optional[list[int]] = None, wheel_results: Optional[list[int]] = None,
+                      reels: Optional[tuple[list[int], list[int], list[int]]] = None) -> None:
+        """
+        Settles several rounds of game at once, each betting bet coins and leaving the player with the corresponding
+        entry of balances, leaving the player, GameClock, metrics, bankroll history and any OutcomeRecorder exactly as
+        placing, paying out, recording and ending every round in turn would. This is how autoplay plays thousands of
+        rounds without paying for the bookkeeping of each one.
+
+        The caller must ensure that the player can afford every bet given the balance before it, and that no GameClock
+        event comes due before the last round (see get_rounds_until_event). Outcome fields hold one value per round, as
+        for record_outcome.
+        """
+        rounds = len(balances)
+        starting_coins = self.__player_data.get_player_coins()
+        self.__player_data.record_bankrolls(balances)
+        if self.__game_clock is not None:
+            self.__game_clock.advance(rounds)
+        if self.__metrics is not None:
+            self.__metrics.bets_placed.inc(rounds)
+            self.__metrics.coins_wagered.inc(bet * rounds)
+            self.__metrics.coins_paid_out.inc(balances[-1] - starting_coins + bet * rounds)
+        if self.__outcome_recorder is not None:
+            payouts = [balance - previous + bet
+                       for previous, balance in zip(itertools.chain((starting_coins,), balances), balances)]
+            self.__outcome_recorder.record_rounds(self.__session_id, game, bet, payouts, player_scores, dealer_scores,
+                                                  wheel_results, reels)
+
+    def get_rounds_until_event(self) -> Optional[int]:
+        """
+        Processes any GameClock events that have come due, then returns the number of rounds that can be settled before
+        the next event comes due, or None if no event is pending.
+        """
+        self.__catch_up()
+        if self.__game_clock is None:
+            return None
+        return self.__game_clock.get_rounds_until_next_event()
+
+    def is_recording_outcomes(self) -> bool:
+        """Returns True if this GamblingManager records the outcome of every round."""
+        return self.__outcome_recorder is not None
 
     def get_player_coins(self) -> int:
         """Returns the number of coins a player has to gamble with."""
+        self.__catch_up()
         return self.__player_data.get_player_coins()
+
+    def remember_bet(self, game: str, bet: tuple) -> None:
+        """
+        Remembers the bet just placed on game so that it can be repeated, i.e. by autoplay. The contents of bet are up
+        to the mini-game; its first element should be the number of coins bet.
+        """
+        self.__last_bets[game] = bet
+
+    def get_last_bet(self, game: str) -> Optional[tuple]:
+        """Returns the bet last remembered for game, or None if no bet has been placed on game."""
+        return self.__last_bets.get(game)
+
+    def get_bet_advice(self, game: str) -> Optional[str]:
+        """
+        Returns advice on how much of the player's coins to bet on game ('blackjack', 'slots' or 'roulette'), or None if
+        this GamblingManager has no KellyAdvisor.
+        """
+        if self.__advisor is None:
+            return None
+        return self.__advisor.get_advice(game, self.get_player_coins())
+
+    def __catch_up(self) -> None:
+        """Processes any GameClock events that have come due."""
+        if self.__game_clock is not None:
+            self.__game_clock.catch_up()
@@ -0,0 +1,69 @@
+import heapq
+import itertools
+from typing import Callable
+from typing import Optional
+
+
+class GameClock:
+    """
+    Tracks the passage of time in Gambling Simulator, measured in rounds played, and runs events scheduled for later
+    rounds.
+
+    Events are kept in a priority queue ordered by the round they are due. Advancing the clock only increments the
+    current round; due events are run lazily the next time the clock is consulted with catch_up(self). Each event costs
+    O(log n) in the number of pending events, regardless of how many items or players have events scheduled.
+    """
+
+    def __init__(self):
+        """Constructs a GameClock at round 0 with no scheduled events."""
+        self.__current_round: int = 0
+        self.__events: list[tuple[int, int, Callable[[int], None]]] = []
+        # Breaks ties between events due the same round so they run in the order they were scheduled
+        self.__sequence = itertools.count()
+
+    def get_current_round(self) -> int:
+        """Returns the number of rounds played so far."""
+        return self.__current_round
+
+    def advance(self, rounds: int = 1) -> None:
+        """
+        Advances the clock by the given number of rounds. Events that become due are not run until catch_up(self).
+        :param rounds: The number of rounds played.
+        :exception ValueError: If rounds is negative.
+        """
+        if rounds < 0:
+            raise ValueError("The game clock cannot be turned back.")
+        self.__current_round += rounds
+
+    def schedule(self, due_round: int, action: Callable[[int], None]) -> None:
+        """
+        Schedules action to run once the clock reaches due_round. The action is called with the round it was due,
+        which may be earlier than the current round if the clock was not consulted in between. Actions may schedule
+        further events, including recurring ones.
+        :param due_round: The round the action is due.
+        :param action: The action to run.
+        """
+        heapq.heappush(self.__events, (due_round, next(self.__sequence), action))
+
+    def schedule_in(self, rounds: int, action: Callable[[int], None]) -> None:
+        """Schedules action to run once the given number of rounds have passed from the current round."""
+        self.schedule(self.__current_round + rounds, action)
+
+    def catch_up(self) -> None:
+        """Runs every event due at or before the current round, in the order they were due."""
+        while self.__events and self.__events[0][0] <= self.__current_round:
+            due_round, _, action = heapq.heappop(self.__events)
+            action(due_round)
+
+    def get_rounds_until_next_event(self) -> Optional[int]:
+        """
+        Returns the number of rounds the clock can advance before the earliest pending event comes due, 0 if an event
+        is already due, or None if no events are scheduled.
+        """
+        if not self.__events:
+            return None
+        return max(self.__events[0][0] - self.__current_round, 0)
+
+    def get_pending_event_count(self) -> int:
+        """Returns the number of events scheduled but not yet run."""
+        return len(self.__events)
@@ -0,0 +1,104 @@
+import contextlib
+import mmap
+import os
+import struct
+import threading
+from typing import Iterator
+
+from src.managers.file_lock import lock_file
+from src.managers.file_lock import unlock_file
+
+# The checkpoint file of the jackpot shared by every session of the user, wherever the game was started from
+DEFAULT_CHECKPOINT_PATH = os.path.join(os.path.expanduser('~'), '.gambling_simulator', 'progressive_jackpot.bin')
+# The pool is stored in thousandths of a coin so that fractional contributions are never lost to rounding
+_UNITS_PER_COIN = 1_000
+_POOL_FORMAT = '<q'
+_POOL_SIZE = struct.calcsize(_POOL_FORMAT)
+
+
+class ProgressiveJackpot:
+    """
+    A jackpot pool shared by every slots session, fed by a slice of every bet and paid out on triple 7's.
+
+    The pool lives in a small memory-mapped checkpoint file rather than in process memory. Every update writes straight
+    into the mapping, so the pool survives a crash of any process using it without a disk write per spin, and every
+    process that maps the same file sees the same pool. Every read-modify-write of the pool holds a threading.Lock,
+    which excludes the other threads of the process, and an exclusive lock of the checkpoint file from the operating
+    system, which excludes every other process using the file, such as other instances of main.py.
+    """
+
+    def __init__(self, checkpoint_path: str, contribution_rate: float = 0.01, seed_coins: int = 1_000):
+        """
+        Constructs a ProgressiveJackpot backed by the checkpoint file at checkpoint_path, creating the file and its
+        directory with a pool of seed_coins coins if it does not exist.
+
+        Args:
+            checkpoint_path (str): The path of the checkpoint file.
+            contribution_rate (float): The fraction of every bet added to the pool.
+            seed_coins (int): The number of coins the pool is reset to after it is paid out.
+
+        Exceptions:
+            ValueError: If contribution_rate is not between 0 and 1 or seed_coins is negative.
+        """
+        if not 0 <= contribution_rate <= 1:
+            raise ValueError("The contribution rate must be between 0 and 1.")
+        if seed_coins < 0:
+            raise ValueError("The jackpot cannot be seeded with a negative amount of coins.")
+        self.__contribution_rate = contribution_rate
+        self.__seed_units = seed_coins * _UNITS_PER_COIN
+        self.__lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(checkpoint_path)), exist_ok=True)
+        self.__file = open(checkpoint_path, 'a+b')
+
+        # Processes creating the file at the same time must not both seed it, nor map it before it is seeded
+        with self.__locked():
+            if os.fstat(self.__file.fileno()).st_size < _POOL_SIZE:
+                self.__file.truncate(0)
+                self.__file.write(struct.pack(_POOL_FORMAT, self.__seed_units))
+                self.__file.flush()
+            self.__pool = mmap.mmap(self.__file.fileno(), _POOL_SIZE)
+
+    def contribute(self, bet: int, bets: int = 1) -> None:
+        """Adds the jackpot's slice of bets bets of bet coins each to the pool, i.e. of several rounds of autoplay."""
+        contribution = round(bet * self.__contribution_rate * _UNITS_PER_COIN) * bets
+        with self.__locked():
+            pool_units = struct.unpack_from(_POOL_FORMAT, self.__pool)[0]
+            struct.pack_into(_POOL_FORMAT, self.__pool, 0, pool_units + contribution)
+
+    def claim(self) -> int:
+        """
+        Pays out the pool, resetting it to its seed amount. Fractions of a coin remain in the pool.
+        :return: The number of coins won.
+        """
+        with self.__locked():
+            pool_units = struct.unpack_from(_POOL_FORMAT, self.__pool)[0]
+            coins_won = pool_units // _UNITS_PER_COIN
+            struct.pack_into(_POOL_FORMAT, self.__pool, 0,
+                             self.__seed_units + pool_units - coins_won * _UNITS_PER_COIN)
+        return coins_won
+
+    def get_pool(self) -> int:
+        """Returns the number of whole coins currently in the pool."""
+        return struct.unpack_from(_POOL_FORMAT, self.__pool)[0] // _UNITS_PER_COIN
+
+    def checkpoint(self) -> None:
+        """Flushes the pool to disk, so it also survives a crash of the operating system."""
+        with self.__locked():
+            self.__pool.flush()
+
+    def close(self) -> None:
+        """Checkpoints the pool and releases the checkpoint file."""
+        self.checkpoint()
+        self.__pool.close()
+        self.__file.close()
+
+    @contextlib.contextmanager
+    def __locked(self) -> Iterator[None]:
+        """Holds the pool's threading.Lock and the lock of the checkpoint file for the duration of the context."""
+        with self.__lock:
+            # The byte after the pool is locked where locks are byte ranges
+            lock_file(self.__file, _POOL_SIZE)
+            try:
+                yield
+            finally:
+                unlock_file(self.__file, _POOL_SIZE)
@@ -0,0 +1,71 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Self
+
+
+class AbstractMetric(ABC):
+    """
+    An abstract representation of a metric in the Prometheus text exposition format.
+
+    A metric declared with label names is a family of child metrics, one per combination of label values, obtained
+    with labels(self, *label_values). Children should be looked up once and kept, so that updating a metric on a hot
+    path costs no lookups or allocations. Every child guards its own value with its own lock, so threads updating
+    different children never contend.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                 label_values: tuple[str, ...] = ()):
+        self._name = name
+        self._documentation = documentation
+        self._label_names = label_names
+        self._label_values = label_values
+        self._lock = threading.Lock()
+        self.__children: dict[tuple[str, ...], Self] = {}
+
+    def labels(self, *label_values: str) -> Self:
+        """
+        Returns the child metric for the given label values, creating it if necessary.
+        :exception ValueError: If the number of label values does not match the number of label names.
+        """
+        if len(label_values) != len(self._label_names):
+            raise ValueError(f"Metric {self._name} expects labels {self._label_names}.")
+        child = self.__children.get(label_values)
+        if child is None:
+            with self._lock:
+                child = self.__children.setdefault(label_values, self._create_child(label_values))
+        return child
+
+    @abstractmethod
+    def _create_child(self, label_values: tuple[str, ...]) -> Self:
+        """Subclasses must implement this method to construct a child metric with the given label values."""
+        pass
+
+    @abstractmethod
+    def _get_type(self) -> str:
+        """Subclasses must implement this method to return the Prometheus type of the metric."""
+        pass
+
+    @abstractmethod
+    def _render_samples(self, string_list: list[str]) -> None:
+        """Subclasses must implement this method to append the samples of this (unlabelled or child) metric."""
+        pass
+
+    def _format_labels(self, extra_labels: tuple[tuple[str, str], ...] = ()) -> str:
+        """Returns the label set of this metric in exposition format, i.e. {game="slots"}, or '' if it has none."""
+        pairs = tuple(zip(self._label_names, self._label_values)) + extra_labels
+        if not pairs:
+            return ''
+        escaped_pairs = (f'{name}="{value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')}"'
+                         for name, value in pairs)
+        return '{' + str.join(',', escaped_pairs) + '}'
+
+    def render(self) -> str:
+        """Returns this metric and all of its children in the Prometheus text exposition format."""
+        documentation = self._documentation.replace('\\', '\\\\').replace('\n', '\\n')
+        string_list = [f'# HELP {self._name} {documentation}', f'# TYPE {self._name} {self._get_type()}']
+        if self._label_names:
+            for child in list(self.__children.values()):
+                child._render_samples(string_list)
+        else:
+            self._render_samples(string_list)
+        return str.join('\n', string_list)
@@ -0,0 +1,40 @@
+from typing import override
+
+from src.metrics.abstract_metric import AbstractMetric
+
+
+class Counter(AbstractMetric):
+    """
+    A metric whose value only ever increases, such as the number of bets placed.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                 label_values: tuple[str, ...] = ()):
+        super().__init__(name, documentation, label_names, label_values)
+        self.__value = 0
+
+    def inc(self, amount: int | float = 1) -> None:
+        """
+        Increases this Counter by amount.
+        :exception ValueError: If amount is negative.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        with self._lock:
+            self.__value += amount
+
+    def get_value(self) -> int | float:
+        """Returns the current value of this Counter."""
+        return self.__value
+
+    @override
+    def _create_child(self, label_values: tuple[str, ...]) -> 'Counter':
+        return Counter(self._name, self._documentation, self._label_names, label_values)
+
+    @override
+    def _get_type(self) -> str:
+        return 'counter'
+
+    @override
+    def _render_samples(self, string_list: list[str]) -> None:
+        string_list.append(f'{self._name}{self._format_labels()} {self.__value}')
@@ -0,0 +1,36 @@
+from src.metrics.counter import Counter
+from src.metrics.gauge import Gauge
+from src.metrics.histogram import Histogram
+from src.metrics.metrics_registry import MetricsRegistry
+
+
+class GameMetrics:
+    """
+    The metrics collected from Gambling Simulator sessions. A single GameMetrics is shared by every session on a node
+    and passed to the GamblingSimulator, GamblingManager and Store that feed it.
+
+    Attributes:
+        registry (MetricsRegistry): The registry every metric below is registered with.
+        bets_placed (Counter): The number of bets placed.
+        coins_wagered (Counter): The number of coins bet.
+        coins_paid_out (Counter): The number of coins paid out to players.
+        purchases (Counter): The number of store purchases, labelled by item.
+        active_sessions (Gauge): The number of sessions, labelled by their current GameState.
+        input_latency (Histogram): The time taken to process a line of user input, labelled by the GameState the
+            input was received in.
+    """
+
+    def __init__(self):
+        self.registry: MetricsRegistry = MetricsRegistry()
+        self.bets_placed: Counter = self.registry.register(
+            Counter('gambling_bets_placed_total', "Number of bets placed."))
+        self.coins_wagered: Counter = self.registry.register(
+            Counter('gambling_coins_wagered_total', "Number of coins bet."))
+        self.coins_paid_out: Counter = self.registry.register(
+            Counter('gambling_coins_paid_out_total', "Number of coins paid out to players."))
+        self.purchases: Counter = self.registry.register(
+            Counter('gambling_store_purchases_total', "Number of store purchases.", ('item',)))
+        self.active_sessions: Gauge = self.registry.register(
+            Gauge('gambling_active_sessions', "Number of sessions in each game state.", ('state',)))
+        self.input_latency: Histogram = self.registry.register(
+            Histogram('gambling_input_latency_seconds', "Time taken to process a line of user input.", ('state',)))
@@ -0,0 +1,40 @@
+from typing import override
+
+from src.metrics.abstract_metric import AbstractMetric
+
+
+class Gauge(AbstractMetric):
+    """
+    A metric whose value can increase and decrease, such as the number of active sessions.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                 label_values: tuple[str, ...] = ()):
+        super().__init__(name, documentation, label_names, label_values)
+        self.__value = 0
+
+    def inc(self, amount: int | float = 1) -> None:
+        """Increases this Gauge by amount."""
+        with self._lock:
+            self.__value += amount
+
+    def dec(self, amount: int | float = 1) -> None:
+        """Decreases this Gauge by amount."""
+        with self._lock:
+            self.__value -= amount
+
+    def get_value(self) -> int | float:
+        """Returns the current value of this Gauge."""
+        return self.__value
+
+    @override
+    def _create_child(self, label_values: tuple[str, ...]) -> 'Gauge':
+        return Gauge(self._name, self._documentation, self._label_names, label_values)
+
+    @override
+    def _get_type(self) -> str:
+        return 'gauge'
+
+    @override
+    def _render_samples(self, string_list: list[str]) -> None:
+        string_list.append(f'{self._name}{self._format_labels()} {self.__value}')
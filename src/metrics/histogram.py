@@ -0,0 +1,56 @@
+import bisect
+from typing import override
+
+from src.metrics.abstract_metric import AbstractMetric
+
+DEFAULT_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class Histogram(AbstractMetric):
+    """
+    A metric that counts observations into fixed buckets, such as input handling latency.
+
+    Bucket counts are stored non-cumulatively in a preallocated list, so an observation is a binary search and a single
+    increment. Counts are only made cumulative when the Histogram is rendered.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS, label_values: tuple[str, ...] = ()):
+        super().__init__(name, documentation, label_names, label_values)
+        self.__buckets = tuple(sorted(buckets))
+        # The final count holds observations above the largest bucket
+        self.__counts = [0] * (len(self.__buckets) + 1)
+        self.__sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records a single observation of value."""
+        index = bisect.bisect_left(self.__buckets, value)
+        with self._lock:
+            self.__counts[index] += 1
+            self.__sum += value
+
+    def get_count(self) -> int:
+        """Returns the number of observations recorded."""
+        return sum(self.__counts)
+
+    @override
+    def _create_child(self, label_values: tuple[str, ...]) -> 'Histogram':
+        return Histogram(self._name, self._documentation, self._label_names, self.__buckets, label_values)
+
+    @override
+    def _get_type(self) -> str:
+        return 'histogram'
+
+    @override
+    def _render_samples(self, string_list: list[str]) -> None:
+        with self._lock:
+            counts = list(self.__counts)
+            observation_sum = self.__sum
+        cumulative_count = 0
+        for bucket, count in zip(self.__buckets, counts):
+            cumulative_count += count
+            string_list.append(f'{self._name}_bucket{self._format_labels((('le', repr(bucket)),))} {cumulative_count}')
+        cumulative_count += counts[-1]
+        string_list.append(f'{self._name}_bucket{self._format_labels((('le', '+Inf'),))} {cumulative_count}')
+        string_list.append(f'{self._name}_sum{self._format_labels()} {observation_sum}')
+        string_list.append(f'{self._name}_count{self._format_labels()} {cumulative_count}')
@@ -0,0 +1,56 @@
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from src.metrics.abstract_metric import AbstractMetric
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class MetricsRegistry:
+    """
+    A collection of metrics that can be rendered together and served over HTTP for scraping.
+    """
+
+    def __init__(self):
+        self.__metrics: list[AbstractMetric] = []
+        self.__lock = threading.Lock()
+
+    def register[T: AbstractMetric](self, metric: T) -> T:
+        """Adds metric to this registry and returns it."""
+        with self.__lock:
+            self.__metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Returns every registered metric in the Prometheus text exposition format."""
+        with self.__lock:
+            metrics = list(self.__metrics)
+        return str.join('\n', (metric.render() for metric in metrics)) + '\n'
+
+    def start_http_server(self, port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+        """
+        Serves this registry at http://host:port/metrics from a daemon thread.
+        :return: The running server, which can be stopped with its shutdown() method.
+        """
+        registry = self
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                # Scrapes must not print into the game
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsRequestHandler)
+        threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+        return server
@@ -1,16 +1,30 @@
-from items.abstract_item import AbstractItem
+from typing import Optional
+
+from src.bankroll_history import BankrollHistory
+from src.items.abstract_item import AbstractItem
+from src.leaderboard.abstract_leaderboard import AbstractLeaderboard
 
 
 class PlayerData:
     """
-    Represents all long-term player data in CasinoGame, including the number of coins and the items a user has.
-    PlayerData is mutable.
+    Represents all long-term player data in CasinoGame, including the number of coins, the items a user has and the
+    history of their coins after every round. PlayerData is mutable.
     """
 
-    def __init__(self):
-        """Constructs PlayerData in the original state where the Player has 1,000 coins and no purchased items."""
+    def __init__(self, leaderboard: Optional[AbstractLeaderboard] = None):
+        """
+        Constructs PlayerData in the original state where the Player has 1,000 coins and no purchased items.
+
+        If a Leaderboard is provided, the Player is added to it and every change to the Player's net worth is reported
+        to it.
+        """
         self.__player_coins: int = 1_000
         self.__items: list[AbstractItem] = []
+        self.__bankroll_history: BankrollHistory = BankrollHistory()
+        self.__leaderboard: Optional[AbstractLeaderboard] = leaderboard
+        self.__leaderboard_id: Optional[int] = None
+        if leaderboard is not None:
+            self.__leaderboard_id = leaderboard.add_player(self.get_net_worth())
 
     def get_player_coins(self) -> int:
         """Returns the number of coins the player currently has."""
@@ -19,10 +33,28 @@ class PlayerData:
     def set_player_coins(self, new_player_coins: int):
         """Sets the number of coins the player currently has."""
         self.__player_coins = new_player_coins
+        self.__report_net_worth()
 
     def add_player_coins(self, coins_to_add: int):
         """Adds coins_to_add coins to the number of coins the player currently has."""
         self.__player_coins += coins_to_add
+        self.__report_net_worth()
+
+    def record_bankroll(self):
+        """Records the number of coins the player currently has in their bankroll history, i.e. after a round."""
+        self.__bankroll_history.record(self.__player_coins)
+
+    def record_bankrolls(self, balances: list[int]) -> None:
+        """
+        Records the coins the player had after each of several rounds, oldest first, in their bankroll history, and
+        sets the number of coins the player currently has to the last of them.
+        """
+        self.__bankroll_history.record_many(balances)
+        self.set_player_coins(balances[-1])
+
+    def get_bankroll_history(self) -> BankrollHistory:
+        """Returns the history of the player's coins after every round"""
+        return self.__bankroll_history
 
     def get_items(self) -> tuple[AbstractItem, ...]:
         """Returns a tuple representation of the items the player currently has"""
@@ -31,3 +63,31 @@ class PlayerData:
     def add_item(self, item: AbstractItem):
         """Adds the provided item to the Player's inventory"""
         self.__items.append(item)
+        self.__report_net_worth()
+
+    def remove_item(self, item: AbstractItem):
+        """Removes the provided item from the Player's inventory if the Player has it"""
+        if item in self.__items:
+            self.__items.remove(item)
+            self.__report_net_worth()
+
+    def get_net_worth(self) -> int:
+        """Returns the number of coins the player has less the debt owed on their items."""
+        return self.__player_coins - sum(item.get_debt() for item in self.__items)
+
+    def get_leaderboard_rank(self) -> Optional[tuple[int, int]]:
+        """Returns the player's rank and the number of players on the Leaderboard, None if not on a Leaderboard."""
+        if self.__leaderboard_id is None:
+            return None
+        return self.__leaderboard.get_rank(self.__leaderboard_id), self.__leaderboard.get_player_count()
+
+    def leave_leaderboard(self) -> None:
+        """Removes the player from the Leaderboard, i.e. when their session ends."""
+        if self.__leaderboard_id is not None:
+            self.__leaderboard.remove_player(self.__leaderboard_id)
+            self.__leaderboard_id = None
+
+    def __report_net_worth(self) -> None:
+        """Reports the player's current net worth to the Leaderboard."""
+        if self.__leaderboard_id is not None:
+            self.__leaderboard.update(self.__leaderboard_id, self.get_net_worth())
@@ -0,0 +1,70 @@
+import argparse
+import contextlib
+import os
+import random
+from typing import Optional
+
+from src.gambling_simulator import GamblingSimulator
+from src.profiling.session_profiler import SessionProfiler
+from src.recording.replay_random import ReplayRandom
+from src.recording.session_log import SessionLog
+
+
+def profile_inputs(inputs: list[str], profiler: SessionProfiler, session_log: Optional[SessionLog] = None,
+                   seed: Optional[int] = None, repeat: int = 1) -> None:
+    """
+    Plays inputs through fresh GamblingSimulator sessions with profiling on, discarding everything they print.
+
+    Args:
+        inputs (list[str]): The inputs of the session, in order.
+        profiler (SessionProfiler): The profiler to record into.
+        session_log (Optional[SessionLog]): The recorded log inputs came from. If given, every draw is served from the
+            log, so each session plays out exactly as it was recorded.
+        seed (Optional[int]): The seed of every session's random generator when there is no session_log.
+        repeat (int): The number of sessions to play, for more samples than a single short session gives.
+    """
+    for _ in range(repeat):
+        if session_log is not None:
+            simulator = GamblingSimulator(ReplayRandom(session_log.get_draws(), SessionLog()))
+        else:
+            simulator = GamblingSimulator(random.Random(seed))
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            simulator.start_profiling(profiler)
+            try:
+                finished = simulator.current_abstract_program.execute_program()
+                for user_input in inputs:
+                    if finished:
+                        break
+                    finished = simulator.process_user_input(user_input)
+            finally:
+                simulator.stop_profiling()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Profile a scripted or recorded Gambling Simulator session, writing "
+                                                 "a cProfile trace and sampled stacks for flamegraph tools.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--log', metavar='PATH', help="a session log recorded with main.py --record, replayed with "
+                                                      "its recorded draws")
+    source.add_argument('--script', metavar='PATH', help="a text file with one input per line")
+    parser.add_argument('--output', metavar='PREFIX', required=True,
+                        help="writes PREFIX.prof and PREFIX.collapsed")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the random generator when playing a script")
+    parser.add_argument('--repeat', type=int, default=1, help="number of times to play the session")
+    parser.add_argument('--interval', type=float, help="seconds between stack samples, by default the interpreter's "
+                                                       "thread switch interval, which samples cannot beat")
+    arguments = parser.parse_args()
+
+    if arguments.log is not None:
+        recorded_log = SessionLog.load(arguments.log)
+        session_inputs = recorded_log.get_inputs()
+    else:
+        recorded_log = None
+        with open(arguments.script, encoding='utf-8') as script_file:
+            session_inputs = script_file.read().splitlines()
+
+    session_profiler = SessionProfiler(arguments.interval)
+    profile_inputs(session_inputs, session_profiler, recorded_log, arguments.seed, arguments.repeat)
+    written_paths = session_profiler.write(arguments.output)
+    print(f'Sampled {len(session_profiler.get_collapsed_stacks()):,} distinct stacks. Wrote {written_paths[0]} and '
+          f'{written_paths[1]}.')
@@ -0,0 +1,130 @@
+import cProfile
+import collections
+import sys
+import threading
+from types import FrameType
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+
+class SessionProfiler:
+    """
+    Profiles the input handling of a single GamblingSimulator session.
+
+    Work is only profiled inside run(self, label, function, *args), which GamblingSimulator calls around every input
+    it processes while profiling is on, so the time a session spends waiting for input is never profiled. Two profiles
+    are kept:
+
+    - A cProfile trace of every call made while processing input, for pstats or snakeviz. On Python 3.12 cProfile
+      observes every thread of the process, so a trace taken on a node hosting many sessions also counts calls other
+      threads made while this session was processing input.
+    - Call stacks of the session's own thread, sampled every sample_interval seconds by a background thread. Each
+      stack starts at the label passed to run, the name of the active AbstractProgram, followed by every frame from
+      the call to run down to the frame executing when the sample was taken. They are written in the collapsed-stack
+      format read by flamegraph.pl, inferno and speedscope.
+
+    The sampling thread needs the GIL to take a sample, and a thread busy running Python code only hands the GIL over
+    every sys.getswitchinterval() seconds (5 ms unless changed). Samples of such code are therefore at least that far
+    apart however small sample_interval is, so the switch interval is the default.
+    """
+
+    def __init__(self, sample_interval: Optional[float] = None):
+        """
+        Constructs a SessionProfiler. Nothing is profiled until start(self) is called.
+        :param sample_interval: The number of seconds between stack samples, sys.getswitchinterval() if None.
+        """
+        self.__sample_interval = sample_interval if sample_interval is not None else sys.getswitchinterval()
+        self.__profile = cProfile.Profile()
+        self.__stacks: collections.Counter[str] = collections.Counter()
+        self.__stacks_lock = threading.Lock()
+        self.__sampler: Optional[threading.Thread] = None
+        self.__stopped = threading.Event()
+        # The thread, label and outermost frame of the call being profiled, None outside of run
+        self.__capture: Optional[tuple[int, str, FrameType]] = None
+
+    def start(self) -> None:
+        """Starts sampling. Calls to run(self, label, function, *args) are profiled until stop(self) is called."""
+        if self.__sampler is not None:
+            return
+        self.__stopped.clear()
+        self.__sampler = threading.Thread(target=self.__sample, name='SessionProfiler sampler', daemon=True)
+        self.__sampler.start()
+
+    def stop(self) -> None:
+        """Stops sampling and waits for the sampling thread to finish. Profiles taken so far are kept."""
+        if self.__sampler is None:
+            return
+        self.__stopped.set()
+        self.__sampler.join()
+        self.__sampler = None
+
+    def is_running(self) -> bool:
+        """Returns True if the profiler has been started and not stopped."""
+        return self.__sampler is not None
+
+    def run(self, label: str, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Calls function with args, profiling the call if the profiler is running, and returns its result.
+        :param label: The root of every stack sampled during the call.
+        """
+        if self.__sampler is None:
+            return function(*args)
+        try:
+            self.__profile.enable()
+            tracing = True
+        except ValueError:
+            # Another profiler, such as the trace of a session on another thread, is active, so only sample this call
+            tracing = False
+        self.__capture = (threading.get_ident(), label, sys._getframe())
+        try:
+            return function(*args)
+        finally:
+            self.__capture = None
+            if tracing:
+                self.__profile.disable()
+
+    def get_collapsed_stacks(self) -> list[str]:
+        """Returns the sampled stacks in collapsed-stack format, one 'frame;frame;...;frame count' line per stack."""
+        with self.__stacks_lock:
+            return [f'{stack} {count}' for stack, count in sorted(self.__stacks.items())]
+
+    def write(self, path_prefix: str) -> tuple[str, str]:
+        """
+        Writes the cProfile trace to path_prefix.prof and the sampled stacks to path_prefix.collapsed.
+        :return: The paths written, the trace first.
+        """
+        trace_path, stacks_path = path_prefix + '.prof', path_prefix + '.collapsed'
+        self.__profile.create_stats()
+        self.__profile.dump_stats(trace_path)
+        with open(stacks_path, 'w', encoding='utf-8') as stacks_file:
+            stacks_file.writelines(line + '\n' for line in self.get_collapsed_stacks())
+        return trace_path, stacks_path
+
+    def __sample(self) -> None:
+        """Samples the stack of the thread inside run every sample interval, until the profiler is stopped."""
+        while not self.__stopped.wait(self.__sample_interval):
+            capture = self.__capture
+            if capture is None:
+                continue
+            thread_id, label, root_frame = capture
+            frame = sys._current_frames().get(thread_id)
+            frames = []
+            while frame is not None and frame is not root_frame:
+                frames.append(_get_frame_name(frame))
+                frame = frame.f_back
+            # The call finished between reading capture and reading the thread's frames
+            if frame is None:
+                continue
+            frames.append(label)
+            with self.__stacks_lock:
+                self.__stacks[str.join(';', reversed(frames))] += 1
+
+
+def _get_frame_name(frame: FrameType) -> str:
+    """
+    Returns the name of the function frame is executing, qualified by its module (i.e.
+    src.programs.main_menu:MainMenu.__str__), with the separators of the collapsed-stack format replaced.
+    """
+    code = frame.f_code
+    return f'{frame.f_globals.get("__name__", "?")}:{code.co_qualname}'.replace(';', ':').replace(' ', '_')
@@ -1,3 +1,4 @@
+from src.assets.asset_pack import get_asset_pack
 from src.items.abstract_item import AbstractItem
 from src.player_data import PlayerData
 from src.programs.abstract_program import AbstractProgram
@@ -11,28 +12,11 @@ class MainMenu(AbstractProgram):
         super().__init__()
         self.__player_data = player_data
 
-        # Instantiate graphics
-        self.__gambling_simulator_logo = r'''
-    $$$$$$\                          $$\       $$\ $$\                           
-   $$  __$$\                         $$ |      $$ |\__|                          
-   $$ /  \__| $$$$$$\  $$$$$$\$$$$\  $$$$$$$\  $$ |$$\ $$$$$$$\   $$$$$$\        
-   $$ |$$$$\  \____$$\ $$  _$$  _$$\ $$  __$$\ $$ |$$ |$$  __$$\ $$  __$$\       
-   $$ |\_$$ | $$$$$$$ |$$ / $$ / $$ |$$ |  $$ |$$ |$$ |$$ |  $$ |$$ /  $$ |      
-   $$ |  $$ |$$  __$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$ |$$ |  $$ |$$ |  $$ |      
-   \$$$$$$  |\$$$$$$$ |$$ | $$ | $$ |$$$$$$$  |$$ |$$ |$$ |  $$ |\$$$$$$$ |      
-    \______/  \_______|\__| \__| \__|\_______/ \__|\__|\__|  \__| \____$$ |      
-                                                                 $$\   $$ |      
-                                                                 \$$$$$$  |      
- $$$$$$\  $$\                         $$\            $$\          \______/       
-$$  __$$\ \__|                        $$ |           $$ |                        
-$$ /  \__|$$\ $$$$$$\$$$$\  $$\   $$\ $$ | $$$$$$\ $$$$$$\    $$$$$$\   $$$$$$\  
-\$$$$$$\  $$ |$$  _$$  _$$\ $$ |  $$ |$$ | \____$$\\_$$  _|  $$  __$$\ $$  __$$\ 
- \____$$\ $$ |$$ / $$ / $$ |$$ |  $$ |$$ | $$$$$$$ | $$ |    $$ /  $$ |$$ |  \__|
-$$\   $$ |$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$  __$$ | $$ |$$\ $$ |  $$ |$$ |      
-\$$$$$$  |$$ |$$ | $$ | $$ |\$$$$$$  |$$ |\$$$$$$$ | \$$$$  |\$$$$$$  |$$ |      
- \______/ \__|\__| \__| \__| \______/ \__| \_______|  \____/  \______/ \__|      ''' # todo credit https://patorjk.com
-        self.__credit_string = "By Daniel Myers, Aiden Kline, Parker Cornelius, and Caleb Arnold"
-        self.__version_string = "ENGR 102 Fall 2024 v1.0"
+        # Graphics come from the asset pack already split into lines and padded to a width of 80
+        asset_pack = get_asset_pack()
+        self.__gambling_simulator_logo_lines = asset_pack.get_lines('logo')
+        self.__credit_string = asset_pack.get_lines('credits')[0]
+        self.__version_string = asset_pack.get_lines('version')[0]
 
         # Handling selection
         self.__valid_options = ('blackjack', 'slots', 'roulette', 'store', 'quit')
@@ -68,13 +52,13 @@ $$\   $$ |$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$  __$$ | $$ |$$\ $$ |  $$ |$$ |
             string_list[i] += '=' * 140
 
         # Append Gambling Simulator logo in the top left with a width of 80 characters
-        gambling_simulator_logo_lines = self.__gambling_simulator_logo.split('\n')
+        gambling_simulator_logo_lines = self.__gambling_simulator_logo_lines
         for row in range(len(gambling_simulator_logo_lines)):
-            string_list[row+2] += f'{gambling_simulator_logo_lines[row]:^80}'
+            string_list[row+2] += gambling_simulator_logo_lines[row]
 
         # Append credit string centered below logo
-        string_list[len(gambling_simulator_logo_lines) + 2] += f'{self.__credit_string:^80}'
-        string_list[len(gambling_simulator_logo_lines) + 6] += f'{self.__version_string:^80}'
+        string_list[len(gambling_simulator_logo_lines) + 2] += self.__credit_string
+        string_list[len(gambling_simulator_logo_lines) + 6] += self.__version_string
 
         # Append stylized selection options below credits
         selection_display_string = 'Please enter either: '
@@ -95,7 +79,7 @@ $$\   $$ |$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$  __$$ | $$ |$$\ $$ |  $$ |$$ |
             loan_item = player_item_dict["Predatory Loan"]
             loan_picture = loan_item.get_picture()
             for i in range(len(loan_picture)):
-                string_list[len(gambling_simulator_logo_lines) + i + 1] += f'{loan_picture[i]:^10}'
+                string_list[len(gambling_simulator_logo_lines) + i + 1] += loan_picture[i]
         else:
             for i in range(5):
                 string_list[len(gambling_simulator_logo_lines) + i + 1] += ' ' * 10
@@ -105,7 +89,7 @@ $$\   $$ |$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$  __$$ | $$ |$$\ $$ |  $$ |$$ |
             car_item = player_item_dict["2008 Honda Civic"]
             car_picture = car_item.get_picture()
             for i in range(len(car_picture)):
-                string_list[len(gambling_simulator_logo_lines) + i -6] += ' ' * 3 + f'{car_picture[i]:^10}'
+                string_list[len(gambling_simulator_logo_lines) + i -6] += ' ' * 3 + car_picture[i]
         else:
             for i in range(6):
                 string_list[len(gambling_simulator_logo_lines) + i -6] += ' ' * 13
@@ -115,7 +99,7 @@ $$\   $$ |$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$  __$$ | $$ |$$\ $$ |  $$ |$$ |
             rent_item = player_item_dict["Rent"]
             rent_picture = rent_item.get_picture()
             for i in range(len(rent_picture)):
-                string_list[len(gambling_simulator_logo_lines) + i -15] += ' ' * 3 + f'{rent_picture[i]:^10}'
+                string_list[len(gambling_simulator_logo_lines) + i -15] += ' ' * 3 + rent_picture[i]
         else:
             for i in range(7):
                 string_list[len(gambling_simulator_logo_lines) + i -15] += ' ' * 13
@@ -124,9 +108,18 @@ $$\   $$ |$$ |$$ | $$ | $$ |$$ |  $$ |$$ |$$  __$$ | $$ |$$\ $$ |  $$ |$$ |
         coin_display_string = f'Coin total: {self.__player_data.get_player_coins():,}'
         if self.__player_data.get_player_coins() <= 0:
             coin_display_string += ' 😭'
+        if self.__player_data.get_bankroll_history().get_total_rounds() >= 2:
+            coin_display_string += f'  {self.__player_data.get_bankroll_history().get_sparkline(20)}'
         string_list[len(gambling_simulator_logo_lines) + 3] += f'{'-' * len(coin_display_string):^50}'
         string_list[len(gambling_simulator_logo_lines) + 4] += f'{coin_display_string:^50}'
         string_list[len(gambling_simulator_logo_lines) + 5] += f'{'-' * len(coin_display_string):^50}'
 
+        # Append leaderboard rank below coin visualization, unless the player has nobody to be ranked against
+        leaderboard_rank = self.__player_data.get_leaderboard_rank()
+        if leaderboard_rank is not None and leaderboard_rank[1] > 1:
+            rank_display_string = f'Rank: #{leaderboard_rank[0]:,} of {leaderboard_rank[1]:,}'
+            rank_row = len(gambling_simulator_logo_lines) + 6
+            string_list[rank_row] = f'{string_list[rank_row]:<90}' + f'{rank_display_string:^50}'
+
         # Return string representation of main menu
         return str.join('\n', string_list)
\ No newline at end of file
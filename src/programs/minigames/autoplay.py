@@ -0,0 +1,196 @@
+import itertools
+import math
+import random
+import sys
+from array import array
+from typing import Callable
+from typing import Optional
+
+from src.managers.gambling_manager import GamblingManager
+
+AUTOPLAY_USAGE = "autoplay <rounds> [stop-loss coins] [take-profit coins]"
+# The most rounds autoplay draws and settles at once. Rounds drawn past the one that reaches a limit are discarded.
+AUTOPLAY_BATCH_ROUNDS = 4_096
+
+
+class AutoplaySettings:
+    """
+    The limits of an autoplay run, as typed by the player in place of a bet.
+
+    Attributes:
+        rounds (int): The most rounds to play.
+        stop_loss (Optional[int]): Autoplay stops once the player has this many coins or fewer, None for no stop-loss.
+        take_profit (Optional[int]): Autoplay stops once the player has this many coins or more, None for no
+            take-profit.
+    """
+
+    def __init__(self, rounds: int, stop_loss: Optional[int] = None, take_profit: Optional[int] = None):
+        self.rounds: int = rounds
+        self.stop_loss: Optional[int] = stop_loss
+        self.take_profit: Optional[int] = take_profit
+
+    @staticmethod
+    def parse(user_input: str) -> Optional['AutoplaySettings']:
+        """
+        Parses an autoplay command of the form given by AUTOPLAY_USAGE.
+        :return: The AutoplaySettings, or None if user_input is not an autoplay command.
+        :exception ValueError: If user_input is an autoplay command with missing or invalid limits.
+        """
+        words = user_input.lower().split()
+        if not words or words[0] != 'autoplay':
+            return None
+        if not 2 <= len(words) <= 4 or not all(word.isdigit() for word in words[1:]):
+            raise ValueError(f"Usage: {AUTOPLAY_USAGE}")
+        limits = [int(word) for word in words[1:]]
+        if limits[0] == 0:
+            raise ValueError("Autoplay must play at least one round.")
+        return AutoplaySettings(*limits)
+
+
+def new_autoplay_random(random_generator: random.Random) -> random.Random:
+    """
+    Returns the random generator an autoplay run draws its rounds from in bulk. It is seeded by a single randint drawn
+    from random_generator, so a recorded session replays its autoplay runs exactly while only one draw per run is
+    recorded.
+    """
+    return random.Random(random_generator.randint(0, 2 ** 63 - 1))
+
+
+def draw_below(random_generator: random.Random, n: int, count: int) -> array:
+    """
+    Returns an array of count integers drawn uniformly from range(n) by random_generator, without a Python call per
+    value as randrange or choices make.
+
+    Each value is the high half of the product of a random word and n, as in Lemire's nearly divisionless method. The
+    words are widened into lanes twice their size of one big integer, so that a single multiplication by n computes
+    every product at once. A product whose low half is below 2 ** bits % n would make some values likelier than others,
+    so those few values are redrawn with randrange. Words are 16 bits when at most 1 in 64 products needs checking that
+    way, else 32 bits; a low half that needs checking has a small top byte, so the products to check are found by
+    searching bytes. For n over 2 ** 24 every value is drawn with choices instead.
+    """
+    if n > 1 << 24:
+        return array('I', random_generator.choices(range(n), k=count))
+    word_bytes = 2 if (1 << 16) % n <= 1 << 10 else 4
+    lane_bytes = 2 * word_bytes
+    words = random_generator.randbytes(word_bytes * count)
+    lanes = bytearray(lane_bytes * count)
+    for byte in range(word_bytes):
+        lanes[byte::lane_bytes] = words[byte::word_bytes]
+    products = (int.from_bytes(lanes, 'little') * n).to_bytes(lane_bytes * count, 'little')
+    high_halves = bytearray(word_bytes * count)
+    for byte in range(word_bytes):
+        high_halves[byte::word_bytes] = products[word_bytes + byte::lane_bytes]
+    values = array('H' if word_bytes == 2 else 'I', high_halves)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    threshold = (1 << 8 * word_bytes) % n
+    if threshold == 0:
+        return values
+    # Mark the lanes whose low half has a top byte small enough to be below threshold with a zero byte
+    top_bytes = products[word_bytes - 1::lane_bytes]
+    highest_top_byte = (threshold - 1) >> 8 * (word_bytes - 1)
+    if highest_top_byte > 0:
+        top_bytes = top_bytes.translate(bytes(highest_top_byte + 1) + b'\x01' * (255 - highest_top_byte))
+    lane = top_bytes.find(0)
+    while lane != -1:
+        if int.from_bytes(products[lane_bytes * lane:lane_bytes * lane + word_bytes], 'little') < threshold:
+            values[lane] = random_generator.randrange(n)
+        lane = top_bytes.find(0, lane + 1)
+    return values
+
+
+def draw_geometric(random_generator: random.Random, probability: float) -> int:
+    """
+    Returns the number of failures before the first success of independent trials that each succeed with the given
+    probability, which must be positive, drawn with a single random number by inverting the geometric distribution.
+    """
+    if probability >= 1:
+        return 0
+    return int(math.log(1.0 - random_generator.random()) / math.log1p(-probability))
+
+
+def reaches_limit(balance: int, bet: int, settings: AutoplaySettings) -> bool:
+    """Returns True if a round leaving the player with balance coins is the last autoplay plays with settings."""
+    lowest = bet - 1 if settings.stop_loss is None else max(bet - 1, settings.stop_loss)
+    return balance <= lowest or (settings.take_profit is not None and balance >= settings.take_profit)
+
+
+def count_rounds_within_limits(coins: int, bet: int, balances: list[int], settings: AutoplaySettings) -> int:
+    """
+    Returns how many of the rounds leaving the player, who starts with coins coins, with balances autoplay plays: every
+    round up to and including the first that leaves the player at a limit of settings or unable to afford bet. No
+    round may lose more than bet.
+    """
+    lowest = bet - 1 if settings.stop_loss is None else max(bet - 1, settings.stop_loss)
+    highest = settings.take_profit
+    # Almost every batch stays within the limits, which min and max check without a loop in Python. The lowest limit
+    # cannot be reached at all when losing every round would not reach it.
+    if ((coins - bet * len(balances) > lowest or min(balances) > lowest)
+            and (highest is None or max(balances) < highest)):
+        return len(balances)
+    for rounds, balance in enumerate(balances, 1):
+        if reaches_limit(balance, bet, settings):
+            return rounds
+    return len(balances)
+
+
+def run_autoplay(gambling_manager: GamblingManager, settings: AutoplaySettings, bet: int, max_net: int,
+                 draw_rounds: Callable[[int], list[int]], settle_rounds: Callable[[list[int]], int]) -> str:
+    """
+    Plays rounds of bet coins until settings say to stop or the player cannot afford the bet.
+
+    Rounds are played in batches of up to AUTOPLAY_BATCH_ROUNDS. Each batch is drawn in one go, cut short at the first
+    round that reaches a limit or before the next GameClock event comes due, and then settled through
+    GamblingManager.settle_rounds in one go, so nothing is done per round in Python beyond drawing its outcome.
+
+    Args:
+        gambling_manager (GamblingManager): The GamblingManager of the player.
+        settings (AutoplaySettings): The limits of the run.
+        bet (int): The number of coins bet every round.
+        max_net (int): The most coins less the bet that draw_rounds can draw for a round. Once a round has won it, no
+            batch is searched for a bigger win.
+        draw_rounds (Callable[[int], list[int]]): Draws the outcomes of up to the given number of rounds without
+            settling them, returning the coins each round wins less the bet, which is never less than -bet. It may
+            return fewer rounds than asked for, but at least one.
+        settle_rounds (Callable[[list[int]], int]): Settles the first rounds of the last draw through gambling_manager,
+            one for each of the given balances the player is left with after them. It may add coins won outside the
+            draw, such as a jackpot, to the balance after the last round, and returns how many it added.
+
+    Returns:
+        str: A summary of the run, to be printed in place of the rounds themselves.
+    """
+    starting_coins = gambling_manager.get_player_coins()
+    rounds_played = 0
+    biggest_win = 0
+    stop_reason = f'{settings.rounds:,} rounds played'
+    while rounds_played < settings.rounds:
+        coins = gambling_manager.get_player_coins()
+        if settings.stop_loss is not None and coins <= settings.stop_loss:
+            stop_reason = 'stop-loss reached'
+            break
+        if settings.take_profit is not None and coins >= settings.take_profit:
+            stop_reason = 'take-profit reached'
+            break
+        if coins < bet:
+            stop_reason = f'not enough coins to bet {bet:,}'
+            break
+        batch_rounds = min(settings.rounds - rounds_played, AUTOPLAY_BATCH_ROUNDS)
+        rounds_until_event = gambling_manager.get_rounds_until_event()
+        if rounds_until_event is not None:
+            batch_rounds = min(batch_rounds, max(rounds_until_event, 1))
+        nets = draw_rounds(batch_rounds)
+        balances = list(itertools.accumulate(nets, initial=coins))
+        del balances[0]
+        rounds = count_rounds_within_limits(coins, bet, balances, settings)
+        del balances[rounds:], nets[rounds:]
+        nets[-1] += settle_rounds(balances)
+        # No drawn round can beat a win of max_net, so once one is won only the last round, which may have won more
+        # than it drew, is looked at
+        if biggest_win < max_net:
+            biggest_win = max(biggest_win, max(nets))
+        biggest_win = max(biggest_win, nets[-1])
+        rounds_played += rounds
+
+    net = gambling_manager.get_player_coins() - starting_coins
+    return (f"Autoplay stopped ({stop_reason}). Rounds played: {rounds_played:,}. Net: {net:+,} coins. "
+            f"Biggest win: {biggest_win:,} coins.")
@@ -1,8 +1,22 @@
+import itertools
 import random
+from typing import Callable
+from typing import Optional
 from typing import override
 
 from src.managers.gambling_manager import GamblingManager
 from src.programs.abstract_program import AbstractProgram
+from src.programs.minigames.autoplay import AUTOPLAY_BATCH_ROUNDS
+from src.programs.minigames.autoplay import AUTOPLAY_USAGE
+from src.programs.minigames.autoplay import AutoplaySettings
+from src.programs.minigames.autoplay import draw_below
+from src.programs.minigames.autoplay import new_autoplay_random
+from src.programs.minigames.autoplay import reaches_limit
+from src.programs.minigames.autoplay import run_autoplay
+from src.programs.minigames.blackjack_rules import BlackjackRules
+from src.programs.minigames.blackjack_rules import DEALER_STAND_SCORE
+from src.programs.minigames.blackjack_rules import WIN_PAYOUT_MULTIPLIER
+from src.programs.minigames.blackjack_shoe import BlackjackShoe
 
 card_value_map = {
     "ace": 1,
@@ -21,6 +35,83 @@ card_value_map = {
 }
 
 
+def calculate_score(cards) -> int:
+    """Calculates the highest blackjack score for cards without going over 21."""
+    score = 0
+
+    # Count non-ace score and count aces
+    num_aces = 0
+    for card in cards:
+        if card == "ace":
+            num_aces += 1
+            continue
+        score += card_value_map[card]
+
+    # Count aces to get the closest score to 21 without going over
+    score += num_aces * 11
+    while num_aces > 0 and score > 21:
+        score -= 10
+        num_aces -= 1
+    return score
+
+
+def is_soft(cards) -> bool:
+    """Returns True if cards score an ace as 11 in calculate_score."""
+    hard_score = sum(card_value_map[card] for card in cards)
+    return "ace" in cards and hard_score + 10 <= 21
+
+
+def should_dealer_hit(cards, rules: BlackjackRules) -> bool:
+    """Returns True if the dealer must draw another card to the given cards under rules."""
+    score = calculate_score(cards)
+    return score < DEALER_STAND_SCORE or (score == DEALER_STAND_SCORE and rules.dealer_hits_soft_17 and is_soft(cards))
+
+
+def play_autoplay_hand(next_card: Callable[[], int], rules: BlackjackRules, bet: int) -> tuple[int, int, int]:
+    """
+    Plays a hand of bet coins as BlackjackMinigame does when the player hits until DEALER_STAND_SCORE, without
+    printing. Cards are dealt by next_card as their values in card_value_map, so ace is 1, and scores are worked out
+    from hard totals inline rather than with calculate_score, as this is the whole cost of an autoplay hand.
+
+    Returns:
+        tuple[int, int, int]: The coins won less the bet, the player's final score and the dealer's final score.
+    """
+    # The dealer's two cards are dealt before the player's two
+    dealer_card1, dealer_card2 = next_card(), next_card()
+    player_card1, player_card2 = next_card(), next_card()
+    dealer_hard, dealer_ace = dealer_card1 + dealer_card2, dealer_card1 == 1 or dealer_card2 == 1
+    player_hard, player_ace = player_card1 + player_card2, player_card1 == 1 or player_card2 == 1
+    dealer_score = dealer_hard + 10 if dealer_ace and dealer_hard <= 11 else dealer_hard
+    player_score = player_hard + 10 if player_ace and player_hard <= 11 else player_hard
+    if dealer_score == 21 and player_score == 21:
+        return (0 if rules.blackjack_push_returns_bet else -bet), player_score, dealer_score
+    if dealer_score == 21:
+        return -bet, player_score, dealer_score
+    if player_score == 21:
+        return round(bet * rules.blackjack_payout) - bet, player_score, dealer_score
+
+    while player_score < DEALER_STAND_SCORE:
+        card = next_card()
+        player_hard += card
+        player_ace = player_ace or card == 1
+        player_score = player_hard + 10 if player_ace and player_hard <= 11 else player_hard
+    if player_score > 21:
+        return -bet, player_score, dealer_score
+
+    # A soft score counts an ace as 11, so differs from the hard total
+    while dealer_score < DEALER_STAND_SCORE or (dealer_score == DEALER_STAND_SCORE and rules.dealer_hits_soft_17
+                                                and dealer_score != dealer_hard):
+        card = next_card()
+        dealer_hard += card
+        dealer_ace = dealer_ace or card == 1
+        dealer_score = dealer_hard + 10 if dealer_ace and dealer_hard <= 11 else dealer_hard
+    if dealer_score > 21 or player_score > dealer_score:
+        return bet * WIN_PAYOUT_MULTIPLIER - bet, player_score, dealer_score
+    if player_score == dealer_score:
+        return (0 if rules.push_returns_bet else -bet), player_score, dealer_score
+    return -bet, player_score, dealer_score
+
+
 class BlackjackMinigame(AbstractProgram):
     """
     A simple blackjack minigame.
@@ -28,9 +119,22 @@ class BlackjackMinigame(AbstractProgram):
     Written by Aiden Kline. Adapted to the AbstractProgram interface by Daniel Myers.
     """
 
-    def __init__(self, gambling_manager: GamblingManager):
+    def __init__(self, gambling_manager: GamblingManager, random_generator: Optional[random.Random] = None,
+                 rules: Optional[BlackjackRules] = None, shoe: Optional[BlackjackShoe] = None):
+        """
+        Constructs a BlackjackMinigame for a single hand, played by rules, which default to BlackjackRules().
+
+        The hand is dealt from shoe, which should draw from random_generator and hold the number of decks in rules.
+        Callers that play many hands keep one shoe across them, so a finite shoe is only refilled once its penetration
+        has been dealt rather than before every hand. A fresh shoe is used if shoe is None.
+        """
         super().__init__()
         self.__gambling_manager = gambling_manager
+        self.__random: random.Random = random_generator if random_generator is not None else random.Random()
+        self.__rules: BlackjackRules = rules if rules is not None else BlackjackRules()
+        if shoe is None:
+            shoe = BlackjackShoe(list(card_value_map.keys()), self.__random, self.__rules.decks)
+        self.__shoe: BlackjackShoe = shoe
 
         self.__dealer_cards = None
         self.__user_cards = None
@@ -42,13 +146,28 @@ class BlackjackMinigame(AbstractProgram):
     def _execute(self) -> bool:
         print("Welcome to Blackjack!")
         print(f"You have {self.__gambling_manager.get_player_coins()} coins.")
+        bet_advice = self.__gambling_manager.get_bet_advice('blackjack')
+        if bet_advice is not None:
+            print(bet_advice)
+        if self.__gambling_manager.get_last_bet('blackjack') is not None:
+            print(f"Enter {AUTOPLAY_USAGE} to repeat your last bet, hitting below {DEALER_STAND_SCORE}, without "
+                  f"watching the hands.")
         print("How much would you like to gamble (integer)?: ", end='')
         return False
 
     @override
     def _process_input(self, user_input: str) -> bool:
         if not self.__game_begun:
-            # If the game has not started, prompt the user for a bet
+            # If the game has not started, autoplay or prompt the user for a bet
+            try:
+                autoplay_settings = AutoplaySettings.parse(user_input)
+            except ValueError as error:
+                print(error)
+                print("How much would you like to gamble (integer)?: ", end='')
+                return False
+            if autoplay_settings is not None:
+                return self.__autoplay(autoplay_settings)
+
             successful_bet = self.__place_user_bet(user_input)
             if not successful_bet:
                 return False
@@ -56,14 +175,17 @@ class BlackjackMinigame(AbstractProgram):
             # If bet was successful, deal cards
             self.__game_begun = True
             print("Dealing out cards...\n")
+            self.__shoe.refill_if_needed()
             self.__deal_cards()
             self._print_game_state()
 
             # Process blackjacks
-            player_blackjack = self.__calculate_score(self.__user_cards) == 21
-            dealer_blackjack = self.__calculate_score(self.__dealer_cards) == 21
+            player_blackjack = calculate_score(self.__user_cards) == 21
+            dealer_blackjack = calculate_score(self.__dealer_cards) == 21
             if player_blackjack or dealer_blackjack:
                 self.__process_blackjacks(player_blackjack, dealer_blackjack)
+                self.__record_outcome()
+                self.__gambling_manager.end_round()
                 return True
 
             # Prompt additional input if no blackjacks
@@ -78,11 +200,21 @@ class BlackjackMinigame(AbstractProgram):
 
         if user_input == "hit":
             game_over = self.__process_hit()
+            if game_over:
+                self.__record_outcome()
+                self.__gambling_manager.end_round()
             return game_over
         elif user_input == "stand":
             self.__process_stand()
+            self.__record_outcome()
+            self.__gambling_manager.end_round()
             return True
 
+    def __record_outcome(self) -> None:
+        """Records the final scores of the round that just ended."""
+        self.__gambling_manager.record_outcome('blackjack', calculate_score(self.__user_cards),
+                                               calculate_score(self.__dealer_cards))
+
     def __place_user_bet(self, user_input: str) -> bool:
         """Attempts to place a bet from the given user_input. Returns true if successful."""
         try:
@@ -90,6 +222,7 @@ class BlackjackMinigame(AbstractProgram):
             bet_successful = self.__gambling_manager.place_gamble(attempted_bet)
             self.__money_pool = attempted_bet
             if bet_successful:
+                self.__gambling_manager.remember_bet('blackjack', (self.__money_pool,))
                 print(f"Bet {self.__money_pool} coins!")
                 return True
             else:
@@ -99,12 +232,69 @@ class BlackjackMinigame(AbstractProgram):
             print("Please enter a valid integer of how much to gamble: ", end='')
             return False
 
+    def __autoplay(self, autoplay_settings: AutoplaySettings) -> bool:
+        """
+        Repeats the last blackjack bet until autoplay_settings say to stop, then prints a summary. Every hand is hit
+        until it reaches DEALER_STAND_SCORE. Returns True if autoplay ran, completing this minigame.
+        """
+        last_bet = self.__gambling_manager.get_last_bet('blackjack')
+        if last_bet is None:
+            print("Place a bet first. Autoplay repeats your last bet.")
+            print("How much would you like to gamble (integer)?: ", end='')
+            return False
+
+        bet = last_bet[0]
+        rules = self.__rules
+        # Cards are dealt as their values, ace as 1. An infinite shoe deals them in bulk. A finite shoe is the shoe of
+        # every other hand of the session, refilled between hands as BlackjackTable does, so no hand may be drawn from
+        # it that is not then played: a batch ends at the first hand that reaches a limit.
+        shoe = self.__shoe
+        finite_shoe = rules.decks is not None
+        if not finite_shoe:
+            autoplay_random = new_autoplay_random(self.__random)
+            card_values = list(card_value_map.values())
+            next_card = itertools.chain.from_iterable(
+                iter(lambda: map(card_values.__getitem__,
+                                 draw_below(autoplay_random, len(card_values), AUTOPLAY_BATCH_ROUNDS)), None)).__next__
+        else:
+            def next_card() -> int:
+                return card_value_map[shoe.draw()]
+        drawn_player_scores: list[int] = []
+        drawn_dealer_scores: list[int] = []
+
+        def draw_rounds(rounds: int) -> list[int]:
+            nonlocal drawn_player_scores, drawn_dealer_scores
+            drawn_player_scores, drawn_dealer_scores = [], []
+            nets = []
+            balance = self.__gambling_manager.get_player_coins()
+            for _ in range(rounds):
+                if finite_shoe:
+                    shoe.refill_if_needed()
+                net, player_score, dealer_score = play_autoplay_hand(next_card, rules, bet)
+                nets.append(net)
+                drawn_player_scores.append(player_score)
+                drawn_dealer_scores.append(dealer_score)
+                balance += net
+                if finite_shoe and reaches_limit(balance, bet, autoplay_settings):
+                    break
+            return nets
+
+        def settle_rounds(balances: list[int]) -> int:
+            rounds = len(balances)
+            self.__gambling_manager.settle_rounds('blackjack', bet, balances, drawn_player_scores[:rounds],
+                                                  drawn_dealer_scores[:rounds])
+            return 0
+
+        max_net = max(bet * WIN_PAYOUT_MULTIPLIER, round(bet * rules.blackjack_payout)) - bet
+        print(run_autoplay(self.__gambling_manager, autoplay_settings, bet, max_net, draw_rounds, settle_rounds))
+        return True
+
     def __process_hit(self) -> bool:
         """Processes a hit. Returns true if the game ends as a result of this hit."""
         drawn_card = self.__generate_random_card()
         print(f"Drew a {drawn_card}!\n")
         self.__user_cards.append(drawn_card)
-        user_score = self.__calculate_score(self.__user_cards)
+        user_score = calculate_score(self.__user_cards)
         self._print_game_state()
         if user_score > 21:
             print("\nBust! Better luck next time.")
@@ -117,6 +307,18 @@ class BlackjackMinigame(AbstractProgram):
             print("\nDo you want to hit, or stand?: ", end='')
             return False
 
+    def get_user_cards(self) -> tuple:
+        """Returns the cards in the player's hand, or an empty tuple if cards have not been dealt."""
+        return tuple(self.__user_cards) if self.__user_cards is not None else ()
+
+    def get_dealer_shown_card(self):
+        """Returns the dealer's face up card, or None if cards have not been dealt."""
+        return self.__dealer_cards[0] if self.__dealer_cards is not None else None
+
+    def get_user_score(self) -> int:
+        """Returns the blackjack score of the player's hand."""
+        return calculate_score(self.get_user_cards())
+
     def _print_game_state(self) -> None:
         """Prints all information available to the player when deciding to hit or stand."""
         print(f"The dealer's shown card is: {self.__dealer_cards[0]}\n")
@@ -124,7 +326,7 @@ class BlackjackMinigame(AbstractProgram):
         for i in range(len(self.__user_cards) - 1):
             print(self.__user_cards[i], end=", ")
         print(self.__user_cards[len(self.__user_cards) - 1])
-        print("Your current score is: " + str(self.__calculate_score(self.__user_cards)))
+        print("Your current score is: " + str(calculate_score(self.__user_cards)))
 
     def __print_dealer_cards(self) -> None:
         """Prints the dealer's cards. Used when the dealer is drawing."""
@@ -133,28 +335,9 @@ class BlackjackMinigame(AbstractProgram):
             print(self.__dealer_cards[i], end=", ")
         print(self.__dealer_cards[len(self.__dealer_cards) - 1])
 
-    def __calculate_score(self, cards: list[str]):
-        """Calculates the highest blackjack score for cards without going over 21."""
-        score = 0
-
-        # Count non-ace score and count aces
-        num_aces = 0
-        for card in cards:
-            if card == "ace":
-                num_aces += 1
-                continue
-            score += card_value_map[card]
-
-        # Count aces to get the closest score to 21 without going over
-        score += num_aces * 11
-        while num_aces > 0 and score > 21:
-            score -= 10
-            num_aces -= 1
-        return score
-
     def __generate_random_card(self) -> str:
         """Generates a random card type (i.e. 1, 2, 3, ..., queen, king, ace)"""
-        return random.choice(list(card_value_map.keys()))
+        return self.__shoe.draw()
 
     def __process_stand(self) -> None:
         """
@@ -166,10 +349,11 @@ class BlackjackMinigame(AbstractProgram):
         self.__print_dealer_cards()
 
         # Allow the dealer to make moves
-        current_dealer_score = self.__calculate_score(self.__dealer_cards)
+        current_dealer_score = calculate_score(self.__dealer_cards)
 
-        # The dealer will continue to draw cards until their total is above 16, or they bust
-        while current_dealer_score < 17:
+        # The dealer will continue to draw cards until their total is above 16 (or a hard 17 if the dealer hits soft
+        # 17), or they bust
+        while should_dealer_hit(self.__dealer_cards, self.__rules):
             # The dealer draws
             print("The dealer hits again.")
             drawn_card = self.__generate_random_card()
@@ -179,12 +363,12 @@ class BlackjackMinigame(AbstractProgram):
             self.__print_dealer_cards()
 
             # Process the dealer's score
-            current_dealer_score = self.__calculate_score(self.__dealer_cards)
+            current_dealer_score = calculate_score(self.__dealer_cards)
         print("The dealer stands.")
 
         # The dealer has finished hitting. Determine victor.
         player_victory = False
-        user_score = self.__calculate_score(self.__user_cards)
+        user_score = calculate_score(self.__user_cards)
         print(f"\nThe dealer's total is: {current_dealer_score}")
         print(f"Your total is: {user_score}")
         if current_dealer_score > 21:
@@ -196,15 +380,17 @@ class BlackjackMinigame(AbstractProgram):
         elif user_score < current_dealer_score:
             print("You lose, the dealer beat you :(")
             player_victory = False
-        else:
+        elif self.__rules.push_returns_bet:
             print("Draw! Your coins will be returned.")
             # Return the player's original bet
             self.__gambling_manager.give_player_payout(self.__money_pool)
             return
+        else:
+            print("Draw! The house wins ties.")
 
         # Distribute rewards to winner
         if player_victory:
-            self.__gambling_manager.give_player_payout(self.__money_pool * 2)
+            self.__gambling_manager.give_player_payout(self.__money_pool * WIN_PAYOUT_MULTIPLIER)
 
     def __deal_cards(self):
         self.__dealer_cards = [self.__generate_random_card(), self.__generate_random_card()]
@@ -218,10 +404,13 @@ class BlackjackMinigame(AbstractProgram):
         if dealer_blackjack:
             print("The dealer has a blackjack!")
 
-        if player_blackjack and dealer_blackjack:
+        if player_blackjack and dealer_blackjack and self.__rules.blackjack_push_returns_bet:
             print("Because both the player and dealer have a blackjack, it's a tie. Coins are returned.")
+            self.__gambling_manager.give_player_payout(self.__money_pool)
+        elif player_blackjack and dealer_blackjack:
+            print("Because both the player and dealer have a blackjack, it's a tie. The house wins ties.")
         elif player_blackjack:
             print("You win by blackjack! Congratulations!")
-            self.__gambling_manager.give_player_payout(self.__money_pool * 3)
+            self.__gambling_manager.give_player_payout(round(self.__money_pool * self.__rules.blackjack_payout))
         elif dealer_blackjack:
             print("The dealer has a blackjack. The game is over.")
@@ -0,0 +1,70 @@
+import hashlib
+import json
+from typing import Any
+from typing import Optional
+
+# The dealer draws until their score reaches DEALER_STAND_SCORE, and a winning hand is paid WIN_PAYOUT_MULTIPLIER times
+# the bet. A winning blackjack is paid BLACKJACK_PAYOUT_MULTIPLIER times the bet unless BlackjackRules say otherwise.
+DEALER_STAND_SCORE = 17
+WIN_PAYOUT_MULTIPLIER = 2
+BLACKJACK_PAYOUT_MULTIPLIER = 3
+
+
+class BlackjackRules:
+    """
+    The house rules a game of blackjack is played by. The default BlackjackRules are the rules BlackjackMinigame has
+    always been played by.
+
+    BlackjackRules are immutable, compare equal when every rule is equal, and can be hashed, so a set of rules can key a
+    dict or a cache.
+
+    Attributes:
+        dealer_hits_soft_17 (bool): True if the dealer hits a soft 17, False if they stand on every 17.
+        blackjack_payout (float): The total paid for a winning blackjack per coin bet, including the bet itself.
+        decks (Optional[int]): The number of decks in the shoe, or None to draw every card from an infinite shoe.
+        push_returns_bet (bool): True if the bet is returned when the player and dealer tie, False if the house wins
+            ties.
+        blackjack_push_returns_bet (bool): True if the bet is returned when the player and dealer both have a blackjack,
+            False if the house wins.
+    """
+
+    __slots__ = ('dealer_hits_soft_17', 'blackjack_payout', 'decks', 'push_returns_bet', 'blackjack_push_returns_bet')
+
+    def __init__(self, dealer_hits_soft_17: bool = False, blackjack_payout: float = BLACKJACK_PAYOUT_MULTIPLIER,
+                 decks: Optional[int] = None, push_returns_bet: bool = True, blackjack_push_returns_bet: bool = False):
+        """
+        Constructs BlackjackRules.
+        :exception ValueError: If blackjack_payout is less than 1 or decks is not positive.
+        """
+        if blackjack_payout < 1:
+            raise ValueError("A blackjack must pay at least the bet back.")
+        if decks is not None and decks <= 0:
+            raise ValueError("The shoe must hold at least one deck.")
+        object.__setattr__(self, 'dealer_hits_soft_17', dealer_hits_soft_17)
+        object.__setattr__(self, 'blackjack_payout', float(blackjack_payout))
+        object.__setattr__(self, 'decks', decks)
+        object.__setattr__(self, 'push_returns_bet', push_returns_bet)
+        object.__setattr__(self, 'blackjack_push_returns_bet', blackjack_push_returns_bet)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns every rule by name."""
+        return {name: getattr(self, name) for name in BlackjackRules.__slots__}
+
+    def get_config_hash(self) -> str:
+        """Returns a hex digest that identifies these rules across processes and runs."""
+        return hashlib.sha256(json.dumps(self.to_dict(), sort_keys=True).encode()).hexdigest()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("BlackjackRules are immutable.")
+
+    def __reduce__(self) -> tuple:
+        return BlackjackRules, tuple(self.to_dict().values())
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BlackjackRules) and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.to_dict().values()))
+
+    def __repr__(self) -> str:
+        return f'BlackjackRules({str.join(", ", (f"{name}={value!r}" for name, value in self.to_dict().items()))})'
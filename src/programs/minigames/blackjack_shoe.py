@@ -0,0 +1,60 @@
+import random
+from typing import Any
+from typing import Optional
+from typing import Sequence
+
+# Each card type appears once per suit
+_SUITS = 4
+
+
+class BlackjackShoe:
+    """
+    The cards a blackjack dealer deals from.
+
+    An infinite shoe deals every card type with equal probability on every draw. A shoe of a fixed number of decks deals
+    without replacement and is refilled once too few cards remain. Every card is drawn with random.Random.choice, so
+    games dealt from a BlackjackShoe can be recorded and replayed.
+    """
+
+    def __init__(self, card_types: Sequence[Any], random_generator: random.Random, decks: Optional[int] = None,
+                 penetration: float = 0.75):
+        """
+        Constructs a full BlackjackShoe.
+
+        Args:
+            card_types (Sequence[Any]): Every type of card in a suit.
+            random_generator (random.Random): The source of randomness for every draw.
+            decks (Optional[int]): The number of decks in the shoe, or None for an infinite shoe.
+            penetration (float): The fraction of a finite shoe dealt before refill_if_needed refills it.
+        """
+        self.__card_types = list(card_types)
+        self.__random = random_generator
+        self.__decks = decks
+        self.__penetration = penetration
+        self.__cards: list = []
+        if self.__decks is not None:
+            self.__refill()
+
+    def draw(self) -> Any:
+        """Deals a single card, refilling a finite shoe first if it is empty."""
+        if self.__decks is None:
+            return self.__random.choice(self.__card_types)
+        if not self.__cards:
+            self.__refill()
+        # Swap the drawn card with the last card so that removing it is O(1)
+        index = self.__random.choice(range(len(self.__cards)))
+        card = self.__cards[index]
+        self.__cards[index] = self.__cards[-1]
+        self.__cards.pop()
+        return card
+
+    def refill_if_needed(self) -> None:
+        """Refills a finite shoe if its penetration has been dealt. Call between rounds, never during one."""
+        if self.__decks is not None and len(self.__cards) < self.__get_capacity() * (1 - self.__penetration):
+            self.__refill()
+
+    def __get_capacity(self) -> int:
+        return len(self.__card_types) * _SUITS * self.__decks
+
+    def __refill(self) -> None:
+        self.__cards = self.__card_types * (_SUITS * self.__decks)
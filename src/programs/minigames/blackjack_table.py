@@ -0,0 +1,212 @@
+import random
+from typing import Optional
+
+from src.managers.gambling_manager import GamblingManager
+from src.programs.minigames.blackjack import calculate_score
+from src.programs.minigames.blackjack import card_value_map
+from src.programs.minigames.blackjack import should_dealer_hit
+from src.programs.minigames.blackjack_rules import BlackjackRules
+from src.programs.minigames.blackjack_rules import WIN_PAYOUT_MULTIPLIER
+from src.programs.minigames.blackjack_shoe import BlackjackShoe
+
+MAX_SEATS = 7
+
+
+def _is_blackjack(cards: list) -> bool:
+    """Returns True if cards are a blackjack: two cards that score 21."""
+    return len(cards) == 2 and calculate_score(cards) == 21
+
+
+class _Seat:
+    """A player sitting at a BlackjackTable and their hand for the current round."""
+
+    def __init__(self, gambling_manager: GamblingManager):
+        self.gambling_manager: GamblingManager = gambling_manager
+        self.bet = 0
+        self.cards: list = []
+        # True once the seat can make no more decisions this round
+        self.finished = False
+        self.last_payout = 0
+
+
+class BlackjackTable:
+    """
+    A blackjack table where up to MAX_SEATS players, each with their own GamblingManager, play against one dealer.
+
+    A round starts with every seat that wants to play placing a bet. A single deal then gives the dealer one hand shared
+    by the whole table and every betting seat its own hand. Seats hit or stand independently, in any order, and once
+    every seat has finished the dealer plays their hand once and every seat is settled in a single pass. Hands are
+    played and settled by BlackjackRules as in BlackjackMinigame, and a finite shoe is kept from round to round.
+
+    BlackjackTable prints nothing; it is driven through its methods by whatever is serving the players at the table.
+    """
+
+    def __init__(self, random_generator: Optional[random.Random] = None, rules: Optional[BlackjackRules] = None):
+        self.__random: random.Random = random_generator if random_generator is not None else random.Random()
+        self.__rules: BlackjackRules = rules if rules is not None else BlackjackRules()
+        self.__shoe = BlackjackShoe(list(card_value_map.keys()), self.__random, self.__rules.decks)
+        self.__seats: list[Optional[_Seat]] = [None] * MAX_SEATS
+        self.__dealer_cards: list = []
+        self.__round_in_progress = False
+
+    def add_seat(self, gambling_manager: GamblingManager) -> int:
+        """
+        Seats a player at the first empty seat. Players seated while a round is in progress join the next round.
+        :return: The index of the seat the player was given.
+        :exception ValueError: If every seat is taken.
+        """
+        for seat_index in range(MAX_SEATS):
+            if self.__seats[seat_index] is None:
+                self.__seats[seat_index] = _Seat(gambling_manager)
+                return seat_index
+        raise ValueError(f"All {MAX_SEATS} seats at the table are taken.")
+
+    def remove_seat(self, seat_index: int) -> None:
+        """
+        Removes the player at seat_index from the table.
+        :exception ValueError: If the seat is empty or has a bet in the round in progress.
+        """
+        seat = self.__get_seat(seat_index)
+        if self.__round_in_progress and seat.bet > 0:
+            raise ValueError("A seat cannot leave while its bet is in play.")
+        self.__seats[seat_index] = None
+
+    def place_bet(self, seat_index: int, number_of_coins: int) -> bool:
+        """
+        Places the bet of seat_index for the next deal through the seat's GamblingManager.
+        :return: True if the bet was placed, False if the GamblingManager refused it.
+        :exception ValueError: If the seat is empty, has already bet, or a round is in progress.
+        """
+        seat = self.__get_seat(seat_index)
+        if self.__round_in_progress:
+            raise ValueError("Bets cannot be placed while a round is in progress.")
+        if seat.bet > 0:
+            raise ValueError("This seat has already placed a bet.")
+        if not seat.gambling_manager.place_gamble(number_of_coins):
+            return False
+        seat.bet = number_of_coins
+        return True
+
+    def deal(self) -> None:
+        """
+        Deals the dealer's hand and a hand to every seat that has bet, settling the round at once if the dealer has a
+        blackjack or no seat is left to decide.
+        :exception ValueError: If a round is in progress or no seat has bet.
+        """
+        if self.__round_in_progress:
+            raise ValueError("A round is already in progress.")
+        playing_seats = [seat for seat in self.__seats if seat is not None and seat.bet > 0]
+        if not playing_seats:
+            raise ValueError("No seat has placed a bet.")
+
+        self.__round_in_progress = True
+        self.__shoe.refill_if_needed()
+        self.__dealer_cards = [self.__generate_random_card(), self.__generate_random_card()]
+        for seat in playing_seats:
+            seat.cards = [self.__generate_random_card(), self.__generate_random_card()]
+            seat.finished = calculate_score(seat.cards) == 21
+
+        if calculate_score(self.__dealer_cards) == 21 or all(seat.finished for seat in playing_seats):
+            self.__settle()
+
+    def process_decision(self, seat_index: int, decision: str) -> bool:
+        """
+        Processes a seat's decision to 'hit' or 'stand'. A seat that busts or reaches 21 finishes automatically.
+        :return: True if this decision finished the last undecided seat and so settled the round.
+        :exception ValueError: If decision is not 'hit' or 'stand', or the seat has no decision to make.
+        """
+        seat = self.__get_seat(seat_index)
+        if not self.__round_in_progress or seat.bet == 0 or seat.finished:
+            raise ValueError("This seat has no decision to make.")
+        decision = decision.lower()
+        if decision == 'hit':
+            seat.cards.append(self.__generate_random_card())
+            seat.finished = calculate_score(seat.cards) >= 21
+        elif decision == 'stand':
+            seat.finished = True
+        else:
+            raise ValueError(f"Unknown decision '{decision}'; expected 'hit' or 'stand'.")
+
+        if any(seat is not None and seat.bet > 0 and not seat.finished for seat in self.__seats):
+            return False
+        self.__settle()
+        return True
+
+    def is_round_in_progress(self) -> bool:
+        """Returns True between a deal and the settlement of that round."""
+        return self.__round_in_progress
+
+    def get_deciding_seats(self) -> list[int]:
+        """Returns the indices of the seats that still have to hit or stand this round."""
+        if not self.__round_in_progress:
+            return []
+        return [seat_index for seat_index, seat in enumerate(self.__seats)
+                if seat is not None and seat.bet > 0 and not seat.finished]
+
+    def get_seat_cards(self, seat_index: int) -> tuple:
+        """Returns the cards in the hand of seat_index, which remain visible until the next deal."""
+        return tuple(self.__get_seat(seat_index).cards)
+
+    def get_seat_score(self, seat_index: int) -> int:
+        """Returns the blackjack score of the hand of seat_index."""
+        return calculate_score(self.__get_seat(seat_index).cards)
+
+    def get_last_payout(self, seat_index: int) -> int:
+        """Returns the coins paid to seat_index, including its returned bet, when its last round was settled."""
+        return self.__get_seat(seat_index).last_payout
+
+    def get_dealer_shown_card(self):
+        """Returns the dealer's face up card, or None if no round has been dealt."""
+        return self.__dealer_cards[0] if self.__dealer_cards else None
+
+    def get_dealer_cards(self) -> tuple:
+        """Returns every card in the dealer's hand once the round is settled, or an empty tuple while it is in play."""
+        return () if self.__round_in_progress else tuple(self.__dealer_cards)
+
+    def __get_seat(self, seat_index: int) -> _Seat:
+        """
+        Returns the seat at seat_index.
+        :exception ValueError: If there is no player at seat_index.
+        """
+        if not 0 <= seat_index < MAX_SEATS or self.__seats[seat_index] is None:
+            raise ValueError(f"There is no player at seat {seat_index}.")
+        return self.__seats[seat_index]
+
+    def __generate_random_card(self):
+        """Generates a random card type (i.e. 1, 2, 3, ..., queen, king, ace)"""
+        return self.__shoe.draw()
+
+    def __settle(self) -> None:
+        """Plays the dealer's hand once for the whole table, then pays out and ends the round of every seat."""
+        playing_seats = [seat for seat in self.__seats if seat is not None and seat.bet > 0]
+        dealer_score = calculate_score(self.__dealer_cards)
+        dealer_blackjack = dealer_score == 21
+
+        # The dealer only draws if some seat is still standing on a hand that is neither bust nor a blackjack
+        if not dealer_blackjack and any(calculate_score(seat.cards) <= 21 and not _is_blackjack(seat.cards)
+                                        for seat in playing_seats):
+            while should_dealer_hit(self.__dealer_cards, self.__rules):
+                self.__dealer_cards.append(self.__generate_random_card())
+                dealer_score = calculate_score(self.__dealer_cards)
+
+        for seat in playing_seats:
+            seat_score = calculate_score(seat.cards)
+            payout = 0
+            if dealer_blackjack and _is_blackjack(seat.cards):
+                payout = seat.bet if self.__rules.blackjack_push_returns_bet else 0
+            elif dealer_blackjack or seat_score > 21:
+                payout = 0
+            elif _is_blackjack(seat.cards):
+                payout = round(seat.bet * self.__rules.blackjack_payout)
+            elif dealer_score > 21 or seat_score > dealer_score:
+                payout = seat.bet * WIN_PAYOUT_MULTIPLIER
+            elif seat_score == dealer_score and self.__rules.push_returns_bet:
+                payout = seat.bet
+            seat.last_payout = payout
+            if payout > 0:
+                seat.gambling_manager.give_player_payout(payout)
+            seat.gambling_manager.record_outcome('blackjack', seat_score, dealer_score)
+            seat.gambling_manager.end_round()
+            seat.bet = 0
+            seat.finished = False
+        self.__round_in_progress = False
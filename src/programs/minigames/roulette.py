@@ -1,8 +1,23 @@
 import random
+from array import array
+from typing import Optional
 from typing import override
 
 from src.managers.gambling_manager import GamblingManager
 from src.programs.abstract_program import AbstractProgram
+from src.programs.minigames.autoplay import AUTOPLAY_USAGE
+from src.programs.minigames.autoplay import AutoplaySettings
+from src.programs.minigames.autoplay import draw_below
+from src.programs.minigames.autoplay import new_autoplay_random
+from src.programs.minigames.autoplay import run_autoplay
+
+WHEEL = ('1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14',
+         '15', '16', '17', '18', '19', '20', '21', '22', '23', '24', '25', '26', '27',
+         '28', '29', '30', '31', '32', '33', '34', '35', '36', '0', '00')
+# A winning bet on n numbers wins NUMBER_PAYOUT_NUMERATOR / n times the bet, and a winning color bet wins the multiplier
+# below. The bet itself is returned on top of the winnings.
+NUMBER_PAYOUT_NUMERATOR = 37
+COLOR_PAYOUT_MULTIPLIERS = {'red': 1, 'black': 1, 'green': 36}
 
 
 class RouletteMinigame(AbstractProgram):
@@ -12,12 +27,10 @@ class RouletteMinigame(AbstractProgram):
     Written by Parker Cornelius. Adapted to the AbstractProgram interface by Daniel Myers.
     """
 
-    def __init__(self, gambling_manager: GamblingManager):
+    def __init__(self, gambling_manager: GamblingManager, random_generator: Optional[random.Random] = None):
         super().__init__()
         self.__gambling_manager = gambling_manager
-        self.__wheel = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14',
-                        '15', '16', '17', '18', '19', '20', '21', '22', '23', '24', '25', '26', '27',
-                        '28', '29', '30', '31', '32', '33', '34', '35', '36', '0', '00']
+        self.__random: random.Random = random_generator if random_generator is not None else random.Random()
         self.__money_pool = None
         self.__bet_type = None
 
@@ -26,6 +39,11 @@ class RouletteMinigame(AbstractProgram):
         print("Roulette!")
         print("Place bets on a color or on numbers to win money based off the odds")
         print(f"Current money: {self.__gambling_manager.get_player_coins()} coins")
+        bet_advice = self.__gambling_manager.get_bet_advice('roulette')
+        if bet_advice is not None:
+            print(bet_advice)
+        if self.__gambling_manager.get_last_bet('roulette') is not None:
+            print(f"Enter {AUTOPLAY_USAGE} as your bet to repeat your last bet without watching the wheel.")
         print("Enter your bet: ", end="")
         return False
 
@@ -33,6 +51,15 @@ class RouletteMinigame(AbstractProgram):
     def _process_input(self, user_input: str) -> bool:
         # If a bet has not yet been cast, interpret input as bet
         if self.__money_pool is None:
+            try:
+                autoplay_settings = AutoplaySettings.parse(user_input)
+            except ValueError as error:
+                print(error)
+                print("Enter your bet: ", end="")
+                return False
+            if autoplay_settings is not None:
+                return self.__autoplay(autoplay_settings)
+
             successful_bet = self.__place_user_bet(user_input)
             if successful_bet:
                 print("Do you want to bet on a 'number' or 'color'? ", end='')
@@ -56,6 +83,7 @@ class RouletteMinigame(AbstractProgram):
 
         # Gather input for specific bet type and then run roulette.
         if self.__bet_type == 'number':
+            bet_color = None
             bet_numbers = [x.strip() for x in user_input.split(',')]
             bet_number_set = set()
             for number in bet_numbers:
@@ -64,7 +92,7 @@ class RouletteMinigame(AbstractProgram):
                     print("Invalid bet. Try again: ", end='')
                     return False
                 bet_number_set.add(number)
-                if number not in self.__wheel:
+                if number not in WHEEL:
                     print("Invalid bet. Try again: ", end='')
                     return False
         elif self.__bet_type == 'color':
@@ -75,37 +103,28 @@ class RouletteMinigame(AbstractProgram):
             else:
                 print("Please enter 'red', 'black', or 'green'.")
                 return False
+        self.__gambling_manager.remember_bet('roulette', (self.__money_pool, bet_numbers, bet_color))
 
         # Spin the wheel
-        result = random.choice(self.__wheel)
-        if result == '0' or result == '00':
-            result_color = 'green'
-        elif int(result) % 2 == 1:
-            result_color = 'red'
-        else:
-            result_color = 'black'
+        result = self.__random.choice(WHEEL)
+        result_color = RouletteMinigame.get_result_color(result)
         print(f"\nThe wheel landed on: {result} ({result_color})")
 
         # Calculate winnings
-        winnings = 0
+        winnings = RouletteMinigame.__get_winnings(self.__money_pool, bet_numbers, bet_color, result)
 
         # number betting results
         if self.__bet_type == 'number':
-            if result in bet_numbers:
-                payout_multiplier = 37 / len(bet_numbers)
-                winnings = round(self.__money_pool * payout_multiplier)
+            if winnings > 0:
                 print(f"Congratulations! You won {winnings} coins on number {result}.")
             else:
                 print(f"L, {result}")
 
         # Color betting results
         elif self.__bet_type == 'color':
-            if bet_color == result_color:
+            if winnings > 0:
                 if bet_color == 'red' or bet_color == 'black':
-                    winnings = self.__money_pool
                     print(f"Congratulations! You won {winnings} coins on {result_color}.")
-                elif bet_color == 'green':
-                    winnings = round(self.__money_pool * 36)
             else:
                 print(f"L, {result_color}")
 
@@ -115,8 +134,75 @@ class RouletteMinigame(AbstractProgram):
             self.__gambling_manager.give_player_payout(winnings)
         else:
             print(f"Lost {self.__money_pool} coins.\n")
+        self.__gambling_manager.record_outcome('roulette', wheel_result=WHEEL.index(result))
+        self.__gambling_manager.end_round()
         return True
 
+    def get_bet(self) -> Optional[int]:
+        """Returns the number of coins bet, or None if no bet has been placed."""
+        return self.__money_pool
+
+    def get_bet_type(self) -> Optional[str]:
+        """Returns 'number' or 'color', or None if the type of bet has not been chosen."""
+        return self.__bet_type
+
+    def __autoplay(self, autoplay_settings: AutoplaySettings) -> bool:
+        """
+        Repeats the last roulette bet until autoplay_settings say to stop, then prints a summary. Returns True if
+        autoplay ran, completing this minigame.
+        """
+        last_bet = self.__gambling_manager.get_last_bet('roulette')
+        if last_bet is None:
+            print("Place a bet first. Autoplay repeats your last bet.")
+            print("Enter your bet: ", end="")
+            return False
+        bet, bet_numbers, bet_color = last_bet
+        autoplay_random = new_autoplay_random(self.__random)
+        # The coins won less the bet when the wheel lands on each pocket
+        pocket_nets = []
+        for pocket in WHEEL:
+            winnings = RouletteMinigame.__get_winnings(bet, bet_numbers, bet_color, pocket)
+            pocket_nets.append(winnings if winnings > 0 else -bet)
+        drawn_pockets = array('I')
+
+        def draw_rounds(rounds: int) -> list[int]:
+            nonlocal drawn_pockets
+            drawn_pockets = draw_below(autoplay_random, len(WHEEL), rounds)
+            return [pocket_nets[pocket] for pocket in drawn_pockets]
+
+        def settle_rounds(balances: list[int]) -> int:
+            self.__gambling_manager.settle_rounds('roulette', bet, balances,
+                                                  wheel_results=drawn_pockets[:len(balances)])
+            return 0
+
+        print(run_autoplay(self.__gambling_manager, autoplay_settings, bet, max(pocket_nets), draw_rounds,
+                           settle_rounds))
+        return True
+
+    @staticmethod
+    def __get_winnings(bet: int, bet_numbers: list[str], bet_color: Optional[str], result: str) -> int:
+        """
+        Returns the coins won, not counting the returned bet, by a bet on bet_color, or on bet_numbers if bet_color is
+        None, when the wheel lands on result. Returns 0 if the bet lost.
+        """
+        if bet_color is None:
+            if result in bet_numbers:
+                return round(bet * (NUMBER_PAYOUT_NUMERATOR / len(bet_numbers)))
+            return 0
+        if bet_color == RouletteMinigame.get_result_color(result):
+            return round(bet * COLOR_PAYOUT_MULTIPLIERS[bet_color])
+        return 0
+
+    @staticmethod
+    def get_result_color(result: str) -> str:
+        """Returns the color of the pocket of the wheel labelled result: 'red', 'black' or 'green'."""
+        if result == '0' or result == '00':
+            return 'green'
+        elif int(result) % 2 == 1:
+            return 'red'
+        else:
+            return 'black'
+
     def __place_user_bet(self, user_input: str) -> bool:
         """Attempts to place a bet from the given user_input. Returns true if successful."""
         try:
@@ -0,0 +1,255 @@
+import json
+from array import array
+from typing import Any
+from typing import Optional
+
+# The number of reels every slot machine spins
+REEL_COUNT = 3
+
+# The machine SlotsMinigame has always been. Every reel is a strip of stops laid out symbol by symbol in the order
+# below, each symbol taking as many stops as its weight on that reel, so reel stop 0 is the 7, stops 1 and 2 are
+# cherries, and so on. A spin pays the bet times the multiplier of the paytable entry for the category of the symbol
+# that appears on two ('pair') or three ('triple') reels, or times the 'no_match' multiplier if every reel differs.
+# Messages are formatted with the multiplier they announce.
+DEFAULT_MACHINE_DEFINITION: dict[str, Any] = {
+    'symbols': [
+        {'name': 'seven', 'display': '   7   ', 'category': 'seven', 'weights': [1, 1, 1]},
+        {'name': 'cherries', 'display': '  \N{cherries}  ', 'category': 'fruit', 'weights': [2, 2, 2]},
+        {'name': 'lemon', 'display': '  \N{lemon}  ', 'category': 'fruit', 'weights': [2, 2, 2]},
+        {'name': 'watermelon', 'display': '  \N{watermelon}  ', 'category': 'fruit', 'weights': [2, 2, 2]},
+        {'name': 'banana', 'display': '  \N{banana}  ', 'category': 'fruit', 'weights': [2, 2, 2]},
+        {'name': 'gem', 'display': '  \N{gem stone}  ', 'category': 'luck', 'weights': [2, 2, 2]},
+        {'name': 'bell', 'display': '  \N{bell}  ', 'category': 'luck', 'weights': [2, 2, 2]},
+        {'name': 'bar', 'display': '  BAR  ', 'category': 'luck', 'weights': [2, 2, 2]},
+        {'name': 'skull', 'display': '  \N{skull}  ', 'category': 'death', 'weights': [6, 6, 6]},
+    ],
+    'paytable': {
+        'fruit': {'pair': [1.5, '2 fruits! bet x {multiplier:g}!'],
+                  'triple': [2, '3 fruit! bet x {multiplier:g}!']},
+        'luck': {'pair': [1.75, '2 luck points! bet x {multiplier:g}'],
+                 'triple': [2.5, '3 luck points! bet x {multiplier:g}']},
+        'death': {'pair': [1.5, '2 skulls! bet x {multiplier:g}. Close call...'],
+                  'triple': [0, 'UNLUCKY, BET DOWN TO 0']},
+        'seven': {'pair': [1.5, '2 sevens! bet x {multiplier:g}. So close...'],
+                  'triple': [10, "TRIPLE 7's!!! BET x {multiplier:g}!!! CONGRATS"]},
+    },
+    'no_match': [0.5, 'No matches, bet value / 2'],
+    'jackpot_symbol': 'seven',
+}
+
+
+class SlotMachine:
+    """
+    The reel strips and paytable of a slot machine, compiled from a data definition into lookup arrays.
+
+    A definition is a dict of the form of DEFAULT_MACHINE_DEFINITION, so machine variants can be kept as JSON files and
+    loaded with SlotMachine.load. Compiling maps every reel stop to its symbol, and every combination of symbols to the
+    paytable line it pays, so resolving a spin is a few array lookups. The probability of every paytable line is also
+    found once by enumerating every combination of symbols, so the return to player and hit frequency of a machine are
+    exact and cost nothing to look up.
+    """
+
+    def __init__(self, definition: dict[str, Any]):
+        """
+        Compiles a SlotMachine from its definition.
+        :exception ValueError: If the definition is malformed.
+        """
+        try:
+            symbols = definition['symbols']
+            names = [symbol['name'] for symbol in symbols]
+            displays = [str(symbol['display']) for symbol in symbols]
+            categories = [symbol['category'] for symbol in symbols]
+            weights = [[int(weight) for weight in symbol['weights']] for symbol in symbols]
+            paytable = definition['paytable']
+            no_match_multiplier, no_match_message = definition['no_match']
+            jackpot_symbol = names.index(definition['jackpot_symbol'])
+            # Line 0 is the no match line, followed by the pair and triple lines of every category
+            line_categories = list(dict.fromkeys(categories))
+            line_multipliers = [float(no_match_multiplier)]
+            line_messages = [no_match_message]
+            for category in line_categories:
+                for count in ('pair', 'triple'):
+                    multiplier, message = paytable[category][count]
+                    line_multipliers.append(float(multiplier))
+                    line_messages.append(message)
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"Malformed slot machine definition: {error!r}") from error
+        if not symbols or len(set(names)) != len(names):
+            raise ValueError("A slot machine needs at least one symbol, and symbol names must be unique.")
+        if any(len(symbol_weights) != REEL_COUNT or min(symbol_weights) < 0 for symbol_weights in weights):
+            raise ValueError(f"Every symbol needs a weight of at least 0 on each of the {REEL_COUNT} reels.")
+        if any(sum(reel_weights) == 0 for reel_weights in zip(*weights)):
+            raise ValueError("Every reel needs at least one stop.")
+        if min(line_multipliers) < 0:
+            raise ValueError("Multipliers cannot be negative.")
+
+        self.__definition: dict[str, Any] = json.loads(json.dumps(definition))
+        self.__displays: tuple[str, ...] = tuple(displays)
+        self.__jackpot_symbol: int = jackpot_symbol
+        self.__line_multipliers: array = array('d', line_multipliers)
+        self.__line_messages: tuple[str, ...] = tuple(line_messages)
+        # The symbol on every stop of every reel
+        self.__reels: tuple[array, ...] = tuple(
+            array('B', (symbol for symbol, symbol_weights in enumerate(weights)
+                        for _ in range(symbol_weights[reel])))
+            for reel in range(REEL_COUNT))
+        # The paytable line of every combination of symbols, indexed by (symbol1 * symbols + symbol2) * symbols +
+        # symbol3
+        self.__lines: array = get_line_table([line_categories.index(category) for category in categories])
+        self.__line_probabilities: tuple[float, ...] = get_line_probabilities(self.__lines, weights,
+                                                                              len(line_multipliers))
+        # The paytable line of every combination of stops, built the first time autoplay needs it
+        self.__combination_lines: Optional[bytes] = None
+
+    @staticmethod
+    def load(path: str) -> 'SlotMachine':
+        """
+        Compiles the SlotMachine defined by the JSON file at path.
+        :exception OSError: If the file cannot be read.
+        :exception ValueError: If the file is not a valid slot machine definition.
+        """
+        with open(path, encoding='utf-8') as definition_file:
+            return SlotMachine(json.load(definition_file))
+
+    def save(self, path: str) -> None:
+        """Writes the definition of this SlotMachine to path as JSON."""
+        with open(path, 'w', encoding='utf-8') as definition_file:
+            json.dump(self.__definition, definition_file, ensure_ascii=False, indent=4)
+
+    def get_definition(self) -> dict[str, Any]:
+        """Returns a copy of the definition this SlotMachine was compiled from."""
+        return json.loads(json.dumps(self.__definition))
+
+    def get_stop_count(self, reel: int) -> int:
+        """Returns the number of stops on reel, counting from 0."""
+        return len(self.__reels[reel])
+
+    def get_display(self, reel: int, stop: int) -> str:
+        """Returns the text shown for stop of reel."""
+        return self.__displays[self.__reels[reel][stop]]
+
+    def get_line(self, stop1: int, stop2: int, stop3: int) -> int:
+        """Returns the paytable line paid when the reels land on the given stops."""
+        symbols = len(self.__displays)
+        return self.__lines[(self.__reels[0][stop1] * symbols + self.__reels[1][stop2]) * symbols
+                            + self.__reels[2][stop3]]
+
+    def get_line_multiplier(self, line: int) -> float:
+        """Returns the multiplier applied to the bet by paytable line."""
+        return self.__line_multipliers[line]
+
+    def get_line_message(self, line: int) -> str:
+        """Returns the message announcing paytable line."""
+        return self.__line_messages[line].format(multiplier=self.__line_multipliers[line])
+
+    def get_line_payouts(self, bet: int) -> tuple[int, ...]:
+        """Returns the whole coins paid for bet by every paytable line, indexed by line."""
+        return tuple(round(float(bet) * multiplier) for multiplier in self.__line_multipliers)
+
+    def get_combination_count(self) -> int:
+        """Returns the number of combinations of stops the reels can land on."""
+        return len(self.__reels[0]) * len(self.__reels[1]) * len(self.__reels[2])
+
+    def get_combination_stops(self, combination: int) -> tuple[int, int, int]:
+        """Returns the stop of every reel in combination, an index into get_combination_lines."""
+        stops23, stop3 = divmod(combination, len(self.__reels[2]))
+        stop1, stop2 = divmod(stops23, len(self.__reels[1]))
+        return stop1, stop2, stop3
+
+    def get_combination_lines(self) -> bytes:
+        """
+        Returns the paytable line of every combination of stops, indexed by (stop1 * stops2 + stop2) * stops3 + stop3
+        where stops2 and stops3 are the stop counts of reels 2 and 3. Autoplay draws combinations from this table
+        rather than drawing each reel. It holds one byte per combination and is built on first use, one row of reel 3
+        at a time.
+        """
+        if self.__combination_lines is None:
+            symbols = len(self.__displays)
+            reel3 = self.__reels[2].tobytes()
+            rows: dict[tuple[int, int], bytes] = {}
+            for symbol1 in set(self.__reels[0]):
+                for symbol2 in set(self.__reels[1]):
+                    base = (symbol1 * symbols + symbol2) * symbols
+                    rows[symbol1, symbol2] = reel3.translate(self.__lines[base:base + symbols].tobytes().ljust(256))
+            self.__combination_lines = b''.join(rows[symbol1, symbol2] for symbol1 in self.__reels[0]
+                                         for symbol2 in self.__reels[1])
+        return self.__combination_lines
+
+    def get_jackpot_combinations(self) -> frozenset[int]:
+        """Returns every combination of stops, indexed as in get_combination_lines, that wins the jackpot."""
+        stops2, stops3 = len(self.__reels[1]), len(self.__reels[2])
+        jackpot_stops = [[stop for stop, symbol in enumerate(reel) if symbol == self.__jackpot_symbol]
+                         for reel in self.__reels]
+        return frozenset((stop1 * stops2 + stop2) * stops3 + stop3 for stop1 in jackpot_stops[0]
+                         for stop2 in jackpot_stops[1] for stop3 in jackpot_stops[2])
+
+    def is_jackpot(self, stop1: int, stop2: int, stop3: int) -> bool:
+        """Returns True if the reels landing on the given stops wins the progressive jackpot."""
+        return self.__reels[0][stop1] == self.__reels[1][stop2] == self.__reels[2][stop3] == self.__jackpot_symbol
+
+    def get_outcome_distribution(self) -> tuple[tuple[float, float], ...]:
+        """
+        Returns the (net, probability) pairs of a spin, where net is the number of coins won per coin bet, sorted by
+        net. The progressive jackpot is not included.
+        """
+        probabilities: dict[float, float] = {}
+        for multiplier, probability in zip(self.__line_multipliers, self.__line_probabilities):
+            if probability > 0:
+                probabilities[multiplier - 1] = probabilities.get(multiplier - 1, 0.0) + probability
+        return tuple(sorted(probabilities.items()))
+
+    def get_return_to_player(self) -> float:
+        """Returns the expected coins paid back per coin bet."""
+        return sum(multiplier * probability
+                   for multiplier, probability in zip(self.__line_multipliers, self.__line_probabilities))
+
+    def get_hit_frequency(self) -> float:
+        """Returns the probability that a spin pays back more than the bet."""
+        return sum(probability for multiplier, probability in zip(self.__line_multipliers, self.__line_probabilities)
+                   if multiplier > 1)
+
+
+def get_line_table(symbol_categories: list[int]) -> array:
+    """
+    Returns the paytable line of every combination of symbols, indexed by (symbol1 * symbols + symbol2) * symbols +
+    symbol3, given the index of the category of every symbol. Line 0 is no match, and lines 1 + 2 * category and
+    2 + 2 * category are the pair and triple lines of category.
+    """
+    symbols = len(symbol_categories)
+    lines = array('B', bytes(symbols ** 3))
+    for symbol1 in range(symbols):
+        for symbol2 in range(symbols):
+            for symbol3 in range(symbols):
+                # A symbol on reel 1 that is also on reel 2 or 3 counts once, and a symbol on reels 2 and 3 counts once
+                # more, so two matching reels are a pair and three are a triple
+                matched, count = None, 0
+                if symbol1 == symbol2 or symbol1 == symbol3:
+                    matched, count = symbol1, count + 1
+                if symbol2 == symbol3:
+                    matched, count = symbol2, count + 1
+                if matched is not None:
+                    lines[(symbol1 * symbols + symbol2) * symbols + symbol3] = 2 * symbol_categories[matched] + count
+    return lines
+
+
+def get_line_probabilities(lines: array, weights: list[list[int]], line_count: int) -> tuple[float, ...]:
+    """
+    Returns the probability of every paytable line, found by enumerating every combination of symbols.
+    :param lines: The paytable line of every combination of symbols, as returned by get_line_table.
+    :param weights: The number of stops of every symbol on each reel.
+    :param line_count: The number of paytable lines.
+    """
+    reel_probabilities = [[symbol_weights[reel] / sum(reel_weights) for symbol_weights in weights]
+                          for reel, reel_weights in enumerate(zip(*weights))]
+    probabilities = [0.0] * line_count
+    index = 0
+    for probability1 in reel_probabilities[0]:
+        for probability2 in reel_probabilities[1]:
+            pair_probability = probability1 * probability2
+            for probability3 in reel_probabilities[2]:
+                probabilities[lines[index]] += pair_probability * probability3
+                index += 1
+    return tuple(probabilities)
+
+
+DEFAULT_SLOT_MACHINE = SlotMachine(DEFAULT_MACHINE_DEFINITION)
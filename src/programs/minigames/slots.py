@@ -1,8 +1,19 @@
 import random
+from array import array
+from typing import Optional
 from typing import override
 
 from src.managers.gambling_manager import GamblingManager
+from src.managers.progressive_jackpot import ProgressiveJackpot
 from src.programs.abstract_program import AbstractProgram
+from src.programs.minigames.autoplay import AUTOPLAY_USAGE
+from src.programs.minigames.autoplay import AutoplaySettings
+from src.programs.minigames.autoplay import draw_below
+from src.programs.minigames.autoplay import draw_geometric
+from src.programs.minigames.autoplay import new_autoplay_random
+from src.programs.minigames.autoplay import run_autoplay
+from src.programs.minigames.slot_machine import DEFAULT_SLOT_MACHINE
+from src.programs.minigames.slot_machine import SlotMachine
 
 
 class SlotsMinigame(AbstractProgram):
@@ -12,15 +23,21 @@ class SlotsMinigame(AbstractProgram):
     Written by Caleb Arnold. "Adapted" to the AbstractProgram interface by Daniel Myers.
     """
 
-    def __init__(self, gambling_manager: GamblingManager):
+    def __init__(self, gambling_manager: GamblingManager, random_generator: Optional[random.Random] = None,
+                 jackpot: Optional[ProgressiveJackpot] = None, machine: SlotMachine = DEFAULT_SLOT_MACHINE):
         super().__init__()
         self.__gambling_manager: GamblingManager = gambling_manager
+        self.__random: random.Random = random_generator if random_generator is not None else random.Random()
+        self.__jackpot: Optional[ProgressiveJackpot] = jackpot
+        self.__machine: SlotMachine = machine
 
     @override
     def _execute(self) -> bool:
         print("Welcome to slots!")
-        print(f'You currently have {self.__gambling_manager.get_player_coins()} coins.')
-        print('Enter the number of coins to bet, or enter stop to leave: ', end='')
+        if self.__jackpot is not None:
+            print(f'Progressive jackpot: {self.__jackpot.get_pool():,} coins! Hit triple 7\'s to win it all.')
+        print(f'After a spin, enter {AUTOPLAY_USAGE} to repeat your bet without watching the reels.')
+        self.__print_bet_prompt()
         return False
 
     @override
@@ -30,12 +47,27 @@ class SlotsMinigame(AbstractProgram):
             print("OK, Goodbye")
             return True
 
+        # Autoplay repeats the last bet without rendering any spins
+        try:
+            autoplay_settings = AutoplaySettings.parse(user_input)
+        except ValueError as error:
+            print(error)
+            self.__print_bet_prompt()
+            return False
+        if autoplay_settings is not None:
+            self.__autoplay(autoplay_settings)
+            self.__print_bet_prompt()
+            return False
+
         # Otherwise, attempt to place bet with input
         try:
             attempted_bet = int(user_input)
             if self.__gambling_manager.is_valid_gambling_amount(attempted_bet):
                 bet = attempted_bet
                 self.__gambling_manager.place_gamble(bet)
+                self.__gambling_manager.remember_bet('slots', (bet,))
+                if self.__jackpot is not None:
+                    self.__jackpot.contribute(bet)
             else:
                 print("Please enter a valid bet: ")
                 return False
@@ -44,31 +76,83 @@ class SlotsMinigame(AbstractProgram):
             return False
 
         # Gamble slot
-        slots = self.__run_slots()
-        self.__print_slots(slots[1], slots[3], slots[5])
-        info = self.__reoccur(slots[0], slots[1], slots[2], slots[3], slots[4], slots[5])
-        winnings = self.__points(info[0], info[1], float(bet))
+        stops = self.__run_slots()
+        self.__print_slots(*(self.__machine.get_display(reel, stop) for reel, stop in enumerate(stops)))
+        winnings = self.__points(stops, bet)
         self.__gambling_manager.give_player_payout(winnings)
+        self.__gambling_manager.record_outcome('slots', reels=stops)
+        self.__gambling_manager.end_round()
+        self.__print_bet_prompt()
+
+    def __print_bet_prompt(self) -> None:
+        """Prints the player's coins, any bet advice, and asks for the next bet."""
         print(f'You currently have {self.__gambling_manager.get_player_coins()} coins.')
+        bet_advice = self.__gambling_manager.get_bet_advice('slots')
+        if bet_advice is not None:
+            print(bet_advice)
         print('Enter the number of coins to bet, or enter stop to leave: ', end='')
 
-    def __run_slots(self):  # this function returns the random values and symbols to be used
-        """Returns a tuple of random variables along with their corresponding symbols."""
-        spaces = {0: '   7   ', 1: '  \N{cherries}  ', 2: '  \N{cherries}  ', 3: '  \N{lemon}  ',
-                  4: '  \N{lemon}  ', 5: '  \N{watermelon}  ', 6: '  \N{watermelon}  ', 7: '  \N{banana}  ',
-                  8: '  \N{banana}  ',
-                  9: '  \N{gem stone}  ', 10: '  \N{gem stone}  ', 11: '  \N{bell}  ', 12: '  \N{bell}  ',
-                  13: '  BAR  ',
-                  14: '  BAR  ', 15: '  \N{skull}  ', 16: '  \N{skull}  ', 17: '  \N{skull}  ', 18: '  \N{skull}  ',
-                  19: '  \N{skull}  ',
-                  20: '  \N{skull}  '}
-        # we use the \N to access the unicode, and we will use the numbers along with a random number selector to
-        # access the dictionary
-
-        sym1 = random.randint(0, 20)
-        sym2 = random.randint(0, 20)
-        sym3 = random.randint(0, 20)
-        return sym1, spaces[sym1], sym2, spaces[sym2], sym3, spaces[sym3]
+    def __autoplay(self, autoplay_settings: AutoplaySettings) -> None:
+        """Repeats the last bet on slots until autoplay_settings say to stop, then prints a summary."""
+        last_bet = self.__gambling_manager.get_last_bet('slots')
+        if last_bet is None:
+            print("Place a bet first. Autoplay repeats your last bet.")
+            return
+        bet = last_bet[0]
+        machine = self.__machine
+        autoplay_random = new_autoplay_random(self.__random)
+        # Every spin is drawn as a single combination of stops, whose net for this bet is looked up in one table. The
+        # spins after a jackpot depend on what it paid, so the number of spins before the next jackpot is drawn first,
+        # then that many spins from the combinations that do not win it.
+        line_nets = [payout - bet for payout in machine.get_line_payouts(bet)]
+        combination_nets = list(map(line_nets.__getitem__, machine.get_combination_lines()))
+        jackpot_combinations = sorted(machine.get_jackpot_combinations()) if self.__jackpot is not None else []
+        jackpot_probability = len(jackpot_combinations) / machine.get_combination_count()
+        ordinary_combinations = array('I', sorted(set(range(machine.get_combination_count()))
+                                                  - set(jackpot_combinations)))
+        ordinary_nets = list(map(combination_nets.__getitem__, ordinary_combinations))
+        drawn_ordinary = array('I')
+        drawn_jackpot: Optional[int] = None
+
+        def draw_rounds(rounds: int) -> list[int]:
+            nonlocal drawn_ordinary, drawn_jackpot
+            ordinary_rounds = rounds
+            if jackpot_combinations:
+                ordinary_rounds = min(rounds, draw_geometric(autoplay_random, jackpot_probability))
+            drawn_ordinary = draw_below(autoplay_random, len(ordinary_nets), ordinary_rounds)
+            nets = [ordinary_nets[combination] for combination in drawn_ordinary]
+            drawn_jackpot = None
+            if ordinary_rounds < rounds:
+                drawn_jackpot = autoplay_random.choice(jackpot_combinations)
+                nets.append(combination_nets[drawn_jackpot])
+            return nets
+
+        def settle_rounds(balances: list[int]) -> int:
+            rounds = len(balances)
+            jackpot_won = 0
+            if self.__jackpot is not None:
+                self.__jackpot.contribute(bet, rounds)
+                if rounds > len(drawn_ordinary):
+                    jackpot_won = self.__jackpot.claim()
+                    balances[-1] += jackpot_won
+            reels = None
+            if self.__gambling_manager.is_recording_outcomes():
+                combinations = list(map(ordinary_combinations.__getitem__, drawn_ordinary[:rounds]))
+                if rounds > len(drawn_ordinary):
+                    combinations.append(drawn_jackpot)
+                reels = tuple(zip(*map(machine.get_combination_stops, combinations)))
+            self.__gambling_manager.settle_rounds('slots', bet, balances, reels=reels)
+            return jackpot_won
+
+        print(run_autoplay(self.__gambling_manager, autoplay_settings, bet, max(ordinary_nets), draw_rounds,
+                           settle_rounds))
+
+    def __run_slots(self) -> tuple[int, int, int]:
+        """Returns the stop each reel lands on."""
+        machine = self.__machine
+        randint = self.__random.randint
+        return (randint(0, machine.get_stop_count(0) - 1), randint(0, machine.get_stop_count(1) - 1),
+                randint(0, machine.get_stop_count(2) - 1))
 
     def __print_slots(self, sym1, sym2, sym3):  # this will be used to print the slot grid
         print()
@@ -85,52 +169,13 @@ class SlotsMinigame(AbstractProgram):
         print('-' * lines)
         print()
 
-    def __reoccur(self, val1, sym1, val2, sym2, val3, sym3):
-        # this function goes thru each point, counts the amount the top value reoccurs, and returns the reoccuring value, and
-        # the amount it reoocurs
-        value = 22
-        count = 0
-        if sym1 == sym2 or sym1 == sym3:
-            value = val1
-            count += 1
-        if sym2 == sym3:
-            value = val2
-            count += 1
-        return value, count
-
-    def __points(self, value, count, bank):
-        fruits = [1, 2, 3, 4, 5, 6, 7, 8]  # we are attaching the numbers to lists to assign certain point values
-        luck = [9, 10, 11, 12, 13, 14]
-        death = [15, 16, 17, 18, 19, 20]
-        if value in fruits:
-            if count == 1:
-                bank *= 1.5
-                print('2 fruits! bet x 1.5!')
-            elif count == 2:
-                bank *= 2
-                print('3 fruit! bet x 2!')
-        elif value in luck:
-            if count == 1:
-                bank *= 1.75
-                print('2 luck points! bet x 1.7')
-            elif count == 2:
-                bank *= 2.5
-                print('3 luck points! bet x 2.5')
-        elif value in death:
-            if count == 1:
-                bank *= 1.5
-                print('2 skulls! bet x 1.5. Close call...')
-            if count == 2:
-                bank = 0
-                print('UNLUCKY, BET DOWN TO 0')
-        elif value == 0:
-            if count == 1:
-                bank *= 1.5
-                print('2 sevens! bet x 1.5. So close...')
-            if count == 2:
-                bank *= 10
-                print("TRIPLE 7's!!! BET x 10!!! CONGRATS")
-        elif count == 0:
-            bank /= 2
-            print('No matches, bet value / 2')
-        return round(bank)
\ No newline at end of file
+    def __points(self, stops: tuple[int, int, int], bet: int) -> int:
+        """Prints the paytable line the reels landed on and returns the coins won by bet, including any jackpot."""
+        line = self.__machine.get_line(*stops)
+        print(self.__machine.get_line_message(line))
+        winnings = round(float(bet) * self.__machine.get_line_multiplier(line))
+        if self.__jackpot is not None and self.__machine.is_jackpot(*stops):
+            jackpot_coins = self.__jackpot.claim()
+            winnings += jackpot_coins
+            print(f'AND THE PROGRESSIVE JACKPOT OF {jackpot_coins:,} COINS!!!')
+        return winnings
@@ -1,17 +1,26 @@
+from typing import Optional
+
 from src.items.abstract_item import AbstractItem
 from src.items.groceries import Groceries
 from src.items.honda_civic import HondaCivic
 from src.items.loan import Loan
 from src.items.rent import Rent
+from src.managers.game_clock import GameClock
+from src.metrics.game_metrics import GameMetrics
 from src.player_data import PlayerData
 from src.programs.abstract_program import AbstractProgram
 
 
 class Store(AbstractProgram):
 
-    def __init__(self, player_data: PlayerData):
+    def __init__(self, player_data: PlayerData, game_clock: Optional[GameClock] = None,
+                 metrics: Optional[GameMetrics] = None):
         super().__init__()
         self.__player_data: PlayerData = player_data
+        self.__game_clock: Optional[GameClock] = game_clock
+        self.__metrics: Optional[GameMetrics] = metrics
+        if self.__game_clock is not None:
+            self.__game_clock.catch_up()
 
         all_items = [Groceries(), HondaCivic(), Rent(), Loan()]  # todo add more items
 
@@ -57,6 +66,10 @@ class Store(AbstractProgram):
         self.__player_data.add_item(item)
         del self.__store_item_map[item_name]
         print(item.get_purchase_message())
+        if self.__game_clock is not None:
+            item.on_purchase(self.__player_data, self.__game_clock)
+        if self.__metrics is not None:
+            self.__metrics.purchases.labels(item.get_name()).inc()
         return True
 
     def __prompt_purchase(self) -> None:
@@ -0,0 +1,79 @@
+import random
+from typing import Any
+from typing import Optional
+from typing import Sequence
+
+from src.exceptions.unrecorded_draw_exception import UnrecordedDrawException
+from src.recording.session_event_type import SessionEventType
+from src.recording.session_log import SessionLog
+
+
+class RecordingRandom(random.Random):
+    """
+    A random.Random that appends every choice and randint draw it makes to a SessionLog.
+
+    Choices are recorded as an index into the sequence rather than the chosen element, so a draw is recorded the same
+    way regardless of the type of the elements being chosen from. Every other way of drawing from a random.Random, such
+    as random, shuffle or getrandbits, raises UnrecordedDrawException rather than drawing something a replay could not
+    reproduce. Code that needs many draws, such as autoplay, seeds a random.Random of its own from a single randint.
+    """
+
+    def __init__(self, session_log: SessionLog, seed: Optional[int] = None):
+        super().__init__(seed)
+        self.__session_log = session_log
+
+    def random(self) -> float:
+        raise _unrecorded_draw('random')
+
+    def getrandbits(self, k: int) -> int:
+        raise _unrecorded_draw('getrandbits')
+
+    def randrange(self, start: int, stop: Optional[int] = None, step: int = 1) -> int:
+        raise _unrecorded_draw('randrange')
+
+    def shuffle(self, x: list) -> None:
+        raise _unrecorded_draw('shuffle')
+
+    def sample(self, population: Sequence[Any], k: int, *, counts: Optional[Sequence[int]] = None) -> list:
+        raise _unrecorded_draw('sample')
+
+    def choices(self, population: Sequence[Any], weights: Optional[Sequence[float]] = None, *,
+                cum_weights: Optional[Sequence[float]] = None, k: int = 1) -> list:
+        raise _unrecorded_draw('choices')
+
+    def choice(self, seq: Sequence[Any]) -> Any:
+        index = self._next_choice_index(len(seq))
+        self.__session_log.append((SessionEventType.CHOICE, index, len(seq)))
+        return seq[index]
+
+    def randint(self, a: int, b: int) -> int:
+        value = self._next_randint(a, b)
+        self.__session_log.append((SessionEventType.RANDINT, value, a, b))
+        return value
+
+    def _next_choice_index(self, sequence_length: int) -> int:
+        """Returns the index chosen from a sequence of sequence_length elements."""
+        return self._randbelow(sequence_length)
+
+    def _next_randint(self, a: int, b: int) -> int:
+        """Returns the integer drawn from the inclusive range [a, b]."""
+        if b < a:
+            raise ValueError(f"empty range in randint({a}, {b})")
+        return a + self._randbelow(b - a + 1)
+
+    def _randbelow(self, n: int) -> int:
+        """
+        Returns an integer drawn from range(n) exactly as random.Random does, but with the getrandbits of random.Random,
+        which this class refuses to expose.
+        """
+        k = n.bit_length()
+        value = super().getrandbits(k)
+        while value >= n:
+            value = super().getrandbits(k)
+        return value
+
+
+def _unrecorded_draw(method: str) -> UnrecordedDrawException:
+    """Returns the exception raised when a RecordingRandom is asked for a draw it cannot record."""
+    return UnrecordedDrawException(
+        f"RecordingRandom only records choice and randint draws, so {method} would not replay.")
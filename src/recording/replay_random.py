@@ -0,0 +1,50 @@
+from typing import Any
+from typing import Optional
+
+from src.recording.recording_random import RecordingRandom
+from src.recording.session_event_type import SessionEventType
+from src.recording.session_log import SessionLog
+
+
+class ReplayRandom(RecordingRandom):
+    """
+    A RecordingRandom that serves previously recorded draws instead of generating new ones.
+
+    Draws are served in the order they were recorded. If the replaying program requests a draw of a different kind or
+    range than the one recorded, or requests more draws than were recorded, the session has diverged; from that point
+    on ReplayRandom generates fresh draws so the replay can continue and the divergence shows up in the new log.
+    """
+
+    def __init__(self, recorded_draws: list[tuple[Any, ...]], session_log: SessionLog, seed: Optional[int] = None):
+        super().__init__(session_log, seed)
+        self.__recorded_draws = recorded_draws
+        self.__position = 0
+        self.__diverged = False
+
+    def has_diverged(self) -> bool:
+        """Returns True if a requested draw did not match the recorded draws."""
+        return self.__diverged
+
+    def _next_choice_index(self, sequence_length: int) -> int:
+        recorded_draw = self.__next_recorded_draw()
+        if (recorded_draw is not None and recorded_draw[0] is SessionEventType.CHOICE
+                and recorded_draw[2] == sequence_length):
+            return recorded_draw[1]
+        self.__diverged = True
+        return super()._next_choice_index(sequence_length)
+
+    def _next_randint(self, a: int, b: int) -> int:
+        recorded_draw = self.__next_recorded_draw()
+        if (recorded_draw is not None and recorded_draw[0] is SessionEventType.RANDINT
+                and recorded_draw[2] == a and recorded_draw[3] == b):
+            return recorded_draw[1]
+        self.__diverged = True
+        return super()._next_randint(a, b)
+
+    def __next_recorded_draw(self) -> Optional[tuple[Any, ...]]:
+        """Returns the next recorded draw, or None if the replay has diverged or run out of recorded draws."""
+        if self.__diverged or self.__position >= len(self.__recorded_draws):
+            return None
+        recorded_draw = self.__recorded_draws[self.__position]
+        self.__position += 1
+        return recorded_draw
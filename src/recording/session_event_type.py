@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class SessionEventType(Enum):
+    """
+    An enumeration of the events stored in a SessionLog.
+
+    Attributes:
+        INPUT: A line of user input passed to GamblingSimulator.process_user_input.
+        CHOICE: A random.Random.choice draw, stored as the chosen index and the length of the sequence.
+        RANDINT: A random.Random.randint draw, stored as the drawn value and the inclusive bounds.
+        STATE: The game state and coin total of the session after an input was processed.
+    """
+    INPUT = 0
+    CHOICE = 1
+    RANDINT = 2
+    STATE = 3
@@ -0,0 +1,159 @@
+from typing import Any
+from typing import Optional
+
+from src.exceptions.corrupt_session_log_exception import CorruptSessionLogException
+from src.recording.session_event_type import SessionEventType
+
+_MAGIC = b'GSLOG'
+_VERSION = 1
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    """Appends the non-negative integer value to buffer as a LEB128 varint."""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _write_signed_varint(buffer: bytearray, value: int) -> None:
+    """Appends the integer value to buffer as a zigzag encoded LEB128 varint."""
+    _write_varint(buffer, value * 2 if value >= 0 else -value * 2 - 1)
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    """Reads a LEB128 varint from data at position. Returns the value and the position after it."""
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise CorruptSessionLogException("Session log ended in the middle of an event.")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _read_signed_varint(data: bytes, position: int) -> tuple[int, int]:
+    """Reads a zigzag encoded LEB128 varint from data at position. Returns the value and the position after it."""
+    value, position = _read_varint(data, position)
+    return (value >> 1) if value % 2 == 0 else -((value + 1) >> 1), position
+
+
+class SessionLog:
+    """
+    An ordered, append-only list of the events of a single Gambling Simulator session.
+
+    Events are stored as tuples whose first element is a SessionEventType:
+    - (SessionEventType.INPUT, user_input)
+    - (SessionEventType.CHOICE, index, sequence_length)
+    - (SessionEventType.RANDINT, value, lower_bound, upper_bound)
+    - (SessionEventType.STATE, game_state_value, player_coins)
+
+    A SessionLog serializes to a compact binary form in which every integer is a varint, so a typical event takes
+    only a few bytes.
+    """
+
+    def __init__(self, events: Optional[list[tuple[Any, ...]]] = None):
+        """Constructs a SessionLog containing the given events, or an empty SessionLog if events is None."""
+        self.__events: list[tuple[Any, ...]] = events if events is not None else []
+
+    def append(self, event: tuple[Any, ...]) -> None:
+        """Appends event to the end of this SessionLog."""
+        self.__events.append(event)
+
+    def get_events(self) -> list[tuple[Any, ...]]:
+        """Returns the events of this SessionLog in the order they occurred."""
+        return self.__events
+
+    def get_draws(self) -> list[tuple[Any, ...]]:
+        """Returns only the CHOICE and RANDINT events of this SessionLog in the order they occurred."""
+        return [event for event in self.__events
+                if event[0] is SessionEventType.CHOICE or event[0] is SessionEventType.RANDINT]
+
+    def get_inputs(self) -> list[str]:
+        """Returns the user inputs of this SessionLog in the order they occurred."""
+        return [event[1] for event in self.__events if event[0] is SessionEventType.INPUT]
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary representation of this SessionLog."""
+        buffer = bytearray(_MAGIC)
+        buffer.append(_VERSION)
+        for event in self.__events:
+            event_type = event[0]
+            buffer.append(event_type.value)
+            match event_type:
+                case SessionEventType.INPUT:
+                    encoded_input = event[1].encode('utf-8')
+                    _write_varint(buffer, len(encoded_input))
+                    buffer += encoded_input
+                case SessionEventType.CHOICE:
+                    _write_varint(buffer, event[1])
+                    _write_varint(buffer, event[2])
+                case SessionEventType.RANDINT:
+                    _write_signed_varint(buffer, event[1])
+                    _write_signed_varint(buffer, event[2])
+                    _write_signed_varint(buffer, event[3])
+                case SessionEventType.STATE:
+                    _write_varint(buffer, event[1])
+                    _write_signed_varint(buffer, event[2])
+        return bytes(buffer)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'SessionLog':
+        """
+        Decodes a SessionLog from its binary representation.
+        :param data: Bytes previously produced by SessionLog.to_bytes
+        :return: The decoded SessionLog
+        :exception CorruptSessionLogException: If data is not a valid session log.
+        """
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise CorruptSessionLogException("Data is not a Gambling Simulator session log.")
+        if len(data) <= len(_MAGIC) or data[len(_MAGIC)] != _VERSION:
+            raise CorruptSessionLogException("Unsupported session log version.")
+
+        events: list[tuple[Any, ...]] = []
+        position = len(_MAGIC) + 1
+        while position < len(data):
+            try:
+                event_type = SessionEventType(data[position])
+            except ValueError:
+                raise CorruptSessionLogException(f"Unknown event type {data[position]} at byte {position}.")
+            position += 1
+            match event_type:
+                case SessionEventType.INPUT:
+                    length, position = _read_varint(data, position)
+                    if position + length > len(data):
+                        raise CorruptSessionLogException("Session log ended in the middle of an event.")
+                    events.append((event_type, data[position:position + length].decode('utf-8')))
+                    position += length
+                case SessionEventType.CHOICE:
+                    index, position = _read_varint(data, position)
+                    sequence_length, position = _read_varint(data, position)
+                    events.append((event_type, index, sequence_length))
+                case SessionEventType.RANDINT:
+                    value, position = _read_signed_varint(data, position)
+                    lower_bound, position = _read_signed_varint(data, position)
+                    upper_bound, position = _read_signed_varint(data, position)
+                    events.append((event_type, value, lower_bound, upper_bound))
+                case SessionEventType.STATE:
+                    game_state_value, position = _read_varint(data, position)
+                    player_coins, position = _read_signed_varint(data, position)
+                    events.append((event_type, game_state_value, player_coins))
+        return SessionLog(events)
+
+    def save(self, path: str) -> None:
+        """Writes the binary representation of this SessionLog to the file at path."""
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @staticmethod
+    def load(path: str) -> 'SessionLog':
+        """Reads a SessionLog from the file at path."""
+        with open(path, 'rb') as file:
+            return SessionLog.from_bytes(file.read())
+
+    def __len__(self) -> int:
+        return len(self.__events)
@@ -0,0 +1,63 @@
+from typing import Optional
+
+from src.analytics.outcome_recorder import OutcomeRecorder
+from src.gambling_simulator import GamblingSimulator
+from src.recording.recording_random import RecordingRandom
+from src.recording.session_event_type import SessionEventType
+from src.recording.session_log import SessionLog
+
+
+class SessionRecorder:
+    """
+    Records a GamblingSimulator session into a SessionLog.
+
+    A SessionRecorder owns a GamblingSimulator whose randomness comes from a RecordingRandom. Every call to
+    process_user_input(self, user_input) records the input, every card draw, wheel spin and reel spin it caused, and
+    the resulting game state and coin total. The resulting SessionLog can be reproduced exactly with a SessionReplayer.
+    """
+
+    def __init__(self, seed: Optional[int] = None, session_log: Optional[SessionLog] = None,
+                 random_generator: Optional[RecordingRandom] = None,
+                 outcome_recorder: Optional[OutcomeRecorder] = None):
+        """
+        Constructs a SessionRecorder around a new GamblingSimulator.
+
+        Args:
+            seed (Optional[int]): The seed of the session's random generator, or None for a random seed.
+            session_log (Optional[SessionLog]): The SessionLog to record into. A new SessionLog is used if None.
+            random_generator (Optional[RecordingRandom]): The random generator of the session, which must record into
+                session_log. A new RecordingRandom seeded with seed is used if None.
+            outcome_recorder (Optional[OutcomeRecorder]): The recorder of the outcome of every round, or None.
+        """
+        self.__session_log = session_log if session_log is not None else SessionLog()
+        if random_generator is None:
+            random_generator = RecordingRandom(self.__session_log, seed)
+        self.__simulator = GamblingSimulator(random_generator, outcome_recorder=outcome_recorder)
+
+    def execute_program(self) -> None:
+        """Starts the primary gameplay loop of the recorded GamblingSimulator, reading input from stdin."""
+        complete = self.__simulator.current_abstract_program.execute_program()
+        playing = not complete
+        while playing:
+            playing = not self.process_user_input(input())
+
+    def process_user_input(self, user_input: str) -> bool:
+        """
+        Passes user_input to the recorded GamblingSimulator and records the input and its consequences.
+
+        Returns:
+            bool: True if the GamblingSimulator has finished, False otherwise.
+        """
+        self.__session_log.append((SessionEventType.INPUT, user_input))
+        finished = self.__simulator.process_user_input(user_input)
+        self.__session_log.append((SessionEventType.STATE, self.__simulator.game_state.value,
+                                   self.__simulator.player_data.get_player_coins()))
+        return finished
+
+    def get_simulator(self) -> GamblingSimulator:
+        """Returns the GamblingSimulator being recorded."""
+        return self.__simulator
+
+    def get_session_log(self) -> SessionLog:
+        """Returns the SessionLog this SessionRecorder records into."""
+        return self.__session_log
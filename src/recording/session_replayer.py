@@ -0,0 +1,79 @@
+import contextlib
+import os
+import sys
+from typing import Any
+from typing import Optional
+
+from src.recording.replay_random import ReplayRandom
+from src.recording.session_log import SessionLog
+from src.recording.session_recorder import SessionRecorder
+
+
+class SessionReplayer:
+    """
+    Reproduces a recorded session without the interactive layer.
+
+    The recorded inputs are fed to a fresh GamblingSimulator whose draws are served from the recorded log, with all
+    printed output discarded. The replay is itself recorded, so it can be compared event by event against the
+    original log; a change in game logic, such as a payout calculation, appears as the first divergent event.
+    """
+
+    def __init__(self, session_log: SessionLog):
+        """Constructs a SessionReplayer for the given recorded SessionLog."""
+        self.__session_log = session_log
+        self.__replayed_log: Optional[SessionLog] = None
+
+    def replay(self) -> SessionLog:
+        """
+        Replays the recorded session if it has not already been replayed.
+
+        Returns:
+            SessionLog: The log of the replayed session.
+        """
+        if self.__replayed_log is not None:
+            return self.__replayed_log
+
+        replayed_log = SessionLog()
+        replay_random = ReplayRandom(self.__session_log.get_draws(), replayed_log)
+        recorder = SessionRecorder(session_log=replayed_log, random_generator=replay_random)
+        simulator = recorder.get_simulator()
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            finished = simulator.current_abstract_program.execute_program()
+            for user_input in self.__session_log.get_inputs():
+                if finished:
+                    break
+                finished = recorder.process_user_input(user_input)
+        self.__replayed_log = replayed_log
+        return replayed_log
+
+    def find_first_divergence(self) -> Optional[tuple[int, Optional[tuple[Any, ...]], Optional[tuple[Any, ...]]]]:
+        """
+        Replays the recorded session and compares it to the original.
+
+        Returns:
+            Optional[tuple[int, Optional[tuple], Optional[tuple]]]: None if the replay matched the recording exactly,
+                otherwise the index of the first divergent event, the recorded event and the replayed event. An event
+                is None if its log ended before that index.
+        """
+        recorded_events = self.__session_log.get_events()
+        replayed_events = self.replay().get_events()
+        for index in range(max(len(recorded_events), len(replayed_events))):
+            recorded_event = recorded_events[index] if index < len(recorded_events) else None
+            replayed_event = replayed_events[index] if index < len(replayed_events) else None
+            if recorded_event != replayed_event:
+                return index, recorded_event, replayed_event
+        return None
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: session_replayer.py <session log>")
+        sys.exit(2)
+    divergence = SessionReplayer(SessionLog.load(sys.argv[1])).find_first_divergence()
+    if divergence is None:
+        print("Replay matched the recorded session.")
+        sys.exit(0)
+    print(f"Replay diverged at event {divergence[0]}:")
+    print(f"    recorded: {divergence[1]}")
+    print(f"    replayed: {divergence[2]}")
+    sys.exit(1)
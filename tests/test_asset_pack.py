@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+
+import pytest
+
+from src.assets import asset_pack
+from src.assets.art import ASSET_SOURCES
+from src.assets.asset_pack import AssetPack
+from src.assets.asset_pack import get_source_digest
+from src.assets.asset_pack_builder import build_asset_pack
+
+
+def test_built_pack_loads_every_asset_padded_to_its_width(tmp_path):
+    path = str(tmp_path / 'asset_pack.bin')
+    build_asset_pack(path, {'box': ('+--+\n|  |\n+--+', 6), 'wide': ('é', 3), 'empty': ('', 0)}, bytes(range(32)))
+    pack = AssetPack(path)
+    assert pack.get_names() == ('box', 'wide', 'empty')
+    assert pack.get_lines('box') == (' +--+ ', ' |  | ', ' +--+ ')
+    assert pack.get_lines('wide') == (' é ',)
+    assert pack.get_lines('empty') == ('',)
+    assert pack.get_source_digest() == bytes(range(32))
+    with pytest.raises(KeyError):
+        pack.get_lines('missing')
+    pack.close()
+
+    build_asset_pack(path)
+    pack = AssetPack(path)
+    assert pack.get_names() == tuple(ASSET_SOURCES)
+    assert pack.get_source_digest() == get_source_digest()
+    pack.close()
+
+
+def _load_pack() -> AssetPack:
+    asset_pack.get_asset_pack.cache_clear()
+    loaded_pack = asset_pack.get_asset_pack()
+    assert loaded_pack.get_names() == tuple(ASSET_SOURCES)
+    assert loaded_pack.get_source_digest() == get_source_digest()
+    loaded_pack.close()
+    return loaded_pack
+
+
+def test_stale_or_foreign_pack_is_rebuilt_outside_the_package(tmp_path, monkeypatch):
+    path = tmp_path / 'package' / 'asset_pack.bin'
+    path.parent.mkdir()
+    cache_directory = tmp_path / 'cache'
+    monkeypatch.setattr(asset_pack, 'ASSET_PACK_PATH', str(path))
+    monkeypatch.setattr(asset_pack, 'CACHE_DIRECTORY', str(cache_directory))
+    cached_pack_path = asset_pack.get_cached_pack_path(get_source_digest())
+
+    # Missing, built from other sources, and written by an older version of the builder
+    _load_pack()
+    assert list(path.parent.iterdir()) == []
+    for stale_pack in (None, b'GSAP' + (1).to_bytes(4, 'little') + bytes(8)):
+        if stale_pack is None:
+            build_asset_pack(str(path), {'logo': ('old', 3)}, bytes(32))
+        else:
+            path.write_bytes(stale_pack)
+        stale_bytes = path.read_bytes()
+        os.remove(cached_pack_path)
+        _load_pack()
+        assert path.read_bytes() == stale_bytes
+    assert os.listdir(cache_directory) == [os.path.basename(cached_pack_path)]
+
+    # A current pack is used where it is, and never copied into the cache
+    build_asset_pack(str(path))
+    os.remove(cached_pack_path)
+    _load_pack()
+    assert os.listdir(cache_directory) == []
+    asset_pack.get_asset_pack.cache_clear()
+
+
+def _build_cached_pack(ready: multiprocessing.Barrier) -> None:
+    ready.wait()
+    asset_pack.get_asset_pack.cache_clear()
+    _load_pack()
+
+
+def test_processes_building_the_same_pack_at_once_never_read_a_partial_pack(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_pack, 'ASSET_PACK_PATH', str(tmp_path / 'package' / 'asset_pack.bin'))
+    monkeypatch.setattr(asset_pack, 'CACHE_DIRECTORY', str(tmp_path / 'cache'))
+    ready = multiprocessing.Barrier(4)
+    processes = [multiprocessing.Process(target=_build_cached_pack, args=(ready,)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0] * 4
+    assert os.listdir(tmp_path / 'cache') == [os.path.basename(asset_pack.get_cached_pack_path(get_source_digest()))]
+
+
+def test_file_that_is_not_a_pack_is_rejected(tmp_path):
+    path = tmp_path / 'asset_pack.bin'
+    for data in (b'junk', b'GSAP' + (2).to_bytes(4, 'little') + (1).to_bytes(4, 'little')):
+        path.write_bytes(data + bytes(32))
+        with pytest.raises(ValueError):
+            AssetPack(str(path))
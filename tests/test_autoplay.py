@@ -0,0 +1,105 @@
+import contextlib
+import io
+import itertools
+import random
+
+import pytest
+
+from src.managers.gambling_manager import GamblingManager
+from src.player_data import PlayerData
+from src.programs.minigames.autoplay import AutoplaySettings
+from src.programs.minigames.autoplay import count_rounds_within_limits
+from src.programs.minigames.autoplay import run_autoplay
+from src.programs.minigames.blackjack import BlackjackMinigame
+from src.programs.minigames.blackjack import card_value_map
+from src.programs.minigames.blackjack import play_autoplay_hand
+from src.programs.minigames.blackjack_rules import DEALER_STAND_SCORE
+from src.programs.minigames.blackjack_rules import BlackjackRules
+
+STARTING_COINS = 1_000
+
+
+class _ScriptedRandom(random.Random):
+    """Deals the given cards, in order, to an infinite BlackjackShoe, counting how many it dealt."""
+
+    def __init__(self, cards: list):
+        super().__init__(0)
+        self.__cards = iter(cards)
+        self.dealt = 0
+
+    def choice(self, sequence):
+        self.dealt += 1
+        return next(self.__cards)
+
+
+def _new_gambling_manager(coins: int = STARTING_COINS) -> GamblingManager:
+    player_data = PlayerData()
+    player_data.set_player_coins(coins)
+    return GamblingManager(player_data)
+
+
+def _play_interactively(cards: list, rules: BlackjackRules, bet: int) -> tuple[int, int, int]:
+    """Plays a hand of BlackjackMinigame, hitting until DEALER_STAND_SCORE. Returns the net, score and cards dealt."""
+    gambling_manager = _new_gambling_manager()
+    scripted_random = _ScriptedRandom(cards)
+    minigame = BlackjackMinigame(gambling_manager, scripted_random, rules)
+    with contextlib.redirect_stdout(io.StringIO()):
+        minigame.execute_program()
+        finished = minigame.process_user_input(str(bet))
+        while not finished and minigame.get_user_score() < DEALER_STAND_SCORE:
+            finished = minigame.process_user_input('hit')
+        if not finished:
+            minigame.process_user_input('stand')
+    return gambling_manager.get_player_coins() - STARTING_COINS, minigame.get_user_score(), scripted_random.dealt
+
+
+@pytest.mark.parametrize('rules', [
+    BlackjackRules(),
+    BlackjackRules(dealer_hits_soft_17=True),
+    BlackjackRules(blackjack_payout=2.5, push_returns_bet=False, blackjack_push_returns_bet=True),
+])
+def test_autoplay_hands_pay_as_interactive_hands(rules):
+    deck = list(card_value_map)
+    for seed in range(2_000):
+        cards = random.Random(seed).choices(deck, k=30)
+        dealt = iter(cards)
+        values = []
+
+        def next_card() -> int:
+            values.append(card_value_map[next(dealt)])
+            return values[-1]
+
+        net, player_score, _ = play_autoplay_hand(next_card, rules, 10)
+        assert (net, player_score, len(values)) == _play_interactively(cards, rules, 10), cards
+
+
+def test_count_rounds_within_limits_stops_on_the_exact_round():
+    assert count_rounds_within_limits(100, 10, [90, 80, 70, 60, 50, 40], AutoplaySettings(10, stop_loss=55)) == 5
+    assert count_rounds_within_limits(100, 10, [110, 120, 130, 140, 150], AutoplaySettings(10, take_profit=135)) == 4
+    # A balance below the bet stops autoplay even without a stop-loss
+    assert count_rounds_within_limits(35, 10, [25, 15, 5, 15], AutoplaySettings(10)) == 3
+    assert count_rounds_within_limits(100, 10, [90, 100, 110], AutoplaySettings(10, 50, 200)) == 3
+
+
+@pytest.mark.parametrize('settings, nets, rounds, coins', [
+    (AutoplaySettings(1_000, stop_loss=55), [-10], 5, 50),
+    (AutoplaySettings(1_000, take_profit=135), [10, 20, -5], 4, 135),
+    (AutoplaySettings(1_000), [-15, 5], 17, 5),
+    (AutoplaySettings(7), [3, -10], 7, 82),
+])
+def test_run_autoplay_stops_on_the_exact_round(settings, nets, rounds, coins):
+    gambling_manager = _new_gambling_manager(100)
+    drawn = itertools.cycle(nets)
+    settled = []
+
+    def draw_rounds(batch_rounds: int) -> list[int]:
+        return list(itertools.islice(drawn, batch_rounds))
+
+    def settle_rounds(balances: list[int]) -> int:
+        settled.append(len(balances))
+        gambling_manager.settle_rounds('slots', 10, balances)
+        return 0
+
+    summary = run_autoplay(gambling_manager, settings, 10, max(nets), draw_rounds, settle_rounds)
+    assert sum(settled) == rounds, summary
+    assert gambling_manager.get_player_coins() == coins
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from src.bankroll_history import BankrollHistory
+
+
+def test_rounds_past_capacity_wrap_into_buckets_and_are_then_forgotten():
+    history = BankrollHistory(exact_capacity=3, bucket_capacity=2, bucket_size=2, levels=1)
+    for coins in range(1, 6):
+        history.record(coins)
+    # 1 and 2 fill a bucket
+    assert history.get_entries() == [(1, 2), (3, 3), (4, 4), (5, 5)]
+
+    for coins in [9, 0, 7, 8, 6]:
+        history.record(coins)
+    # 1 to 9 form buckets (1, 2), (3, 4) and (5, 9) of which the first is forgotten, and 0 is pending
+    assert history.get_entries() == [(3, 4), (5, 9), (0, 0), (7, 7), (8, 8), (6, 6)]
+    assert history.get_total_rounds() == 10
+
+
+@pytest.mark.parametrize('exact_capacity, bucket_capacity, bucket_size, levels', [
+    (100, 50, 10, 3),
+    (3, 2, 2, 1),
+    (5, 3, 4, 3),
+    (1, 1, 3, 4),
+])
+def test_record_many_matches_repeated_record(exact_capacity, bucket_capacity, bucket_size, levels):
+    batches = random.Random(exact_capacity * 31 + bucket_size)
+    one_at_a_time = BankrollHistory(exact_capacity, bucket_capacity, bucket_size, levels)
+    in_batches = BankrollHistory(exact_capacity, bucket_capacity, bucket_size, levels)
+    for _ in range(300):
+        # Batch sizes range from nothing to several times everything the history remembers
+        coins = [batches.randint(-1_000, 1_000) for _ in range(batches.choice([0, 1, 2, 7, 40, 400, 4_000]))]
+        for balance in coins:
+            one_at_a_time.record(balance)
+        if batches.random() < 0.2 and coins:
+            in_batches.record(coins[0])
+            in_batches.record_many(coins[1:])
+        else:
+            in_batches.record_many(coins)
+        assert in_batches.get_entries() == one_at_a_time.get_entries()
+        assert in_batches.get_total_rounds() == one_at_a_time.get_total_rounds()
@@ -0,0 +1,142 @@
+import random
+
+import pytest
+
+from src.managers.gambling_manager import GamblingManager
+from src.player_data import PlayerData
+from src.programs.minigames.blackjack import calculate_score
+from src.programs.minigames.blackjack import should_dealer_hit
+from src.programs.minigames.blackjack_rules import BlackjackRules
+from src.programs.minigames.blackjack_table import MAX_SEATS
+from src.programs.minigames.blackjack_table import BlackjackTable
+
+STARTING_COINS = 1_000
+
+
+class _ScriptedRandom(random.Random):
+    """Deals the given cards, in order, to an infinite BlackjackShoe."""
+
+    def __init__(self, cards: list):
+        super().__init__(0)
+        self.__cards = iter(cards)
+
+    def choice(self, sequence):
+        return next(self.__cards)
+
+
+def _seat_players(table: BlackjackTable, bets: list[int], coins: int = STARTING_COINS) -> list[GamblingManager]:
+    """Seats a player for every bet and places it, returning the GamblingManagers of the seats in order."""
+    gambling_managers = []
+    for bet in bets:
+        player_data = PlayerData()
+        player_data.set_player_coins(coins)
+        gambling_managers.append(GamblingManager(player_data))
+        seat_index = table.add_seat(gambling_managers[-1])
+        assert table.place_bet(seat_index, bet)
+    return gambling_managers
+
+
+def _get_nets(gambling_managers: list[GamblingManager]) -> list[int]:
+    return [gambling_manager.get_player_coins() - STARTING_COINS for gambling_manager in gambling_managers]
+
+
+def test_dealer_bust_pays_every_standing_seat():
+    bets = [10, 20, 30, 40, 50, 60, 70]
+    table = BlackjackTable(_ScriptedRandom([10, 6,
+                                            'ace', 'king', 10, 9, 10, 5, 2, 3, 9, 9, 5, 5, 8, 8,
+                                            'queen', 9,
+                                            'king']))
+    gambling_managers = _seat_players(table, bets)
+    table.deal()
+    # The seat dealt a blackjack has nothing to decide
+    assert table.get_deciding_seats() == [1, 2, 3, 4, 5, 6]
+    assert not table.process_decision(2, 'hit')
+    assert table.get_seat_score(2) == 25
+    assert not table.process_decision(5, 'hit')
+    for seat_index in (1, 3, 4, 5):
+        assert not table.process_decision(seat_index, 'stand')
+    assert table.process_decision(6, 'stand')
+
+    assert table.get_dealer_cards() == (10, 6, 'king')
+    assert not table.is_round_in_progress()
+    # A blackjack pays 3x, every other hand that did not bust pays 2x, and the bust hand loses despite the dealer bust
+    assert [table.get_last_payout(seat_index) for seat_index in range(MAX_SEATS)] == [30, 40, 0, 80, 100, 120, 140]
+    assert _get_nets(gambling_managers) == [20, 20, -30, 40, 50, 60, 70]
+
+
+@pytest.mark.parametrize('push_returns_bet', [True, False])
+def test_pushes_return_the_bet_if_the_rules_say_so(push_returns_bet):
+    table = BlackjackTable(_ScriptedRandom([10, 8,
+                                            10, 8, 9, 9, 10, 9, 10, 7, 'ace', 7, 'ace', 'queen', 10, 2,
+                                            6]),
+                           BlackjackRules(push_returns_bet=push_returns_bet, blackjack_payout=2.5))
+    gambling_managers = _seat_players(table, [10] * MAX_SEATS)
+    table.deal()
+    assert not table.process_decision(6, 'hit')
+    for seat_index in (0, 1, 2, 3, 4):
+        assert not table.process_decision(seat_index, 'stand')
+    assert table.process_decision(6, 'stand')
+
+    # The dealer stands on 18 without drawing
+    assert table.get_dealer_cards() == (10, 8)
+    push = 10 if push_returns_bet else 0
+    assert [table.get_last_payout(seat_index) for seat_index in range(MAX_SEATS)] == [push, push, 20, 0, push, 25,
+                                                                                      push]
+    assert _get_nets(gambling_managers) == [push - 10, push - 10, 10, -10, push - 10, 15, push - 10]
+
+
+@pytest.mark.parametrize('blackjack_push_returns_bet', [True, False])
+def test_dealer_blackjack_settles_the_round_at_the_deal(blackjack_push_returns_bet):
+    table = BlackjackTable(_ScriptedRandom(['ace', 'king', 'queen', 'ace', 10, 10, 'ace', 9]),
+                           BlackjackRules(blackjack_push_returns_bet=blackjack_push_returns_bet))
+    gambling_managers = _seat_players(table, [10, 20, 30])
+    table.deal()
+    assert not table.is_round_in_progress()
+    assert table.get_deciding_seats() == []
+    assert table.get_dealer_cards() == ('ace', 'king')
+    blackjack_push = 10 if blackjack_push_returns_bet else 0
+    assert _get_nets(gambling_managers) == [blackjack_push - 10, -20, -30]
+
+
+def _get_expected_payout(cards: tuple, dealer_cards: tuple, bet: int, rules: BlackjackRules) -> int:
+    """Returns what a hand of cards should be paid against dealer_cards, including the returned bet."""
+    score, dealer_score = calculate_score(cards), calculate_score(dealer_cards)
+    blackjack, dealer_blackjack = len(cards) == 2 and score == 21, len(dealer_cards) == 2 and dealer_score == 21
+    if blackjack and dealer_blackjack:
+        return bet if rules.blackjack_push_returns_bet else 0
+    if dealer_blackjack or score > 21:
+        return 0
+    if blackjack:
+        return round(bet * rules.blackjack_payout)
+    if dealer_score > 21 or score > dealer_score:
+        return 2 * bet
+    return bet if score == dealer_score and rules.push_returns_bet else 0
+
+
+@pytest.mark.parametrize('rules', [
+    BlackjackRules(decks=1),
+    BlackjackRules(decks=6, dealer_hits_soft_17=True, blackjack_payout=2.2, push_returns_bet=False),
+])
+def test_seeded_shoe_rounds_pay_every_seat_by_the_rules(rules):
+    table = BlackjackTable(random.Random(1), rules)
+    bets = [5 * (seat_index + 1) for seat_index in range(MAX_SEATS)]
+    # Enough coins that no seat runs out and sits a round out
+    gambling_managers = _seat_players(table, bets, 100_000)
+    for _ in range(300):
+        # Every bet has already been placed
+        coins = [gambling_manager.get_player_coins() for gambling_manager in gambling_managers]
+        table.deal()
+        while table.is_round_in_progress():
+            seat_index = table.get_deciding_seats()[0]
+            table.process_decision(seat_index, 'hit' if table.get_seat_score(seat_index) < 15 else 'stand')
+
+        dealer_cards = table.get_dealer_cards()
+        # The dealer plays out their hand if any seat stands on a hand that is neither bust nor a blackjack
+        if any(calculate_score(cards) < 21 or calculate_score(cards) == 21 and len(cards) > 2
+               for cards in (table.get_seat_cards(seat_index) for seat_index in range(MAX_SEATS))):
+            assert not should_dealer_hit(dealer_cards, rules) or calculate_score(dealer_cards[:2]) == 21
+        for seat_index, (gambling_manager, bet) in enumerate(zip(gambling_managers, bets)):
+            payout = _get_expected_payout(table.get_seat_cards(seat_index), dealer_cards, bet, rules)
+            assert table.get_last_payout(seat_index) == payout
+            assert gambling_manager.get_player_coins() == coins[seat_index] + payout
+            assert table.place_bet(seat_index, bet)
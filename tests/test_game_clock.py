@@ -0,0 +1,133 @@
+import contextlib
+import io
+import random
+
+import pytest
+
+from src.gambling_simulator import GamblingSimulator
+from src.items.groceries import Groceries
+from src.items.loan import ANNUAL_PERCENTAGE_YIELD
+from src.items.loan import ROUNDS_PER_YEAR
+from src.items.loan import STATEMENT_PERIOD
+from src.items.loan import Loan
+from src.items.rent import RENT_PERIOD
+from src.items.rent import Rent
+from src.managers.game_clock import GameClock
+from src.player_data import PlayerData
+
+STATEMENT_GROWTH = (1 + ANNUAL_PERCENTAGE_YIELD) ** (STATEMENT_PERIOD / ROUNDS_PER_YEAR)
+
+
+def test_due_events_run_in_order_once_caught_up():
+    clock = GameClock()
+    ran = []
+
+    def recur(due_round: int) -> None:
+        ran.append((due_round, 'recurring'))
+        clock.schedule(due_round + 4, recur)
+
+    clock.schedule(5, lambda due_round: ran.append((due_round, 'first')))
+    clock.schedule(3, lambda due_round: ran.append((due_round, 'earliest')))
+    clock.schedule(5, lambda due_round: ran.append((due_round, 'second')))
+    clock.schedule_in(10, recur)
+    assert clock.get_rounds_until_next_event() == 3
+
+    clock.advance(12)
+    assert ran == [] and clock.get_rounds_until_next_event() == 0
+    clock.catch_up()
+    assert ran == [(3, 'earliest'), (5, 'first'), (5, 'second'), (10, 'recurring')]
+    assert clock.get_pending_event_count() == 1
+    assert clock.get_rounds_until_next_event() == 2
+
+    clock.advance(10)
+    clock.catch_up()
+    assert ran[4:] == [(14, 'recurring'), (18, 'recurring'), (22, 'recurring')]
+    with pytest.raises(ValueError):
+        clock.advance(-1)
+
+
+def test_loan_statements_charge_interest_and_add_what_is_unpaid_to_the_balance():
+    clock = GameClock()
+    player_data = PlayerData()
+    player_data.set_player_coins(1_000)
+    clock.advance(5)
+    loan = Loan()
+    with contextlib.redirect_stdout(io.StringIO()):
+        loan.on_purchase(player_data, clock)
+
+        clock.advance(STATEMENT_PERIOD)
+        clock.catch_up()
+        interest = round(2_500 * STATEMENT_GROWTH - 2_500)
+        assert player_data.get_player_coins() == 1_000 - interest
+        assert loan.get_debt() == 2_500
+
+        # Three statements come due at once, none of which the player can pay
+        player_data.set_player_coins(0)
+        clock.advance(3 * STATEMENT_PERIOD + 5)
+        clock.catch_up()
+        balance = 2_500.0
+        for _ in range(3):
+            balance += round(balance * STATEMENT_GROWTH - balance)
+        assert player_data.get_player_coins() == 0
+        assert loan.get_debt() == round(balance)
+        assert loan.get_balance(clock.get_current_round()) == pytest.approx(
+            balance * (1 + ANNUAL_PERCENTAGE_YIELD) ** (5 / ROUNDS_PER_YEAR))
+
+        # A statement the player can pay part of
+        player_data.set_player_coins(50)
+        clock.advance(STATEMENT_PERIOD)
+        clock.catch_up()
+        interest = round(balance * STATEMENT_GROWTH - balance)
+        assert player_data.get_player_coins() == 0
+        assert loan.get_debt() == round(balance + interest - 50)
+    assert clock.get_rounds_until_next_event() == STATEMENT_PERIOD - 5
+
+
+def test_rent_is_charged_every_period_until_the_player_is_evicted():
+    clock = GameClock()
+    player_data = PlayerData()
+    player_data.set_player_coins(1_500)
+    rent, groceries = Rent(), Groceries()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        for item in (rent, groceries):
+            player_data.add_item(item)
+            item.on_purchase(player_data, clock)
+
+        clock.advance(14)
+        clock.catch_up()
+        assert player_data.get_items() == (rent,)
+
+        clock.advance(2 * RENT_PERIOD - 14)
+        clock.catch_up()
+        assert player_data.get_player_coins() == 1_500 - 2 * rent.get_price()
+        assert output.getvalue().count("Rent is due!") == 2
+
+        clock.advance(RENT_PERIOD)
+        clock.catch_up()
+    assert player_data.get_items() == ()
+    assert player_data.get_player_coins() == 1_500 - 2 * rent.get_price()
+    assert clock.get_pending_event_count() == 0
+
+
+def test_events_due_during_a_minigame_run_when_it_ends():
+    simulator = GamblingSimulator(random.Random(0))
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        simulator.current_abstract_program.execute_program()
+        for user_input in ('store', 'predatory loan', 'rent', 'exit'):
+            simulator.process_user_input(user_input)
+        coins = simulator.player_data.get_player_coins()
+        assert coins == 1_000 + 2_500 - 670
+
+        # The bet of the roulette spin is the round the first rent and loan statement are due
+        simulator.game_clock.advance(RENT_PERIOD - 1)
+        for user_input in ('roulette', '10', 'color', 'red'):
+            simulator.process_user_input(user_input)
+    assert simulator.game_clock.get_current_round() == RENT_PERIOD
+    assert simulator.game_clock.get_rounds_until_next_event() == RENT_PERIOD
+    assert output.getvalue().count("Rent is due!") == 1
+    assert output.getvalue().count("Loan statement") == 1
+    interest = round(2_500 * STATEMENT_GROWTH - 2_500)
+    spin_net = simulator.player_data.get_player_coins() - (coins - 670 - interest)
+    assert spin_net in (-10, 10)
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from src.advisor.kelly_advisor import KellyAdvisor
+from src.advisor.kelly_advisor import get_kelly_fraction
+from src.advisor.outcome_distributions import OutcomeDistribution
+from src.advisor.outcome_distributions import get_blackjack_distribution
+from src.advisor.outcome_distributions import get_roulette_distribution
+from src.advisor.outcome_distributions import get_slots_distribution
+from src.gambling_simulator import GamblingSimulator
+from src.programs.minigames.blackjack_rules import BlackjackRules
+from src.programs.minigames.roulette import WHEEL
+from src.programs.minigames.slot_machine import DEFAULT_MACHINE_DEFINITION
+from src.programs.minigames.slot_machine import DEFAULT_SLOT_MACHINE
+from src.programs.minigames.slot_machine import SlotMachine
+
+
+def test_blackjack_advice_follows_the_rules_being_played():
+    # The default rules favour the house, but a blackjack paying 6x the bet gives the player an edge
+    generous_rules = BlackjackRules(blackjack_payout=6)
+    assert KellyAdvisor().get_fraction('blackjack') == 0
+    fraction = KellyAdvisor(rules=generous_rules).get_fraction('blackjack')
+    assert fraction > 0
+    assert KellyAdvisor(rules=generous_rules).suggest_bet('blackjack', 1_000) == int(1_000 * fraction)
+    assert KellyAdvisor(rules=generous_rules).get_fraction('slots') == KellyAdvisor().get_fraction('slots')
+
+    simulator = GamblingSimulator(random.Random(0), blackjack_rules=generous_rules)
+    assert simulator.advisor.get_fraction('blackjack') == fraction
+    assert "coins" in simulator.advisor.get_advice('blackjack', 1_000)
+    assert GamblingSimulator(random.Random(0)).advisor.get_fraction('blackjack') == 0
+
+
+@pytest.mark.parametrize('rules', [BlackjackRules(push_returns_bet=False), BlackjackRules(dealer_hits_soft_17=True)])
+def test_stricter_rules_lower_the_blackjack_edge(rules):
+    def get_expected_net(blackjack_rules: BlackjackRules) -> float:
+        return sum(net * probability for net, probability in get_blackjack_distribution(blackjack_rules))
+
+    assert get_expected_net(rules) < get_expected_net(BlackjackRules())
+
+
+def _get_expected_net(distribution: OutcomeDistribution) -> float:
+    return sum(net * probability for net, probability in distribution)
+
+
+@pytest.mark.parametrize('distribution', [
+    get_blackjack_distribution(),
+    get_blackjack_distribution(BlackjackRules(dealer_hits_soft_17=True, blackjack_payout=2.5, push_returns_bet=False)),
+    get_slots_distribution(),
+    *(get_roulette_distribution(option) for option in ('red', 'black', 'green')),
+    *(get_roulette_distribution(str(count)) for count in range(1, len(WHEEL) + 1)),
+])
+def test_outcome_probabilities_sum_to_1(distribution):
+    assert sum(probability for net, probability in distribution) == pytest.approx(1)
+    assert all(probability > 0 for net, probability in distribution)
+    assert min(net for net, probability in distribution) >= -1
+
+
+def test_slots_expected_net_matches_the_return_to_player():
+    machine = SlotMachine(DEFAULT_MACHINE_DEFINITION)
+    for slot_machine in (DEFAULT_SLOT_MACHINE, machine):
+        assert _get_expected_net(get_slots_distribution(slot_machine)) == \
+            pytest.approx(slot_machine.get_return_to_player() - 1)
+
+
+def test_kelly_fraction_is_0_for_bets_that_lose_on_average():
+    assert get_kelly_fraction(((-1, 0.5), (0.9, 0.5))) == 0
+    assert get_kelly_fraction(((-1, 0.5), (1, 0.5))) == 0
+    assert get_kelly_fraction(get_blackjack_distribution()) == 0
+    for option in ('red', 'black'):
+        assert _get_expected_net(get_roulette_distribution(option)) < 0
+        assert get_kelly_fraction(get_roulette_distribution(option)) == 0
+    assert KellyAdvisor().get_advice('blackjack', 1_000).endswith("the growth-optimal bet is nothing.")
+
+
+@pytest.mark.parametrize('win_probability, odds', [(0.6, 1), (0.3, 3), (0.55, 0.9), (0.02, 60)])
+def test_kelly_fraction_of_a_binary_bet_matches_the_closed_form(win_probability, odds):
+    distribution = ((-1, 1 - win_probability), (odds, win_probability))
+    assert get_kelly_fraction(distribution) == pytest.approx(win_probability - (1 - win_probability) / odds, abs=1e-8)
+
+
+def test_kelly_fraction_bets_everything_when_no_outcome_loses():
+    assert get_kelly_fraction(((0, 0.5), (1, 0.5))) == 1
+
+
+def test_roulette_advice_never_points_at_bets_that_win_on_average():
+    # Green and bets over several numbers win on average, and a bet on every number cannot lose
+    assert _get_expected_net(get_roulette_distribution('green')) > 0
+    assert min(net for net, probability in get_roulette_distribution(str(len(WHEEL)))) > 0
+    advisor = KellyAdvisor()
+    assert advisor.get_advice('roulette', 1_000) == \
+        "Kelly advice: the odds are against you here; the growth-optimal bet is nothing."
+    assert advisor.get_fraction('roulette') == 0
+    assert advisor.suggest_bet('roulette', 1_000) == 0
+    assert advisor.get_option('roulette') in ('red', 'black', '1')
@@ -0,0 +1,152 @@
+import multiprocessing
+import random
+
+import pytest
+
+from src.exceptions.leaderboard_full_exception import LeaderboardFullException
+from src.leaderboard.leaderboard import Leaderboard
+from src.leaderboard.order_statistic_tree import OrderStatisticTree
+from src.leaderboard.shared_leaderboard import SharedLeaderboard
+from src.player_data import PlayerData
+from src.programs.main_menu import MainMenu
+
+
+def test_tree_insert_remove_index_and_select():
+    tree = OrderStatisticTree(random.Random(0))
+    for key in [5, 1, 9, 3, 7]:
+        tree.insert(key)
+    with pytest.raises(KeyError):
+        tree.insert(3)
+    assert len(tree) == 5
+    assert [tree.select(position) for position in range(5)] == [1, 3, 5, 7, 9]
+    assert tree.index(7) == 3
+    assert tree.index(6) == 3
+    assert tree.index(10) == 5
+
+    tree.remove(5)
+    with pytest.raises(KeyError):
+        tree.remove(5)
+    assert 5 not in tree and 7 in tree
+    assert [tree.select(position) for position in range(len(tree))] == [1, 3, 7, 9]
+    with pytest.raises(IndexError):
+        tree.select(4)
+
+
+def test_players_with_equal_net_worth_share_a_rank():
+    leaderboard = Leaderboard()
+    richest = leaderboard.add_player(2_000)
+    tied = [leaderboard.add_player(1_000) for _ in range(3)]
+    poorest = leaderboard.add_player(-500)
+
+    assert leaderboard.get_rank(richest) == 1
+    assert [leaderboard.get_rank(player_id) for player_id in tied] == [2, 2, 2]
+    assert leaderboard.get_rank(poorest) == 5
+    assert leaderboard.get_player_count() == 5
+
+    leaderboard.update(tied[0], 3_000)
+    assert leaderboard.get_rank(tied[0]) == 1
+    assert leaderboard.get_rank(richest) == 2
+    assert [leaderboard.get_rank(player_id) for player_id in tied[1:]] == [3, 3]
+
+    leaderboard.remove_player(richest)
+    assert leaderboard.get_rank(tied[1]) == 2
+    assert leaderboard.get_player_count() == 4
+
+
+def test_richest_and_most_indebted_match_a_sorted_list():
+    operations = random.Random(1)
+    leaderboard = Leaderboard()
+    net_worths: dict[int, int] = {}
+    for _ in range(2_000):
+        operation = operations.random()
+        if operation < 0.4 or not net_worths:
+            net_worth = operations.randint(-50, 50)
+            net_worths[leaderboard.add_player(net_worth)] = net_worth
+        elif operation < 0.8:
+            player_id = operations.choice(list(net_worths))
+            net_worths[player_id] = operations.randint(-50, 50)
+            leaderboard.update(player_id, net_worths[player_id])
+        else:
+            player_id = operations.choice(list(net_worths))
+            del net_worths[player_id]
+            leaderboard.remove_player(player_id)
+
+        ranked = sorted(((net_worth, player_id) for player_id, net_worth in net_worths.items()), reverse=True)
+        k = operations.randint(0, 10)
+        assert leaderboard.get_richest(k) == [(player_id, net_worth) for net_worth, player_id in ranked[:k]]
+        assert leaderboard.get_most_indebted(k) == [(player_id, net_worth)
+                                                    for net_worth, player_id in reversed(ranked[-k:] if k else [])]
+        for player_id in operations.sample(list(net_worths), min(3, len(net_worths))):
+            assert leaderboard.get_rank(player_id) == 1 + sum(net_worth > net_worths[player_id]
+                                                              for net_worth in net_worths.values())
+
+
+def test_main_menu_shows_the_rank_only_among_other_players():
+    leaderboard = Leaderboard()
+    player_data = PlayerData(leaderboard)
+    assert player_data.get_leaderboard_rank() == (1, 1)
+    assert 'Rank:' not in str(MainMenu(player_data))
+
+    other_player_data = PlayerData(leaderboard)
+    other_player_data.add_player_coins(500)
+    assert 'Rank: #2 of 2' in str(MainMenu(player_data))
+    other_player_data.leave_leaderboard()
+    assert 'Rank:' not in str(MainMenu(player_data))
+
+
+def _join_leaderboard(path: str) -> None:
+    """Adds a player to the SharedLeaderboard at path and ends the process without removing them."""
+    SharedLeaderboard(path).add_player(1_000_000)
+
+
+def test_shared_leaderboards_on_one_file_rank_players_together(tmp_path):
+    path = str(tmp_path / 'leaderboard.bin')
+    first_leaderboard = SharedLeaderboard(path, capacity=3)
+    second_leaderboard = SharedLeaderboard(path, capacity=3)
+    richest = first_leaderboard.add_player(2_000)
+    poorest = second_leaderboard.add_player(-500)
+    middle = second_leaderboard.add_player(1_000)
+    with pytest.raises(LeaderboardFullException):
+        first_leaderboard.add_player(0)
+
+    assert first_leaderboard.get_player_count() == second_leaderboard.get_player_count() == 3
+    assert [first_leaderboard.get_rank(player_id) for player_id in (richest, middle, poorest)] == [1, 2, 3]
+    assert second_leaderboard.get_richest(2) == [(richest, 2_000), (middle, 1_000)]
+    assert first_leaderboard.get_most_indebted(1) == [(poorest, -500)]
+
+    second_leaderboard.update(poorest, 3_000)
+    assert first_leaderboard.get_rank(poorest) == 1
+    first_leaderboard.remove_player(richest)
+    assert second_leaderboard.get_player_count() == 2
+    first_leaderboard.close()
+    second_leaderboard.close()
+
+
+def test_shared_leaderboard_frees_the_slots_of_ended_processes(tmp_path):
+    path = str(tmp_path / 'leaderboard.bin')
+    process = multiprocessing.get_context('spawn').Process(target=_join_leaderboard, args=(path,))
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+    leaderboard = SharedLeaderboard(path, capacity=1)
+    player_id = leaderboard.add_player(0)
+    assert leaderboard.get_rank(player_id) == 1
+    assert leaderboard.get_player_count() == 1
+    leaderboard.close()
+
+
+def test_main_menu_shows_the_rank_among_players_of_other_games(tmp_path):
+    path = str(tmp_path / 'leaderboard.bin')
+    leaderboard = SharedLeaderboard(path)
+    other_game_leaderboard = SharedLeaderboard(path)
+    player_data = PlayerData(leaderboard)
+    assert 'Rank:' not in str(MainMenu(player_data))
+
+    other_player_data = PlayerData(other_game_leaderboard)
+    other_player_data.add_player_coins(500)
+    assert 'Rank: #2 of 2' in str(MainMenu(player_data))
+    other_player_data.leave_leaderboard()
+    assert 'Rank:' not in str(MainMenu(player_data))
+    leaderboard.close()
+    other_game_leaderboard.close()
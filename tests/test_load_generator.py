@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.load_testing import load_generator
+from src.load_testing.latency_histogram import LatencyHistogram
+from src.load_testing.load_generator import LoadGenerator
+from src.load_testing.load_generator import LoadTestResult
+
+
+def test_percentiles_are_within_1_percent_of_the_recorded_latencies():
+    histogram = LatencyHistogram()
+    for microseconds in range(1, 1_001):
+        histogram.record(microseconds * 1e-6)
+    assert histogram.get_count() == 1_000
+    for percentile, latency in [(50, 500e-6), (99, 990e-6), (99.9, 999e-6), (100, 1_000e-6), (0, 1e-6)]:
+        assert histogram.get_percentile(percentile) == pytest.approx(latency, rel=0.01), percentile
+
+
+def test_merged_histograms_count_every_latency():
+    fast, slow = LatencyHistogram(), LatencyHistogram()
+    for _ in range(99):
+        fast.record(1e-5)
+    slow.record(1.0)
+    # Latencies outside the buckets are counted in the first and last bucket
+    slow.record(1e-9)
+    slow.record(1_000.0)
+    fast.merge(slow)
+    assert fast.get_count() == 102
+    assert fast.get_percentile(50) == pytest.approx(1e-5, rel=0.01)
+    assert fast.get_percentile(100) == pytest.approx(100.0, rel=0.01)
+    with pytest.raises(ValueError):
+        LatencyHistogram().get_percentile(50)
+
+
+def test_worker_reports_latencies_and_throughput_and_restores_stdout():
+    stdout = sys.stdout
+    histograms, inputs_per_second = load_generator._run_worker(0, 1, 1, 2, time.time(), 2.0, 1.0, 0, None)
+    assert sys.stdout is stdout
+    assert len(inputs_per_second) == 2 and all(inputs > 0 for inputs in inputs_per_second)
+    assert 'menu' in histograms
+    assert all(label in ('menu', 'store') or label.startswith('minigame:') for label in histograms)
+
+    result = LoadTestResult(histograms, inputs_per_second, 2, 1.0)
+    assert result.get_sustained_throughput() == inputs_per_second[1]
+    assert [result.get_active_sessions(second) for second in range(2)] == [2, 2]
+    assert result.get_latency_histogram('minigame').get_count() == sum(
+        histogram.get_count() for label, histogram in histograms.items() if label.startswith('minigame:'))
+    # Inputs of the pass over the sessions that ends after the load test are timed but not counted in any second
+    assert 0 <= sum(histogram.get_count() for histogram in histograms.values()) - sum(inputs_per_second) <= 2
+    report = str(result)
+    assert report.startswith(f'Sustained throughput: {inputs_per_second[1]:,} inputs/s')
+    assert f'|{"menu":<20}|{histograms["menu"].get_count():>12,}|' in report
+    assert f'|{1:>8}|{2:>10,}|{inputs_per_second[1]:>12,}|' in report
+
+
+def test_worker_without_sessions_returns_at_once():
+    start_time = time.time()
+    histograms, inputs_per_second = load_generator._run_worker(0, 1, 1, 0, start_time, 30.0, 10.0, 0, None)
+    assert time.time() - start_time < 10.0
+    assert histograms == {} and inputs_per_second == [0] * 30
+
+
+@pytest.mark.parametrize('option', ['--processes', '--threads', '--sessions'])
+def test_command_line_rejects_no_sessions(option):
+    command = subprocess.run([sys.executable, '-m', 'src.load_testing.load_generator', option, '0'],
+                             capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+    assert command.returncode == 2
+    assert f'{option} must be at least 1' in command.stderr
+
+
+def test_active_sessions_ramp_up_evenly():
+    result = LoadTestResult({}, [0] * 5, 8, 4.0)
+    assert [result.get_active_sessions(second) for second in range(5)] == [2, 4, 6, 8, 8]
+    assert result.get_sustained_throughput() == 0
+
+
+def test_load_generator_runs_a_process_pool():
+    result = LoadGenerator(processes=1, threads_per_process=1, sessions_per_thread=1, duration=1.0, ramp_up=0.0).run()
+    assert result.get_sustained_throughput() > 0
+    assert result.get_latency_histogram('menu').get_count() > 0
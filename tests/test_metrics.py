@@ -0,0 +1,88 @@
+import contextlib
+import io
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.gambling_simulator import GamblingSimulator
+from src.leaderboard.leaderboard import Leaderboard
+from src.metrics.counter import Counter
+from src.metrics.game_metrics import GameMetrics
+from src.metrics.gauge import Gauge
+from src.metrics.histogram import Histogram
+from src.metrics.metrics_registry import CONTENT_TYPE
+from src.metrics.metrics_registry import MetricsRegistry
+
+
+def test_registry_renders_text_exposition_format():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter('test_items_total', "Items with a \\ and a\nnewline.", ('item',)))
+    histogram = registry.register(Histogram('test_latency_seconds', "Latency.", ('state',), buckets=(0.5, 0.1)))
+    registry.register(Gauge('test_sessions', "Sessions.")).inc(3)
+    counter.labels('say "hi"\\\n').inc(2)
+    latency = histogram.labels('menu')
+    for value in (0.05, 0.1, 0.3, 2.0):
+        latency.observe(value)
+
+    assert registry.render() == str.join('\n', [
+        '# HELP test_items_total Items with a \\\\ and a\\nnewline.',
+        '# TYPE test_items_total counter',
+        'test_items_total{item="say \\"hi\\"\\\\\\n"} 2',
+        '# HELP test_latency_seconds Latency.',
+        '# TYPE test_latency_seconds histogram',
+        'test_latency_seconds_bucket{state="menu",le="0.1"} 2',
+        'test_latency_seconds_bucket{state="menu",le="0.5"} 3',
+        'test_latency_seconds_bucket{state="menu",le="+Inf"} 4',
+        'test_latency_seconds_sum{state="menu"} 2.45',
+        'test_latency_seconds_count{state="menu"} 4',
+        '# HELP test_sessions Sessions.',
+        '# TYPE test_sessions gauge',
+        'test_sessions 3',
+    ]) + '\n'
+
+
+def test_http_server_serves_the_registry_at_metrics_only():
+    registry = MetricsRegistry()
+    registry.register(Gauge('test_sessions', "Sessions.")).inc(3)
+    server = registry.start_http_server(0)
+    base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    try:
+        with urllib.request.urlopen(base_url + '/metrics?name[]=test_sessions') as response:
+            assert response.status == 200
+            assert response.headers['Content-Type'] == CONTENT_TYPE
+            assert 'test_sessions 3\n' in response.read().decode('utf-8').splitlines(keepends=True)
+        with pytest.raises(urllib.error.HTTPError) as not_found:
+            urllib.request.urlopen(base_url + '/other')
+        assert not_found.value.code == 404
+        not_found.value.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _get_active_sessions(metrics: GameMetrics) -> dict[str, int]:
+    return {state: metrics.active_sessions.labels(state).get_value() for state in ('menu', 'minigame', 'store')}
+
+
+def test_active_sessions_are_decremented_however_a_session_ends():
+    metrics = GameMetrics()
+    leaderboard = Leaderboard()
+    with contextlib.redirect_stdout(io.StringIO()):
+        quitting = GamblingSimulator(metrics=metrics, leaderboard=leaderboard)
+        abandoned = GamblingSimulator(metrics=metrics, leaderboard=leaderboard)
+        storing = GamblingSimulator(metrics=metrics, leaderboard=leaderboard)
+        for simulator in (quitting, abandoned, storing):
+            simulator.current_abstract_program.execute_program()
+        abandoned.process_user_input('roulette')
+        storing.process_user_input('store')
+        assert _get_active_sessions(metrics) == {'menu': 1, 'minigame': 1, 'store': 1}
+        assert leaderboard.get_player_count() == 3
+
+        assert quitting.process_user_input('quit')
+        # Sessions that end without quitting, i.e. at the end of input, are closed by their caller
+        abandoned.close()
+        storing.close()
+        storing.close()
+    assert _get_active_sessions(metrics) == {'menu': 0, 'minigame': 0, 'store': 0}
+    assert leaderboard.get_player_count() == 0
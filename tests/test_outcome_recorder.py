@@ -0,0 +1,64 @@
+import pytest
+
+from src.analytics.outcome_dataset import OutcomeDataset
+from src.analytics.outcome_recorder import OutcomeRecorder
+
+
+def test_out_of_range_row_leaves_dataset_consistent(tmp_path):
+    recorder = OutcomeRecorder(str(tmp_path))
+    recorder.record(1, 'blackjack', 10, 20, player_score=21, dealer_score=18)
+    with pytest.raises(OverflowError):
+        recorder.record(1, 'blackjack', 10, 0, player_score=21, dealer_score=1_000)
+    with pytest.raises(OverflowError):
+        recorder.record_rounds(1, 'roulette', 10, [0, 20], wheel_results=[5, 1_000])
+    # Reel stops past 127 fit their columns
+    recorder.record(1, 'slots', 10, 5, reels=(200, 300, 20))
+    recorder.close()
+
+    dataset = OutcomeDataset(str(tmp_path))
+    assert dataset.get_row_count() == 2
+    assert list(dataset.get_column('payout', 0)) == [20, 5]
+    assert list(dataset.get_column('dealer_score', 0)) == [18, -1]
+    assert list(dataset.get_column('wheel_result', 0)) == [-1, -1]
+    assert list(dataset.get_column('reel2', 0)) == [-1, 300]
+    dataset.close()
+
+
+def test_rejected_rounds_append_nothing(tmp_path):
+    recorder = OutcomeRecorder(str(tmp_path), chunk_rows=4)
+    recorder.record(1, 'roulette', 10, 20, wheel_result=3)
+    with pytest.raises(ValueError):
+        recorder.record(1, 'poker', 10, 20)
+    with pytest.raises(ValueError):
+        recorder.record_rounds(1, 'poker', 10, [0, 20])
+    # The out-of-range value comes after several rounds that would have filled a chunk
+    with pytest.raises(OverflowError):
+        recorder.record_rounds(1, 'blackjack', 10, [0, 20, 0, 20, 0], dealer_scores=[17, 18, 19, 20, 1_000])
+    with pytest.raises(OverflowError):
+        recorder.record(1, 'slots', 10, 5, reels=(1, 2, 40_000))
+    recorder.record(1, 'slots', 10, 5, reels=(1, 2, 3))
+    recorder.close()
+
+    dataset = OutcomeDataset(str(tmp_path))
+    assert dataset.get_chunk_count() == 1
+    assert list(dataset.get_column('game', 0)) == [1, 2]
+    assert list(dataset.get_column('payout', 0)) == [20, 5]
+    dataset.close()
+
+
+def test_record_rounds_splits_batches_at_chunk_boundaries(tmp_path):
+    recorder = OutcomeRecorder(str(tmp_path), chunk_rows=3)
+    recorder.record(1, 'slots', 10, 0, reels=(0, 1, 2))
+    recorder.record_rounds(2, 'roulette', 5, list(range(7)), wheel_results=list(range(10, 17)))
+    recorder.record_rounds(3, 'roulette', 5, [7])
+    recorder.close()
+
+    dataset = OutcomeDataset(str(tmp_path))
+    assert dataset.get_row_count() == 9
+    assert [len(dataset.get_column('payout', chunk)) for chunk in range(dataset.get_chunk_count())] == [3, 3, 3]
+    assert [value for column in dataset.iter_column('payout') for value in column] == [0, *range(7), 7]
+    assert [value for column in dataset.iter_column('session_id') for value in column] == [1] + [2] * 7 + [3]
+    assert [value for column in dataset.iter_column('wheel_result') for value in column] == \
+        [-1, *range(10, 17), -1]
+    assert [value for column in dataset.iter_column('reel3') for value in column] == [2] + [-1] * 8
+    dataset.close()
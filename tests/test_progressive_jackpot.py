@@ -0,0 +1,88 @@
+import multiprocessing
+import os
+
+import pytest
+
+from src.managers.progressive_jackpot import DEFAULT_CHECKPOINT_PATH
+from src.managers.progressive_jackpot import ProgressiveJackpot
+
+PROCESSES = 4
+CONTRIBUTIONS_PER_PROCESS = 500
+
+
+def _contribute(checkpoint_path: str, bet: int, bets: int) -> None:
+    jackpot = ProgressiveJackpot(checkpoint_path)
+    for _ in range(CONTRIBUTIONS_PER_PROCESS):
+        jackpot.contribute(bet, bets=bets)
+    jackpot.close()
+
+
+def test_concurrent_contributions_from_several_processes_sum_exactly(tmp_path):
+    checkpoint_path = str(tmp_path / 'jackpot.bin')
+    # Every process opens the file itself, so they also race to create and seed it
+    processes = [multiprocessing.Process(target=_contribute, args=(checkpoint_path, 30, 3)) for _ in range(PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert all(process.exitcode == 0 for process in processes)
+
+    jackpot = ProgressiveJackpot(checkpoint_path)
+    # Each contribution is 1% of 3 bets of 30 coins, 0.9 coins
+    assert jackpot.get_pool() == 1_000 + int(PROCESSES * CONTRIBUTIONS_PER_PROCESS * 0.9)
+    jackpot.close()
+
+
+def test_claim_pays_the_pool_out_once_and_reseeds_it(tmp_path):
+    checkpoint_path = str(tmp_path / 'jackpot.bin')
+    jackpot = ProgressiveJackpot(checkpoint_path, seed_coins=500)
+    other_session = ProgressiveJackpot(checkpoint_path, seed_coins=500)
+    jackpot.contribute(150)
+    other_session.contribute(150, bets=2)
+    assert other_session.get_pool() == 504
+    assert jackpot.claim() == 504
+    # The fraction of a coin left over stays in the pool
+    assert jackpot.get_pool() == other_session.get_pool() == 500
+    other_session.contribute(50)
+    assert other_session.claim() == 501
+    assert jackpot.get_pool() == 500
+    jackpot.close()
+    other_session.close()
+
+
+def test_pool_persists_across_checkpoint_close_and_reopening(tmp_path):
+    checkpoint_path = str(tmp_path / 'jackpot.bin')
+    jackpot = ProgressiveJackpot(checkpoint_path)
+    jackpot.contribute(1_000, bets=5)
+    jackpot.checkpoint()
+    with open(checkpoint_path, 'rb') as checkpoint:
+        assert checkpoint.read() == (1_050_000).to_bytes(8, 'little')
+    jackpot.contribute(100)
+    jackpot.close()
+
+    # The seed only applies to a new file
+    reopened = ProgressiveJackpot(checkpoint_path, seed_coins=0)
+    assert reopened.get_pool() == 1_051
+    reopened.claim()
+    reopened.close()
+    claimed = ProgressiveJackpot(checkpoint_path)
+    assert claimed.get_pool() == 0
+    claimed.close()
+
+
+def test_sessions_started_from_anywhere_share_the_default_jackpot(tmp_path, monkeypatch):
+    assert os.path.isabs(DEFAULT_CHECKPOINT_PATH)
+    checkpoint_path = str(tmp_path / 'data' / 'jackpot.bin')
+    jackpot = ProgressiveJackpot(checkpoint_path)
+    jackpot.contribute(100)
+    monkeypatch.chdir(tmp_path / 'data')
+    other_session = ProgressiveJackpot(checkpoint_path)
+    assert other_session.get_pool() == 1_001
+    other_session.close()
+    jackpot.close()
+
+
+@pytest.mark.parametrize('arguments', [{'contribution_rate': 1.5}, {'contribution_rate': -0.1}, {'seed_coins': -1}])
+def test_invalid_jackpots_are_rejected(tmp_path, arguments):
+    with pytest.raises(ValueError):
+        ProgressiveJackpot(str(tmp_path / 'jackpot.bin'), **arguments)
@@ -0,0 +1,67 @@
+import contextlib
+import io
+
+import pytest
+
+from src.exceptions.unrecorded_draw_exception import UnrecordedDrawException
+from src.recording.recording_random import RecordingRandom
+from src.recording.session_event_type import SessionEventType
+from src.recording.session_log import SessionLog
+from src.recording.session_recorder import SessionRecorder
+from src.recording.session_replayer import SessionReplayer
+
+SCRIPTED_INPUTS = [
+    'slots', '10', '10', 'autoplay 50', 'stop',
+    'roulette', '20', 'color', 'red', 'roulette', 'autoplay 30',
+    'blackjack', '15', 'stand', 'blackjack', 'autoplay 40',
+    'quit',
+]
+
+
+def _record_scripted_session(seed: int) -> SessionLog:
+    recorder = SessionRecorder(seed=seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        finished = recorder.get_simulator().current_abstract_program.execute_program()
+        for user_input in SCRIPTED_INPUTS:
+            if finished:
+                break
+            finished = recorder.process_user_input(user_input)
+    return recorder.get_session_log()
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_scripted_session_replays_exactly(seed):
+    session_log = _record_scripted_session(seed)
+    event_types = {event[0] for event in session_log.get_events()}
+    assert {SessionEventType.CHOICE, SessionEventType.RANDINT, SessionEventType.STATE} <= event_types
+
+    assert SessionReplayer(session_log).find_first_divergence() is None
+    assert SessionReplayer(SessionLog.from_bytes(session_log.to_bytes())).find_first_divergence() is None
+
+
+def test_divergent_log_is_flagged():
+    events = _record_scripted_session(0).get_events()
+    state_index = next(index for index, event in enumerate(events)
+                       if event[0] == SessionEventType.STATE and event[2] != events[-1][2])
+    tampered_events = list(events)
+    tampered_events[state_index] = (SessionEventType.STATE, events[state_index][1], events[state_index][2] + 1)
+
+    divergence = SessionReplayer(SessionLog(tampered_events)).find_first_divergence()
+    assert divergence == (state_index, tampered_events[state_index], events[state_index])
+
+
+@pytest.mark.parametrize('draw', [
+    lambda generator: generator.random(),
+    lambda generator: generator.getrandbits(8),
+    lambda generator: generator.randrange(10),
+    lambda generator: generator.shuffle([1, 2, 3]),
+    lambda generator: generator.sample(range(10), 3),
+    lambda generator: generator.choices(range(10), k=3),
+    lambda generator: generator.uniform(0, 1),
+    lambda generator: generator.randbytes(4),
+])
+def test_unrecorded_draws_are_refused(draw):
+    session_log = SessionLog()
+    with pytest.raises(UnrecordedDrawException):
+        draw(RecordingRandom(session_log, 0))
+    assert len(session_log) == 0
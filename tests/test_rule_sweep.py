@@ -0,0 +1,89 @@
+import collections
+import contextlib
+import io
+import random
+
+import pytest
+
+from src.bots import rule_sweep
+from src.bots.rule_sweep import RuleSweep
+from src.game_state.game_state import GameState
+from src.gambling_simulator import GamblingSimulator
+from src.programs.minigames.blackjack_rules import BlackjackRules
+
+
+def _run_sweep(cache_directory: str, rules: BlackjackRules = BlackjackRules(), hands: int = 200, seed: int = 0,
+               hands_per_task: int = 100) -> tuple[bool, float]:
+    result = RuleSweep([rules], hands, seed, workers=1, hands_per_task=hands_per_task,
+                       cache_directory=cache_directory).run()[0]
+    return result.cached, result.house_edge
+
+
+def test_identical_sweeps_hit_the_cache_and_any_change_misses(tmp_path, monkeypatch):
+    cache_directory = str(tmp_path)
+    cached, house_edge = _run_sweep(cache_directory)
+    assert not cached
+    assert _run_sweep(cache_directory) == (True, house_edge)
+
+    # Other rules, hands, seed or chunking are measured afresh, then cached alongside
+    for changes in [{'rules': BlackjackRules(decks=2)}, {'hands': 300}, {'seed': 1}, {'hands_per_task': 50}]:
+        assert not _run_sweep(cache_directory, **changes)[0], changes
+        assert _run_sweep(cache_directory, **changes)[0], changes
+    assert _run_sweep(cache_directory) == (True, house_edge)
+
+    monkeypatch.setattr(rule_sweep, '_CACHE_VERSION', rule_sweep._CACHE_VERSION + 1)
+    cached, new_house_edge = _run_sweep(cache_directory)
+    assert not cached
+    assert new_house_edge == pytest.approx(house_edge)
+
+
+def test_unreadable_cache_entry_is_measured_again(tmp_path):
+    _run_sweep(str(tmp_path))
+    for cache_path in tmp_path.iterdir():
+        cache_path.write_text('{"hands": ')
+    assert not _run_sweep(str(tmp_path))[0]
+
+
+def test_cache_entries_are_written_through_temporary_files_of_their_own(tmp_path, monkeypatch):
+    _run_sweep(str(tmp_path))
+    assert [cache_path.suffix for cache_path in tmp_path.iterdir()] == ['.json']
+
+    def fail_to_dump(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(rule_sweep.json, 'dump', fail_to_dump)
+    with pytest.raises(OSError):
+        _run_sweep(str(tmp_path), seed=1)
+    assert [cache_path.suffix for cache_path in tmp_path.iterdir()] == ['.json']
+
+
+def test_blackjack_hands_of_a_session_share_a_finite_shoe():
+    simulator = GamblingSimulator(random.Random(5), blackjack_rules=BlackjackRules(decks=1))
+    shoe = simulator.blackjack_shoe
+    dealt = []
+    draw = shoe.draw
+
+    def record_draw():
+        dealt.append(draw())
+        return dealt[-1]
+
+    shoe.draw = record_draw
+    autoplay_dealt = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulator.current_abstract_program.execute_program()
+        # A single deck is only refilled between hands, once three quarters of it have been dealt
+        while len(dealt) < 40:
+            simulator.process_user_input('blackjack')
+            simulator.process_user_input('10')
+            if simulator.game_state is GameState.MINIGAME:
+                simulator.process_user_input('stand')
+            # Autoplay repeats the bet of 10 coins on hands dealt from the same shoe
+            interactive_dealt = len(dealt)
+            simulator.process_user_input('blackjack')
+            simulator.process_user_input('autoplay 2')
+            autoplay_dealt += len(dealt) - interactive_dealt
+    assert simulator.game_state is GameState.MENU
+    assert autoplay_dealt >= 8
+    assert simulator.blackjack_shoe is shoe
+    # The first 40 cards came from the one deck, which holds four of each card
+    assert max(collections.Counter(dealt[:40]).values()) <= 4
@@ -0,0 +1,7 @@
+from src.load_testing.session_memory import DEFAULT_BUDGETS
+from src.load_testing.session_memory import check_budgets
+
+
+def test_sessions_stay_within_memory_budgets():
+    over_budget = check_budgets(DEFAULT_BUDGETS)
+    assert over_budget == [], str.join('\n\n', (str(report) for report in over_budget))
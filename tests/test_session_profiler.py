@@ -0,0 +1,153 @@
+import contextlib
+import io
+import os
+import pstats
+import random
+import re
+import signal
+import subprocess
+import sys
+import time
+from typing import Any
+from typing import Callable
+from typing import IO
+
+import pytest
+
+from src.gambling_simulator import GamblingSimulator
+from src.profiling.session_profiler import SessionProfiler
+
+REPOSITORY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _spin_before_start() -> None:
+    _spin()
+
+
+def _spin_while_started() -> None:
+    _spin()
+
+
+def _spin_after_stop() -> None:
+    _spin()
+
+
+def _spin(seconds: float = 0.1) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _get_profiled_functions(trace_path: str) -> set[str]:
+    return {function for _, _, function in pstats.Stats(trace_path).stats}
+
+
+def test_run_profiles_only_while_started(tmp_path):
+    profiler = SessionProfiler(sample_interval=0.001)
+    profiler.run('Before', _spin_before_start)
+    profiler.start()
+    assert profiler.is_running()
+    profiler.run('While', _spin_while_started)
+    profiler.stop()
+    assert not profiler.is_running()
+    stacks = profiler.get_collapsed_stacks()
+    profiler.run('After', _spin_after_stop)
+
+    assert stacks and profiler.get_collapsed_stacks() == stacks
+    assert {line.split(';')[0] for line in stacks} == {'While'}
+    profiled_functions = _get_profiled_functions(profiler.write(str(tmp_path / 'profile'))[0])
+    assert '_spin_while_started' in profiled_functions
+    assert not {'_spin_before_start', '_spin_after_stop'} & profiled_functions
+
+
+def test_collapsed_stacks_are_rooted_at_the_label():
+    profiler = SessionProfiler(sample_interval=0.001)
+    profiler.start()
+    profiler.run('MainMenu', _spin_while_started)
+    profiler.stop()
+    stacks = profiler.get_collapsed_stacks()
+    assert stacks
+    for line in stacks:
+        assert re.fullmatch(r'MainMenu(;[\w.]+:[\w.<>]+)+ [1-9]\d*', line), line
+        # The first frame is the function passed to run, the last the one sampled
+        frames = line.rsplit(' ', 1)[0].split(';')
+        assert frames[1].endswith(':_spin_while_started'), line
+    assert any(line.rsplit(' ', 1)[0].endswith(':_spin') for line in stacks)
+
+
+def test_write_produces_a_loadable_trace_and_collapsed_stacks(tmp_path):
+    profiler = SessionProfiler(sample_interval=0.001)
+    profiler.start()
+    profiler.run('MainMenu', _spin_while_started)
+    profiler.stop()
+    trace_path, stacks_path = profiler.write(str(tmp_path / 'session'))
+    assert (trace_path, stacks_path) == (str(tmp_path / 'session.prof'), str(tmp_path / 'session.collapsed'))
+    assert {'_spin_while_started', '_spin'} <= _get_profiled_functions(trace_path)
+    with open(stacks_path, encoding='utf-8') as stacks_file:
+        assert stacks_file.read().splitlines() == profiler.get_collapsed_stacks()
+
+
+class _CountingProfiler(SessionProfiler):
+    """A SessionProfiler that remembers the label of every call it profiled."""
+
+    def __init__(self):
+        super().__init__()
+        self.labels: list[str] = []
+
+    def run(self, label: str, function: Callable[..., Any], *args: Any) -> Any:
+        self.labels.append(label)
+        return super().run(label, function, *args)
+
+
+def test_profiling_switches_for_one_session_only():
+    profiled, unprofiled = GamblingSimulator(random.Random(0)), GamblingSimulator(random.Random(0))
+    profiler = _CountingProfiler()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for simulator in (profiled, unprofiled):
+            simulator.current_abstract_program.execute_program()
+        assert profiled.start_profiling(profiler) is profiler
+        assert profiler.is_running() and unprofiled.profiler is None
+        for user_input in ('store', 'exit'):
+            profiled.process_user_input(user_input)
+            unprofiled.process_user_input(user_input)
+        assert profiled.stop_profiling() is profiler
+        profiled.process_user_input('store')
+    assert profiler.labels == ['MainMenu', 'Store']
+    assert not profiler.is_running()
+    assert profiled.profiler is None and profiled.stop_profiling() is None
+
+
+def _read_until(stream: IO[str], text: str) -> None:
+    for line in stream:
+        if text in line:
+            return
+    pytest.fail(f"The game ended before printing {text!r}.")
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason="SIGUSR1 does not exist on Windows")
+def test_sigusr1_switches_profiling_of_the_game_on_and_off(tmp_path):
+    game = subprocess.Popen([sys.executable, '-u', '-m', 'src.main', '--jackpot', str(tmp_path / 'jackpot.bin'),
+                             '--leaderboard', str(tmp_path / 'leaderboard.bin')],
+                            cwd=tmp_path, text=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            env={**os.environ, 'PYTHONPATH': REPOSITORY_PATH})
+    try:
+        # The signal handler is installed before the main menu is printed
+        _read_until(game.stdout, 'Coin total')
+        game.send_signal(signal.SIGUSR1)
+        game.stdin.write('store\n')
+        game.stdin.flush()
+        _read_until(game.stdout, 'Profiling started.')
+        game.send_signal(signal.SIGUSR1)
+        game.stdin.write('exit\n')
+        game.stdin.flush()
+        _read_until(game.stdout, 'Profile written to')
+        game.stdin.write('quit\n')
+        game.stdin.close()
+        assert game.wait(timeout=30) == 0
+    finally:
+        game.kill()
+        game.stdout.close()
+
+    prefix = str(tmp_path / f'session-profile-{game.pid}')
+    assert pstats.Stats(prefix + '.prof').total_calls > 0
+    assert os.path.exists(prefix + '.collapsed')
@@ -0,0 +1,52 @@
+import itertools
+
+import pytest
+
+from src.advisor.slot_machine_optimizer import SlotMachineOptimizer
+from src.programs.minigames.slot_machine import DEFAULT_MACHINE_DEFINITION
+from src.programs.minigames.slot_machine import SlotMachine
+
+# The 21 reel stops of the slots minigame before machines were defined as data, and its paytable, which chose a
+# multiplier by the stop a symbol first matched on rather than by the symbol
+OLD_STOPS = ['7', 'cherries', 'cherries', 'lemon', 'lemon', 'watermelon', 'watermelon', 'banana', 'banana', 'gem',
+             'gem', 'bell', 'bell', 'BAR', 'BAR', 'skull', 'skull', 'skull', 'skull', 'skull', 'skull']
+OLD_MULTIPLIERS = {range(1, 9): (1.5, 2), range(9, 15): (1.75, 2.5), range(15, 21): (1.5, 0), range(0, 1): (1.5, 10)}
+
+
+def _get_old_multiplier(stop1: int, stop2: int, stop3: int) -> float:
+    value, count = None, 0
+    if OLD_STOPS[stop1] == OLD_STOPS[stop2] or OLD_STOPS[stop1] == OLD_STOPS[stop3]:
+        value, count = stop1, count + 1
+    if OLD_STOPS[stop2] == OLD_STOPS[stop3]:
+        value, count = stop2, count + 1
+    if value is None:
+        return 0.5
+    return next(multipliers[count - 1] for stops, multipliers in OLD_MULTIPLIERS.items() if value in stops)
+
+
+def test_default_machine_pays_as_the_old_hard_coded_slots():
+    multipliers = [_get_old_multiplier(*stops) for stops in itertools.product(range(len(OLD_STOPS)), repeat=3)]
+    machine = SlotMachine(DEFAULT_MACHINE_DEFINITION)
+    assert machine.get_return_to_player() == pytest.approx(sum(multipliers) / len(multipliers))
+    assert machine.get_hit_frequency() == pytest.approx(sum(multiplier > 1 for multiplier in multipliers)
+                                                        / len(multipliers))
+    for stops in itertools.product(range(len(OLD_STOPS)), repeat=3):
+        assert machine.get_line_multiplier(machine.get_line(*stops)) == _get_old_multiplier(*stops), stops
+
+
+def _get_orders(definition: dict) -> dict[str, int]:
+    return {category: (lines['triple'][0] > lines['pair'][0]) - (lines['triple'][0] < lines['pair'][0])
+            for category, lines in definition['paytable'].items()}
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_tuning_keeps_the_order_of_every_pair_and_triple(seed):
+    definition = SlotMachine(DEFAULT_MACHINE_DEFINITION).get_definition()
+    # A pair and triple one step apart, which a single move could tie
+    definition['paytable']['fruit']['triple'][0] = 1.75
+    # A tie, which may move either way
+    definition['paytable']['luck']['triple'][0] = 1.75
+    tuning = SlotMachineOptimizer(definition, 0.97, 0.1, seed=seed, iterations=3_000, tune_weights=False).optimize()
+    orders = _get_orders(tuning.machine.get_definition())
+    assert {category: order for category, order in orders.items() if category != 'luck'} == \
+        {category: order for category, order in _get_orders(definition).items() if category != 'luck'}
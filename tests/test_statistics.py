@@ -0,0 +1,14 @@
+import math
+import statistics
+
+import pytest
+
+from src.bots.statistics import get_mean_and_standard_error
+
+
+def test_mean_and_standard_error_match_those_of_the_values():
+    values = [3, -1, 4, 1, -5, 9, 2, -6]
+    mean, standard_error = get_mean_and_standard_error(len(values), sum(values), sum(value * value for value in values))
+    assert mean == pytest.approx(statistics.mean(values))
+    assert standard_error == pytest.approx(statistics.stdev(values) / math.sqrt(len(values)))
+    assert get_mean_and_standard_error(1, 7, 49) == (7.0, 0.0)
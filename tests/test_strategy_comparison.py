@@ -0,0 +1,14 @@
+import pytest
+
+from src.bots.strategies.flat_strategy import FlatStrategy
+from src.bots.strategies.martingale_strategy import MartingaleStrategy
+from src.bots.strategy_comparison import StrategyComparison
+
+
+@pytest.mark.parametrize('game', ['blackjack', 'slots', 'roulette'])
+def test_paired_difference_has_lower_variance_than_independent_runs(game):
+    result = StrategyComparison(FlatStrategy(10), MartingaleStrategy(10), game, sessions=200, rounds_per_session=20,
+                                seed=7, workers=2, sessions_per_task=100).run()
+    assert result.pairs == 200
+    assert result.mean_difference == pytest.approx(result.mean_a - result.mean_b)
+    assert 0 < result.standard_error < result.independent_standard_error
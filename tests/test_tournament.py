@@ -0,0 +1,92 @@
+import contextlib
+import io
+import random
+
+import pytest
+
+from src.bots.strategies.flat_strategy import FlatStrategy
+from src.bots.strategies.kelly_strategy import KellyStrategy
+from src.bots.strategies.martingale_strategy import MartingaleStrategy
+from src.bots.strategy_bot import GAMES
+from src.bots.strategy_bot import StrategyBot
+from src.bots.tournament import Tournament
+from src.bots.visible_state import VisibleState
+from src.programs.minigames.blackjack_rules import DEALER_STAND_SCORE
+
+STRATEGIES = {'Flat 10': FlatStrategy(10), 'Martingale 10': MartingaleStrategy(10), 'Kelly 2%': KellyStrategy(0.02)}
+
+
+def _run_tournament(workers: int, seed: int = 3):
+    return Tournament(STRATEGIES, sessions=6, rounds_per_session=10, seed=seed, workers=workers,
+                      sessions_per_task=4).run()
+
+
+def _get_entries(result) -> list[tuple]:
+    return [(entry.strategy_name, entry.game, entry.sessions, entry.rounds, entry.busts, entry.mean_net,
+             entry.confidence_interval) for game in GAMES for entry in result.get_leaderboard(game)]
+
+
+def test_seeded_tournament_is_deterministic_whatever_the_number_of_workers():
+    result = _run_tournament(workers=1)
+    assert _get_entries(result) == _get_entries(_run_tournament(workers=3))
+    assert str(result) == str(_run_tournament(workers=1))
+    assert _get_entries(result) != _get_entries(_run_tournament(workers=1, seed=4))
+
+
+def test_leaderboards_are_ranked_with_confidence_intervals():
+    result = _run_tournament(workers=2)
+    for game in GAMES:
+        leaderboard = result.get_leaderboard(game)
+        assert {entry.strategy_name for entry in leaderboard} == set(STRATEGIES)
+        assert [entry.mean_net for entry in leaderboard] == sorted((entry.mean_net for entry in leaderboard),
+                                                                   reverse=True)
+        for entry in leaderboard:
+            assert entry.sessions == 6
+            assert 6 <= entry.rounds <= 60
+            low, high = entry.confidence_interval
+            assert low <= entry.mean_net <= high
+            assert high - low == pytest.approx(2 * (entry.mean_net - low))
+        assert any(entry.confidence_interval[0] < entry.confidence_interval[1] for entry in leaderboard)
+    assert str(result).splitlines()[0].strip() == 'BLACKJACK'
+
+
+class _RecordingStrategy(FlatStrategy):
+    """Bets 10 coins every round and remembers every blackjack score it was asked to act on."""
+
+    def __init__(self):
+        super().__init__(10)
+        self.scores: list[int] = []
+        self.nets: list[int] = []
+
+    def choose_action(self, state: VisibleState) -> str:
+        if state.game == 'blackjack':
+            self.scores.append(state.score)
+        return super().choose_action(state)
+
+    def observe_result(self, state: VisibleState, bet: int, net: int) -> None:
+        self.nets.append(net)
+
+
+@pytest.mark.parametrize('game', GAMES)
+def test_strategy_bot_plays_sessions_by_the_strategy(game):
+    strategy = _RecordingStrategy()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rounds, net = StrategyBot(strategy, game, random.Random(1)).play_session(1_000, 20)
+    assert rounds == len(strategy.nets) == 20
+    assert net == sum(strategy.nets)
+    assert all(-10 <= round_net for round_net in strategy.nets)
+    # Only blackjack asks for decisions, and never once a hand has reached 21
+    assert bool(strategy.scores) == (game == 'blackjack')
+    assert all(score < 21 for score in strategy.scores)
+
+
+def test_default_blackjack_decisions_stand_at_the_dealer_stand_score():
+    strategy = FlatStrategy(10)
+    assert strategy.choose_action(VisibleState('blackjack', 100, score=DEALER_STAND_SCORE - 1)) == 'hit'
+    assert strategy.choose_action(VisibleState('blackjack', 100, score=DEALER_STAND_SCORE)) == 'stand'
+    assert strategy.choose_action(VisibleState('roulette', 100)) == 'red'
+
+
+def test_strategy_bot_rejects_unknown_minigames():
+    with pytest.raises(ValueError):
+        StrategyBot(FlatStrategy(10), 'poker', random.Random(0))